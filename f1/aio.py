@@ -0,0 +1,149 @@
+"""
+asyncio counterparts of ``PacketListener`` and ``PacketHandler``.
+
+The listener receives datagrams with an ``asyncio.DatagramProtocol`` on the
+running event loop, without a thread, e.g. ::
+
+    async with AsyncPacketListener() as listener:
+        async for packet in listener:
+            ...
+"""
+
+import asyncio
+import typing as t
+
+from f1.handler import PacketHandler
+from f1.packets import resolve_type
+
+
+class _Protocol(asyncio.DatagramProtocol):
+    def __init__(self, listener: "AsyncPacketListener") -> None:
+        self.listener = listener
+
+    def datagram_received(self, data, addr):
+        self.listener._received(data)
+
+
+class AsyncPacketListener:
+    """Listen for telemetry packets on a UDP socket from an event loop.
+
+    Datagrams are queued as they are received and only decoded when they are
+    taken from the queue. The queue holds at most ``maxsize`` datagrams: when
+    the consumer falls behind, the oldest datagrams are dropped in favour of
+    the newest ones, and counted in ``dropped``.
+
+    If ``only`` is given, only packets with those ids are queued; any other
+    datagram is dropped after a peek at its header. The ``backend`` picks the
+    type packets are decoded with, as for ``resolve``.
+    """
+
+    def __init__(
+        self,
+        host: str = "",
+        port: int = 20777,
+        maxsize: int = 1024,
+        only: t.Optional[t.Container[int]] = None,
+        backend: t.Optional[t.Callable[[type], type]] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.maxsize = maxsize
+        self.only = only
+        self.backend = backend
+        self.dropped = 0
+        self.transport: t.Optional[asyncio.DatagramTransport] = None
+        self._queue: "t.Optional[asyncio.Queue[t.Tuple[type, bytes]]]" = None
+
+    async def start(self) -> None:
+        """Binds the socket on the running event loop"""
+        if self.transport is not None:
+            return
+
+        # Created here, as before Python 3.10 a queue is bound to the event loop
+        # current at creation
+        self._queue = asyncio.Queue(self.maxsize)
+
+        loop = asyncio.get_running_loop()
+        self.transport, _ = await loop.create_datagram_endpoint(
+            lambda: _Protocol(self), local_addr=(self.host, self.port)
+        )
+
+    def close(self) -> None:
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+
+    def getsockname(self):
+        return self.transport.get_extra_info("sockname")
+
+    def _received(self, data: bytes) -> None:
+        packet_type = resolve_type(data, self.only)
+        if packet_type is None:
+            return
+
+        if self.backend is not None:
+            packet_type = self.backend(packet_type)
+
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait((packet_type, data))
+
+    async def get(self):
+        """Waits for the next packet"""
+        await self.start()
+
+        packet_type, data = await self._queue.get()
+        return packet_type.unpack(data)
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.get()
+
+
+class AsyncPacketHandler(PacketHandler):
+    """A ``PacketHandler`` whose ``handle_generic`` and ``handle_<Name>``
+    methods are coroutines, awaited in turn for every packet of the listener.
+
+    Methods are looked up and subscriptions pushed down into the ``only`` of
+    the listener as for ``PacketHandler``.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._generic = cls.handle_generic is not AsyncPacketHandler.handle_generic
+
+    def __init__(self, listener: AsyncPacketListener):
+        super().__init__(listener)
+
+    async def handle_generic(self, packet):
+        pass
+
+    async def dispatch(self, packet) -> None:
+        """Awaits ``handle_generic`` and the ``handle_<Name>`` method of a
+        packet, if any."""
+        if self._generic:
+            await self.handle_generic(packet)
+
+        try:
+            method = self._dispatch[type(packet)]
+        except KeyError:
+            method = self._method(type(packet))
+        if method is not None:
+            await method(self, packet)
+
+    async def handle(self):
+        self.subscribe()
+
+        dispatch = self.dispatch
+        async for packet in self.listener:
+            await dispatch(packet)
@@ -0,0 +1,89 @@
+"""
+NumPy structured dtypes for packet types, and batch decoding of raw packets
+into structured arrays.
+
+This module requires NumPy, which can be installed with the ``numpy`` extra,
+e.g. ``pip install f1-packets[numpy]``.
+"""
+
+import ctypes
+import typing as t
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "f1.arrays requires NumPy; install it with 'pip install f1-packets[numpy]'"
+    ) from e
+
+from f1.packets import struct_code
+
+_DTYPES: t.Dict[type, "np.dtype"] = {}
+
+
+def _field_dtype(ctype) -> "np.dtype":
+    if issubclass(ctype, (ctypes.Structure, ctypes.Union)):
+        return dtype(ctype)
+
+    if issubclass(ctype, ctypes.Array):
+        element, length = ctype._type_, ctype._length_
+        if element is ctypes.c_char:
+            return np.dtype(f"S{length}")
+        return np.dtype((_field_dtype(element), (length,)))
+
+    code = struct_code(ctype)
+    return np.dtype("S1" if code == "c" else f"<{code}")
+
+
+def dtype(packet_type: type) -> "np.dtype":
+    """Returns the packed, little-endian structured dtype that mirrors the
+    given ``Packet`` type."""
+    try:
+        return _DTYPES[packet_type]
+    except KeyError:
+        pass
+
+    names, formats, offsets = [], [], []
+    for name, ctype in packet_type._fields_:
+        names.append(name)
+        formats.append(_field_dtype(ctype))
+        offsets.append(getattr(packet_type, name).offset)
+
+    _dtype = _DTYPES[packet_type] = np.dtype(
+        {
+            "names": names,
+            "formats": formats,
+            "offsets": offsets,
+            "itemsize": ctypes.sizeof(packet_type),
+        }
+    )
+
+    return _dtype
+
+
+def decode_batch(packet_type: type, buffers: t.Iterable[bytes]) -> "np.ndarray":
+    """Decodes raw packets of the same type into a structured array.
+
+    Args:
+        packet_type (type):
+            - The ``Packet`` type of all the packets
+        buffers (Iterable[bytes]):
+            - The raw packets
+
+    Returns:
+        A one-dimensional structured array with one record per packet.
+    """
+    _dtype = dtype(packet_type)
+    size = _dtype.itemsize
+
+    views = []
+    for buffer in buffers:
+        view = memoryview(buffer)
+        if view.nbytes < size:
+            raise ValueError(
+                f"Buffer size too small ({view.nbytes} instead of at least "
+                f"{size} bytes)"
+            )
+        views.append(view[:size])
+
+    return np.frombuffer(b"".join(views), dtype=_dtype)
@@ -0,0 +1,163 @@
+"""
+Batched datagram receive.
+
+``recv_batch`` waits for a first datagram and then drains whatever else is
+already queued on the socket, without blocking, so that a burst of datagrams
+is read in a single wakeup. ``MessageBuffers`` does the same into a fixed set
+of buffers, which on Linux lets it drain the queue with a single ``recvmmsg``
+system call.
+"""
+
+import ctypes
+import errno
+import os
+import socket
+import sys
+import typing as t
+
+# Not available on Windows, where the socket is made non-blocking instead
+MSG_DONTWAIT = getattr(socket, "MSG_DONTWAIT", 0)
+
+
+class _iovec(ctypes.Structure):
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t),
+    ]
+
+
+class _msghdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_iovec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _mmsghdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_hdr", _msghdr),
+        ("msg_len", ctypes.c_uint),
+    ]
+
+
+def _load_recvmmsg():
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        recvmmsg = ctypes.CDLL(None, use_errno=True).recvmmsg
+    except (AttributeError, OSError):
+        return None
+
+    recvmmsg.argtypes = [
+        ctypes.c_int,
+        ctypes.c_void_p,
+        ctypes.c_uint,
+        ctypes.c_int,
+        ctypes.c_void_p,
+    ]
+    recvmmsg.restype = ctypes.c_int
+    return recvmmsg
+
+
+_recvmmsg = _load_recvmmsg()
+
+
+def _drain_loop(sock: socket.socket, buffers: t.Sequence[bytearray]) -> t.List[int]:
+    sizes = []
+
+    timeout = sock.gettimeout()
+    if not MSG_DONTWAIT:
+        sock.settimeout(0.0)
+    try:
+        for buffer in buffers:
+            sizes.append(sock.recv_into(buffer, 0, MSG_DONTWAIT))
+    except BlockingIOError:
+        pass
+    finally:
+        if not MSG_DONTWAIT:
+            sock.settimeout(timeout)
+
+    return sizes
+
+
+def recv_batch(sock: socket.socket, buffers: t.Sequence[bytearray]) -> t.List[int]:
+    """Receives a batch of datagrams into the given buffers.
+
+    Blocks, subject to the socket timeout, until a first datagram arrives,
+    then receives the datagrams already queued into the remaining buffers
+    with a loop of non-blocking ``recv_into``.
+
+    Args:
+        sock (socket.socket):
+            - The datagram socket to receive from
+        buffers (Sequence[bytearray]):
+            - The buffers to receive into, one per datagram
+
+    Returns:
+        The sizes of the datagrams received into the first buffers, in order.
+    """
+    sizes = [sock.recv_into(buffers[0])]
+    if len(buffers) > 1:
+        sizes += _drain_loop(sock, buffers[1:])
+
+    return sizes
+
+
+class MessageBuffers:
+    """A fixed set of receive buffers to receive batches of datagrams into.
+
+    Unlike ``recv_batch``, which can receive into any buffers, the message
+    headers that ``recvmmsg`` needs are built once for these buffers, so that
+    the queue is drained with a single system call and no per-call setup.
+    Where ``recvmmsg`` is not available, this falls back on ``recv_batch``.
+    """
+
+    def __init__(
+        self, count: int, buffer_size: int = 2048, use_recvmmsg: bool = True
+    ) -> None:
+        self.buffers = [bytearray(buffer_size) for _ in range(count)]
+        self.views = [memoryview(_) for _ in self.buffers]
+        self._messages = None
+
+        if not (use_recvmmsg and _recvmmsg and count > 1):
+            return
+
+        # The exports also keep the buffers from being resized
+        self._exports = [ctypes.c_char.from_buffer(_) for _ in self.buffers]
+        self._iovecs = (_iovec * count)()
+        self._messages = (_mmsghdr * count)()
+        for i, export in enumerate(self._exports):
+            self._iovecs[i].iov_base = ctypes.addressof(export)
+            self._iovecs[i].iov_len = buffer_size
+            self._messages[i].msg_hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            self._messages[i].msg_hdr.msg_iovlen = 1
+
+        # The first buffer is received into with a plain blocking recv_into
+        self._rest = ctypes.addressof(self._messages) + ctypes.sizeof(_mmsghdr)
+
+    def recv(self, sock: socket.socket) -> t.List[int]:
+        """Receives a batch of datagrams, like ``recv_batch``, into the
+        buffers and returns their sizes."""
+        messages = self._messages
+        if messages is None:
+            return recv_batch(sock, self.buffers)
+
+        sizes = [sock.recv_into(self.buffers[0])]
+
+        count = _recvmmsg(
+            sock.fileno(), self._rest, len(self.buffers) - 1, MSG_DONTWAIT, None
+        )
+        if count < 0:
+            error = ctypes.get_errno()
+            if error not in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                raise OSError(error, os.strerror(error))
+            count = 0
+
+        sizes += [messages[i].msg_len for i in range(1, count + 1)]
+        return sizes
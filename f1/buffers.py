@@ -0,0 +1,33 @@
+"""
+Reusable receive buffers for zero-copy packet decoding.
+"""
+
+import typing as t
+
+
+class BufferPool:
+    """A bounded pool of preallocated receive buffers.
+
+    Buffers are handed out with ``acquire`` and given back with ``release``.
+    When the pool runs dry a fresh buffer is allocated, and buffers released
+    to a full pool are simply dropped, so forgetting to release a buffer only
+    costs an allocation.
+    """
+
+    def __init__(self, size: int = 16, buffer_size: int = 2048):
+        self.size = size
+        self.buffer_size = buffer_size
+        self._free: t.List[bytearray] = [bytearray(buffer_size) for _ in range(size)]
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def acquire(self) -> bytearray:
+        try:
+            return self._free.pop()
+        except IndexError:
+            return bytearray(self.buffer_size)
+
+    def release(self, buffer: bytearray) -> None:
+        if len(self._free) < self.size:
+            self._free.append(buffer)
@@ -0,0 +1,196 @@
+"""
+Field-level change detection, to only send what changed between consecutive
+packets of a type, e.g. over a websocket ::
+
+    encoder = DeltaEncoder(only={1, 4, 7})
+    for datagram in datagrams:
+        delta = encoder.encode(datagram)
+        if delta is not None:
+            websocket.send(json.dumps(delta._asdict()))
+
+Datagrams are compared with the previous one of the same type, field by
+field, on the byte ranges given by the ``_fields_`` offsets of their packet
+type, and only the changed fields are decoded. Arrays of structures, e.g. the
+data of every car, are compared element by element first, so unchanged car
+slots cost a single comparison.
+"""
+
+import ctypes
+import struct
+import typing as t
+
+from f1.packets import PACKET_KEY
+from f1.packets import resolve_type
+from f1.packets import struct_code
+
+_HEADER = struct.Struct("<7xQ4xI")
+
+
+class Delta(t.NamedTuple):
+    """The fields of a packet that changed since the previous one of its type.
+
+    ``changes`` maps the name of every changed field to its value, except for
+    arrays of structures, which map the index of every changed element to
+    its changed fields, e.g. ``{"car_status_data": {3: {"fuel_in_tank":
+    12.5}}}``. Keyframes hold every field.
+    """
+
+    packet_id: int
+    session_uid: int
+    frame_identifier: int
+    keyframe: bool
+    changes: t.Dict[str, t.Any]
+
+
+def _decoder(ctype) -> t.Callable[[t.Any, int], t.Any]:
+    """Returns a function that decodes a field from the raw packet data at an
+    offset, into the same value as ``to_dict``"""
+    if issubclass(ctype, ctypes.Array):
+        if ctype._type_ is ctypes.c_char:
+            size = ctype._length_
+            return lambda data, offset: (
+                bytes(data[offset : offset + size]).split(b"\0", 1)[0].decode()
+            )
+        if not issubclass(ctype._type_, (ctypes.Structure, ctypes.Union)):
+            array = struct.Struct(f"<{ctype._length_}{struct_code(ctype._type_)}")
+            return lambda data, offset: list(array.unpack_from(data, offset))
+        return lambda data, offset: [
+            _.to_dict() for _ in ctype.from_buffer_copy(data, offset)
+        ]
+
+    if issubclass(ctype, (ctypes.Structure, ctypes.Union)):
+        return lambda data, offset: ctype.from_buffer_copy(data, offset).to_dict()
+
+    # Formatted like the values of ``to_dict``
+    code = struct_code(ctype)
+    scalar = struct.Struct(f"<{code}")
+    if code in "fd":
+        return lambda data, offset: round(scalar.unpack_from(data, offset)[0], 3)
+    if code == "c":
+        return lambda data, offset: scalar.unpack_from(data, offset)[0].decode()
+    return lambda data, offset: scalar.unpack_from(data, offset)[0]
+
+
+# (name, start, end, decoder) of a field
+_Field = t.Tuple[str, int, int, t.Callable[[t.Any, int], t.Any]]
+
+
+def _fields(ctype, base: int = 0) -> t.List[_Field]:
+    return [
+        (
+            name,
+            base + getattr(ctype, name).offset,
+            base + getattr(ctype, name).offset + getattr(ctype, name).size,
+            _decoder(_type),
+        )
+        for name, _type in ctype._fields_
+    ]
+
+
+class _Layout:
+    """The byte ranges of the fields of a packet type.
+
+    ``fields`` are the top-level fields, other than the header and arrays of
+    structures, which are in ``arrays`` as ``(name, [(start, end, fields of
+    the element)])``.
+    """
+
+    def __init__(self, packet_type) -> None:
+        self.fields: t.List[_Field] = []
+        self.arrays: t.List[t.Tuple[str, t.List[t.Tuple[int, int, t.List]]]] = []
+        # Where the fields start, after the header
+        self.start = packet_type.header.size
+
+        for field, (name, ctype) in zip(_fields(packet_type), packet_type._fields_):
+            if name == "header":
+                continue
+            _, start, end, _ = field
+            if issubclass(ctype, ctypes.Array) and issubclass(
+                ctype._type_, (ctypes.Structure, ctypes.Union)
+            ):
+                size = ctypes.sizeof(ctype._type_)
+                self.arrays.append(
+                    (
+                        name,
+                        [
+                            (_, _ + size, _fields(ctype._type_, _))
+                            for _ in range(start, end, size)
+                        ],
+                    )
+                )
+            else:
+                self.fields.append(field)
+
+    def diff(self, data, previous) -> t.Dict[str, t.Any]:
+        """Returns the changed fields of ``data``, or all of them if there is
+        no ``previous`` data"""
+        changes: t.Dict[str, t.Any] = {}
+        if previous is not None and data[self.start :] == previous[self.start :]:
+            return changes
+
+        for name, start, end, decode in self.fields:
+            if previous is None or data[start:end] != previous[start:end]:
+                changes[name] = decode(data, start)
+
+        for name, elements in self.arrays:
+            changed = {}
+            for i, (start, end, fields) in enumerate(elements):
+                if previous is not None and data[start:end] == previous[start:end]:
+                    continue
+                changed[i] = {
+                    _name: decode(data, _start)
+                    for _name, _start, _end, decode in fields
+                    if previous is None or data[_start:_end] != previous[_start:_end]
+                }
+            if changed:
+                changes[name] = changed
+
+        return changes
+
+
+_LAYOUTS: t.Dict[type, _Layout] = {}
+
+
+class DeltaEncoder:
+    """Turn raw datagrams into ``Delta`` of the fields that changed since the
+    previous datagram of the same session and packet id.
+
+    Every ``keyframe_interval`` datagrams of a session and packet id, a full
+    keyframe is emitted instead, so that consumers joining late or losing
+    deltas can resync. Datagrams with no changes yield ``None``.
+
+    If ``only`` is given, only packets with those ids are encoded.
+    """
+
+    def __init__(
+        self,
+        only: t.Optional[t.Container[int]] = None,
+        keyframe_interval: int = 60,
+    ):
+        self.only = only
+        self.keyframe_interval = keyframe_interval
+        # (session uid, packet id) -> (datagrams seen, previous datagram)
+        self._previous: t.Dict[t.Tuple[int, int], t.Tuple[int, bytes]] = {}
+
+    def encode(self, datagram) -> t.Optional[Delta]:
+        packet_type = resolve_type(datagram, self.only)
+        if packet_type is None:
+            return None
+
+        try:
+            layout = _LAYOUTS[packet_type]
+        except KeyError:
+            layout = _LAYOUTS[packet_type] = _Layout(packet_type)
+
+        packet_id = PACKET_KEY.unpack_from(datagram)[2]
+        session_uid, frame_identifier = _HEADER.unpack_from(datagram)
+        key = (session_uid, packet_id)
+
+        count, previous = self._previous.get(key, (0, None))
+        keyframe = count % self.keyframe_interval == 0
+        changes = layout.diff(datagram, None if keyframe else previous)
+        self._previous[key] = (count + 1, bytes(datagram))
+
+        if not keyframe and not changes:
+            return None
+        return Delta(packet_id, session_uid, frame_identifier, keyframe, changes)
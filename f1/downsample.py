@@ -0,0 +1,283 @@
+"""
+Per-packet-id downsampling, between a listener and a handler, e.g. to feed a
+sink that only needs 5Hz telemetry while events pass through untouched ::
+
+    listener = Downsampler(
+        PacketListener(),
+        {
+            0: Decimate(rate=5),
+            6: Aggregate(["speed", "engine_rpm"], rate=5),
+            2: Coalesce(rate=5),
+        },
+    )
+    MyHandler(listener).handle()
+
+Policies work on raw datagrams, so packets that are skipped are never
+decoded, and aggregations only decode the fields they aggregate.
+"""
+
+import itertools
+import socket
+import time
+import typing as t
+
+from f1.listener import PacketListener
+from f1.packets import PACKET_PEEK
+from f1.packets import column_reader
+from f1.packets import resolve
+from f1.packets import resolve_type
+
+
+class Decimate:
+    """Passes one datagram out of ``every``, or the first datagram of every
+    ``1 / rate`` seconds, skipping the others."""
+
+    __slots__ = ("every", "interval", "skipped", "_count", "_next")
+
+    def __init__(self, rate: t.Optional[float] = None, every: t.Optional[int] = None):
+        if (rate is None) == (every is None):
+            raise ValueError("Either a rate or every must be given")
+
+        self.every = every
+        self.interval = 1 / rate if rate else 0.0
+        self.skipped = 0
+        self._count = 0
+        self._next = float("-inf")
+
+    def add(self, datagram, now: float):
+        if self.every is not None:
+            skip = self._count % self.every
+            self._count += 1
+        else:
+            skip = now < self._next
+            if not skip:
+                self._next = now + self.interval
+
+        if skip:
+            self.skipped += 1
+            return None
+        return datagram
+
+    def flush(self):
+        return None
+
+
+class Coalesce:
+    """Passes the last datagram of every ``1 / rate`` seconds window, once
+    the first datagram of the next window arrives, or on ``flush``."""
+
+    __slots__ = ("interval", "skipped", "_held", "_end")
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self.skipped = 0
+        self._held = None
+        self._end = float("-inf")
+
+    def add(self, datagram, now: float):
+        emitted = None
+        if now >= self._end:
+            emitted = self._held
+            self._end = now + self.interval
+        elif self._held is not None:
+            self.skipped += 1
+        # Owned by the policy until emitted, e.g. for a pooled buffer
+        self._held = bytes(datagram)
+        return emitted
+
+    def flush(self):
+        held, self._held = self._held, None
+        return held
+
+
+class Aggregation:
+    """The ``min``, ``max`` and ``mean`` of fields across the datagrams of a
+    window, element by element, e.g. by car. Handled by ``handle_Aggregation``
+    methods."""
+
+    __slots__ = ("packet_id", "session_uid", "frame_identifier", "count", "fields")
+
+    def __init__(self, packet_id, session_uid, frame_identifier, count, fields):
+        self.packet_id = packet_id
+        self.session_uid = session_uid
+        # The frame of the last datagram of the window
+        self.frame_identifier = frame_identifier
+        # The number of datagrams aggregated
+        self.count = count
+        # Field -> {"min": [...], "max": [...], "mean": [...]}
+        self.fields = fields
+
+    def to_dict(self):
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def __repr__(self):
+        return str(self.to_dict())
+
+
+def _flatten(values: list) -> list:
+    if values and isinstance(values[0], list):
+        return list(itertools.chain.from_iterable(values))
+    return values
+
+
+def _reshape(values: list, width: int) -> list:
+    if width == 1:
+        return values
+    return [values[i : i + width] for i in range(0, len(values), width)]
+
+
+class Aggregate:
+    """Aggregates numeric fields of arrays of structures, e.g. ``"speed"``
+    for every car, over ``1 / rate`` seconds windows. An ``Aggregation`` is
+    emitted once the first datagram of the next window arrives, or on
+    ``flush``.
+
+    Only the aggregated fields are read from the datagrams, with
+    ``column_reader``, see it for how fields are named.
+    """
+
+    __slots__ = ("names", "interval", "skipped", "_end", "_stats", "_count", "_last")
+
+    def __init__(self, names: t.Iterable[str], rate: float):
+        self.names = list(names)
+        self.interval = 1 / rate
+        # Datagrams are aggregated, never skipped
+        self.skipped = 0
+        self._end = float("-inf")
+        # Field -> [minimums, maximums, sums, width of a row]
+        self._stats: t.Dict[str, t.List] = {}
+        self._count = 0
+        self._last: t.Optional[t.Tuple[int, int, int]] = None
+
+    def add(self, datagram, now: float):
+        emitted = None
+        if now >= self._end:
+            emitted = self.flush()
+            self._end = now + self.interval
+
+        packet_type = resolve_type(datagram)
+        if packet_type is None:
+            return emitted
+
+        for name in self.names:
+            rows = column_reader(packet_type, name)(datagram, 0).tolist()
+            values = _flatten(rows)
+            try:
+                minimums, maximums, sums, _ = self._stats[name]
+            except KeyError:
+                width = len(values) // len(rows)
+                self._stats[name] = [values, list(values), list(values), width]
+                continue
+
+            for i, value in enumerate(values):
+                if value < minimums[i]:
+                    minimums[i] = value
+                if value > maximums[i]:
+                    maximums[i] = value
+                sums[i] += value
+
+        # The packet id, session uid and frame identifier
+        self._last = PACKET_PEEK.unpack_from(datagram)[2:]
+        self._count += 1
+        return emitted
+
+    def flush(self) -> t.Optional[Aggregation]:
+        if not self._count:
+            return None
+
+        count = self._count
+        fields = {
+            name: {
+                "min": _reshape(minimums, width),
+                "max": _reshape(maximums, width),
+                "mean": _reshape([_ / count for _ in sums], width),
+            }
+            for name, (minimums, maximums, sums, width) in self._stats.items()
+        }
+        aggregation = Aggregation(*self._last, count, fields)
+
+        self._stats = {}
+        self._count = 0
+        return aggregation
+
+
+class Downsampler:
+    """Downsample the datagrams of a listener by packet id, before decoding.
+
+    ``policies`` maps a packet id to a ``Decimate``, ``Coalesce`` or
+    ``Aggregate`` policy; packets without one pass through untouched. The
+    number of datagrams skipped by the policies, by packet id, is in
+    ``skipped()``.
+
+    A downsampler is used in place of a listener, e.g. with a
+    ``PacketHandler``, which handles aggregations in ``handle_Aggregation``.
+    The ``only`` and ``backend`` of the listener are honoured, except that
+    aggregated packet ids are always aggregated.
+    """
+
+    def __init__(
+        self,
+        listener: PacketListener,
+        policies: t.Mapping[int, t.Any],
+        clock: t.Callable[[], float] = time.monotonic,
+    ):
+        self.listener = listener
+        self.policies = dict(policies)
+        self.clock = clock
+
+    @property
+    def only(self) -> t.Optional[t.Container[int]]:
+        return self.listener.only
+
+    @only.setter
+    def only(self, only: t.Optional[t.Container[int]]) -> None:
+        self.listener.only = only
+
+    def _decode(self, datagram):
+        if datagram is None or isinstance(datagram, Aggregation):
+            return datagram
+        return resolve(datagram, backend=self.listener.backend)
+
+    def process(self, datagram):
+        """Applies the policy of a raw datagram, returns the packet or
+        aggregation it yields, if any."""
+        if len(datagram) < PACKET_PEEK.size:
+            return None
+
+        packet_id = datagram[6]
+        policy = self.policies.get(packet_id)
+        if not isinstance(policy, Aggregate):
+            only = self.listener.only
+            if only is not None and packet_id not in only:
+                return None
+        if policy is None:
+            return self._decode(datagram)
+
+        return self._decode(policy.add(datagram, self.clock()))
+
+    def skipped(self) -> t.Dict[int, int]:
+        return {k: v.skipped for k, v in self.policies.items()}
+
+    def flush(self) -> t.List[t.Any]:
+        """Returns the packets and aggregations held by the policies"""
+        emitted = (policy.flush() for policy in self.policies.values())
+        return [self._decode(_) for _ in emitted if _ is not None]
+
+    def get(self):
+        recv = self.listener.socket.recv
+        stats = self.listener.stats
+        while True:
+            try:
+                datagram = recv(2048)
+            except socket.timeout:
+                continue
+            if stats is not None:
+                stats.update(datagram)
+
+            packet = self.process(datagram)
+            if packet is not None:
+                return packet
+
+    def __iter__(self):
+        while True:
+            yield self.get()
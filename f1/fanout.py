@@ -0,0 +1,360 @@
+"""
+Fan packets out to several handlers, each on its own executor with its own
+bounded queue, so that a slow handler, e.g. a database writer, only falls
+behind itself and not the others ::
+
+    fanout = FanoutHandler(PacketListener())
+    fanout.register(Dashboard(fanout))
+    fanout.register(DatabaseWriter, executor=PROCESS, maxsize=10_000)
+    with fanout:
+        fanout.handle()
+"""
+
+import asyncio
+import collections
+import multiprocessing
+import threading
+import time
+import typing as t
+
+from f1.handler import PacketHandler
+from f1.handler import narrow
+from f1.handler import subscriptions
+from f1.pipeline import DROP_NEWEST
+from f1.pipeline import DROP_OLDEST
+from f1.structs import struct_type
+from f1.workers import Ring
+from f1.workers import _work
+
+THREAD = "thread"
+PROCESS = "process"
+ASYNCIO = "asyncio"
+
+
+class _Sink:
+    """A registered handler, with its queue and metrics"""
+
+    def __init__(self, handler, name: str, maxsize: int, drop: str, clock):
+        if drop not in (DROP_OLDEST, DROP_NEWEST):
+            raise ValueError(f"Unknown drop policy {drop!r}")
+
+        self.handler = handler
+        self.name = name
+        self.maxsize = maxsize
+        self.drop = drop
+        self.clock = clock
+        self.dropped = 0
+        self.packet_ids = subscriptions([handler])
+        # Packet type -> whether the handler is subscribed to it
+        self._wants: t.Dict[type, bool] = {}
+
+    def wants(self, packet) -> bool:
+        try:
+            return self._wants[type(packet)]
+        except KeyError:
+            wanted = self._wants[type(packet)] = (
+                self.packet_ids is None or packet.header.packet_id in self.packet_ids
+            )
+            return wanted
+
+    def metrics(self) -> t.Dict[str, t.Any]:
+        return {
+            "depth": self.depth(),
+            "lag": self.lag(),
+            "dropped": self.dropped,
+            "handled": self.handled,
+        }
+
+
+class _QueueSink(_Sink):
+    """A sink whose handler runs in this process, off a deque of (time queued,
+    packet)."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.handled = 0
+        self._queue: t.Deque[t.Tuple[float, t.Any]] = collections.deque()
+        self._condition = threading.Condition()
+        self._running = False
+
+    def put(self, packet) -> None:
+        with self._condition:
+            if len(self._queue) >= self.maxsize:
+                self.dropped += 1
+                if self.drop == DROP_NEWEST:
+                    return
+                self._queue.popleft()
+            self._queue.append((self.clock(), packet))
+            self._condition.notify()
+        self._wake()
+
+    def _wake(self) -> None:
+        pass
+
+    def _take(self) -> t.Optional[t.Tuple[float, t.Any]]:
+        with self._condition:
+            return self._queue.popleft() if self._queue else None
+
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def lag(self) -> float:
+        with self._condition:
+            return self.clock() - self._queue[0][0] if self._queue else 0.0
+
+
+class _ThreadSink(_QueueSink):
+    def start(self) -> None:
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        dispatch = self.handler.dispatch
+        condition, queue = self._condition, self._queue
+
+        while True:
+            with condition:
+                condition.wait_for(lambda: queue or not self._running)
+                if not queue:
+                    return
+                _, packet = queue.popleft()
+
+            dispatch(packet)
+            self.handled += 1
+
+    def stop(self) -> None:
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        self._thread.join()
+
+
+class _AsyncSink(_QueueSink):
+    def __init__(self, *args, loop: t.Optional[asyncio.AbstractEventLoop] = None):
+        super().__init__(*args)
+        self.loop = loop
+        self._own_loop = loop is None
+        self._event: t.Optional[asyncio.Event] = None
+
+    def start(self) -> None:
+        if self._own_loop:
+            self.loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+            self._thread.start()
+
+        self._running = True
+        self._future = asyncio.run_coroutine_threadsafe(self._run(), self.loop)
+
+    def _set(self) -> None:
+        if self._event is not None:
+            self._event.set()
+
+    def _wake(self) -> None:
+        self.loop.call_soon_threadsafe(self._set)
+
+    async def _run(self) -> None:
+        # Created here, as before Python 3.10 an event is bound to the event
+        # loop current at creation
+        self._event = event = asyncio.Event()
+        dispatch = self.handler.dispatch
+
+        while True:
+            event.clear()
+            item = self._take()
+            if item is None:
+                if not self._running:
+                    return
+                await event.wait()
+                continue
+
+            await dispatch(item[1])
+            self.handled += 1
+
+    def stop(self) -> None:
+        self._running = False
+        self._wake()
+        self._future.result()
+
+        if self._own_loop:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self.loop.close()
+            self.loop = None
+
+
+class _ProcessSink(_Sink):
+    """A sink whose handler class runs in its own process, off a ``Ring`` of
+    raw packets. The ring cannot drop its oldest datagrams, so the newest
+    ones are dropped when it is full."""
+
+    def __init__(self, *args, backend=None):
+        super().__init__(*args)
+        if self.drop != DROP_NEWEST:
+            raise ValueError("Process handlers can only drop the newest packets")
+        if not isinstance(self.handler, type):
+            raise ValueError("Process handlers are given as a PacketHandler class")
+        # Packets are re-encoded with ``pack``, which struct records lack
+        if backend is struct_type:
+            raise ValueError("Process handlers do not support the struct backend")
+
+        self.backend = backend
+        self.ring = Ring(self.maxsize)
+        # The time every packet in the ring was queued, by slot
+        self._times = [0.0] * self.maxsize
+        # The packets handled, once stopped and the ring is closed
+        self._handled: t.Optional[int] = None
+
+    @property
+    def handled(self) -> int:
+        if self._handled is not None:
+            return self._handled
+        # The packets read from the ring, the last one may still be handled
+        return self.ring._position - len(self.ring)
+
+    def start(self) -> None:
+        self._process = multiprocessing.Process(
+            target=_work, args=(self.ring, self.handler, self.backend), daemon=True
+        )
+        self._process.start()
+
+    def put(self, packet) -> None:
+        position = self.ring._position
+        if not self.ring.put(packet.pack()):
+            self.dropped += 1
+            return
+        self._times[position % self.maxsize] = self.clock()
+
+    def depth(self) -> int:
+        return len(self.ring) if self._handled is None else 0
+
+    def lag(self) -> float:
+        if not self.depth():
+            return 0.0
+        return self.clock() - self._times[self.handled % self.maxsize]
+
+    def stop(self) -> None:
+        # The end marker is never dropped
+        while not self.ring.put(b""):
+            time.sleep(0.001)
+        self._process.join()
+        # Not counting the end marker
+        self._handled = self.ring._position - 1
+        self.ring.close(unlink=True)
+
+
+class FanoutHandler(PacketHandler):
+    """Hand every packet of a listener over to several handlers, each on its
+    own executor.
+
+    Every handler has its own bounded queue, and its own policy for when it is
+    full: ``DROP_OLDEST`` or ``DROP_NEWEST``, as for ``PacketPipeline``. A
+    handler is only queued the packets it is subscribed to, and the listener
+    is narrowed down to the packets at least one handler is subscribed to.
+
+    ``metrics`` reports, for every handler, the ``depth`` of its queue, its
+    ``lag``, i.e. how long the oldest packet in its queue has been waiting,
+    in seconds, and the number of packets it ``dropped`` and ``handled``.
+
+    Packets are shared by the handlers that run in this process, which must
+    not modify them. Zero-copy and reused packets of the listener are copied
+    before being queued.
+    """
+
+    def __init__(self, listener, clock: t.Callable[[], float] = time.monotonic):
+        super().__init__(listener)
+        self.clock = clock
+        self.sinks: t.Dict[str, _Sink] = {}
+        self._copy = getattr(listener, "pool", None) is not None or getattr(
+            listener, "reuse", False
+        )
+
+    def register(
+        self,
+        handler,
+        executor: str = THREAD,
+        maxsize: int = 1024,
+        drop: t.Optional[str] = None,
+        name: t.Optional[str] = None,
+        loop: t.Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
+        """Registers a handler, before the fan-out is started.
+
+        Args:
+            handler (Any):
+                - A ``PacketHandler`` for the ``THREAD`` executor, an
+                  ``AsyncPacketHandler`` for the ``ASYNCIO`` executor, or a
+                  ``PacketHandler`` class, instantiated in a new process, for
+                  the ``PROCESS`` executor. Process handlers receive the
+                  packets re-encoded, so a listener with the struct backend
+                  raises a ``ValueError``
+            executor (str):
+                - ``THREAD``, ``PROCESS`` or ``ASYNCIO``
+            maxsize (int):
+                - The maximum number of packets queued for the handler
+            drop (str):
+                - The drop policy when the queue is full, ``DROP_OLDEST`` by
+                  default, ``DROP_NEWEST`` for process handlers
+            name (str):
+                - The name of the handler in ``metrics``, its class name by
+                  default
+            loop (asyncio.AbstractEventLoop):
+                - The event loop asyncio handlers run on, a new one on its own
+                  thread by default
+
+        """
+        if name is None:
+            name = getattr(handler, "__name__", type(handler).__name__)
+        if name in self.sinks:
+            raise ValueError(f"A handler named {name!r} is already registered")
+
+        if drop is None:
+            drop = DROP_NEWEST if executor == PROCESS else DROP_OLDEST
+        args = (handler, name, maxsize, drop, self.clock)
+
+        if executor == THREAD:
+            sink: _Sink = _ThreadSink(*args)
+        elif executor == ASYNCIO:
+            sink = _AsyncSink(*args, loop=loop)
+        elif executor == PROCESS:
+            backend = getattr(self.listener, "backend", None)
+            sink = _ProcessSink(*args, backend=backend)
+        else:
+            raise ValueError(f"Unknown executor {executor!r}")
+
+        self.sinks[name] = sink
+
+    def start(self) -> None:
+        for sink in self.sinks.values():
+            sink.start()
+
+    def stop(self) -> None:
+        """Waits for every handler to handle the packets queued so far, then
+        stops them."""
+        for sink in self.sinks.values():
+            sink.stop()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def metrics(self) -> t.Dict[str, t.Dict[str, t.Any]]:
+        return {name: sink.metrics() for name, sink in self.sinks.items()}
+
+    def subscribe(self) -> None:
+        if hasattr(self.listener, "only"):
+            self.listener.only = narrow(
+                self.listener.only,
+                subscriptions(_.handler for _ in self.sinks.values()),
+            )
+
+    def handle_generic(self, packet):
+        if self._copy:
+            packet = packet.copy()
+
+        for sink in self.sinks.values():
+            if sink.wants(packet):
+                sink.put(packet)
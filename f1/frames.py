@@ -0,0 +1,184 @@
+"""
+Join the packets sent for a same simulation frame into one snapshot.
+
+The game spreads every frame over several packets, e.g. motion, lap and
+telemetry data, which all share the ``session_uid`` and frame identifiers of
+their header ::
+
+    class Dashboard(FrameHandler):
+        subscriptions = {"MotionData", "LapData", "CarTelemetryData"}
+
+        def handle_frame(self, frame):
+            ...
+"""
+
+import collections
+import time
+import typing as t
+
+from f1.handler import PacketHandler
+
+
+class Frame:
+    """The packets received for a frame, by packet id"""
+
+    __slots__ = (
+        "session_uid",
+        "frame_identifier",
+        "overall_frame_identifier",
+        "packets",
+        "time",
+    )
+
+    def __init__(
+        self,
+        session_uid: int,
+        frame_identifier: int,
+        overall_frame_identifier: int,
+        time: float,
+    ):
+        self.session_uid = session_uid
+        # Goes back after a flashback, unlike the overall frame identifier
+        self.frame_identifier = frame_identifier
+        self.overall_frame_identifier = overall_frame_identifier
+        self.packets: t.Dict[int, t.Any] = {}
+        # When the first packet of the frame was received
+        self.time = time
+
+    def __repr__(self):
+        return (
+            f"Frame({self.session_uid}, {self.frame_identifier}, "
+            f"{sorted(self.packets)})"
+        )
+
+
+class FrameAssembler:
+    """Buffer packets by frame, until every expected packet id has arrived or
+    the frame times out.
+
+    Frames are emitted by ``add`` as soon as they are complete, and by
+    ``expire`` once ``timeout`` seconds have passed since their first packet,
+    in which case they are counted in ``incomplete``. At most ``max_frames``
+    frames are pending at once, the oldest being emitted incomplete to make
+    room for a new one. Packets that arrive for a frame already emitted are
+    dropped and counted in ``late``.
+
+    Frames are told apart by their ``overall_frame_identifier``, which keeps
+    increasing after a flashback, when the ``frame_identifier`` goes back.
+
+    Adding a packet takes a few dict lookups, and expiring frames only looks
+    at the oldest pending frames.
+    """
+
+    def __init__(
+        self,
+        expected: t.Iterable[int],
+        timeout: float = 0.1,
+        max_frames: int = 16,
+        clock: t.Callable[[], float] = time.monotonic,
+    ):
+        self.expected = frozenset(expected)
+        self.timeout = timeout
+        self.max_frames = max_frames
+        self.clock = clock
+        self.incomplete = 0
+        self.late = 0
+        # (session uid, overall frame identifier) -> frame, oldest first
+        self._pending: t.OrderedDict[t.Tuple[int, int], Frame] = (
+            collections.OrderedDict()
+        )
+        # Session uid -> highest overall frame identifier emitted
+        self._emitted: t.Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _emit(self, key: t.Tuple[int, int]) -> Frame:
+        frame = self._pending.pop(key)
+        if len(frame.packets) < len(self.expected):
+            self.incomplete += 1
+
+        session_uid, overall_frame_identifier = key
+        if overall_frame_identifier > self._emitted.get(session_uid, -1):
+            self._emitted[session_uid] = overall_frame_identifier
+        return frame
+
+    def add(self, packet) -> t.List[Frame]:
+        """Adds a packet, returns the frames emitted as a result"""
+        header = packet.header
+        packet_id = header.packet_id
+        if packet_id not in self.expected:
+            return []
+
+        key = session_uid, overall_frame_identifier = (
+            header.session_uid,
+            header.overall_frame_identifier,
+        )
+        emitted: t.List[Frame] = []
+
+        try:
+            frame = self._pending[key]
+        except KeyError:
+            if overall_frame_identifier <= self._emitted.get(session_uid, -1):
+                self.late += 1
+                return emitted
+
+            if len(self._pending) >= self.max_frames:
+                emitted.append(self._emit(next(iter(self._pending))))
+            frame = self._pending[key] = Frame(
+                session_uid,
+                header.frame_identifier,
+                overall_frame_identifier,
+                self.clock(),
+            )
+
+        frame.packets[packet_id] = packet
+        if len(frame.packets) == len(self.expected):
+            emitted.append(self._emit(key))
+        return emitted
+
+    def expire(self) -> t.List[Frame]:
+        """Emits the frames that timed out, oldest first"""
+        deadline = self.clock() - self.timeout
+        emitted: t.List[Frame] = []
+        while self._pending:
+            key, frame = next(iter(self._pending.items()))
+            if frame.time > deadline:
+                break
+            emitted.append(self._emit(key))
+        return emitted
+
+    def flush(self) -> t.List[Frame]:
+        """Emits every pending frame, oldest first"""
+        return [self._emit(_) for _ in list(self._pending)]
+
+
+class FrameHandler(PacketHandler):
+    """A ``PacketHandler`` that hands whole frames over to ``handle_frame``.
+
+    The frames wait for the packets the handler declares in its
+    ``subscriptions``. Timed out frames are emitted as packets of later
+    frames arrive. Zero-copy and reused packets of the listener are copied,
+    as they outlive the handler calls.
+    """
+
+    def __init__(self, listener, timeout: float = 0.1, max_frames: int = 16):
+        super().__init__(listener)
+        expected = self.packet_ids()
+        if expected is None:
+            raise ValueError(f"{type(self).__name__} must declare its subscriptions")
+        self.assembler = FrameAssembler(expected, timeout, max_frames)
+        pooled = getattr(listener, "pool", None) is not None
+        self._copy = pooled or getattr(listener, "reuse", False)
+
+    def handle_frame(self, frame: Frame):
+        pass
+
+    def handle_generic(self, packet):
+        if self._copy:
+            packet = packet.copy()
+
+        for frame in self.assembler.expire():
+            self.handle_frame(frame)
+        for frame in self.assembler.add(packet):
+            self.handle_frame(frame)
@@ -1,20 +1,135 @@
+import typing as t
+
+from f1 import specs
 from f1.listener import PacketListener
 
 
+def narrow(
+    only: t.Optional[t.Container[int]], packet_ids: t.Optional[t.AbstractSet[int]]
+) -> t.Optional[t.Container[int]]:
+    """Returns the packet ids in both ``only`` and ``packet_ids``, either of
+    which is ``None`` for every packet id."""
+    if packet_ids is None:
+        return only
+    if only is None:
+        return packet_ids
+    return frozenset(_ for _ in packet_ids if _ in only)
+
+
+def subscriptions(
+    handlers: t.Iterable[t.Any],
+) -> t.Optional[t.FrozenSet[int]]:
+    """Returns the ids of the packets any of the handlers is subscribed to, or
+    ``None`` for every packet. Handlers without ``packet_ids`` subscribe to
+    every packet, ``None`` are skipped."""
+    packet_ids: t.Set[int] = set()
+    for handler in handlers:
+        if handler is None:
+            continue
+        ids = handler.packet_ids() if hasattr(handler, "packet_ids") else None
+        if ids is None:
+            return None
+        packet_ids |= ids
+    return frozenset(packet_ids)
+
+
 class PacketHandler:
+    """Hands the packets of a listener over to ``handle_generic``, then to
+    the ``handle_<Name>`` method of their type if any, e.g. ``handle_LapData``
+    for ``PacketLapData``.
+
+    The methods are looked up once, when a subclass is created, and each
+    packet type is mapped to its method the first time it is seen, so that
+    dispatching a packet costs a dict lookup.
+
+    A handler subscribes to the packets it has a method for, unless it
+    overrides ``handle_generic``, in which case it subscribes to every
+    packet. The ``subscriptions`` class attribute declares them instead, as
+    packet names without the ``Packet`` prefix, e.g. ``{"LapData"}``.
+    ``handle`` pushes the subscriptions down into the ``only`` of the
+    listener, so that the other packets are dropped after a peek at their
+    header, without being decoded.
+    """
+
+    # The names of the packets subscribed to, if declared
+    subscriptions: t.Optional[t.AbstractSet[str]] = None
+
+    # Name -> handle_<Name> function, as found at subclass creation
+    _methods: t.Dict[str, t.Callable] = {}
+    # Packet type -> handle_<Name> function, or None, as packets are seen
+    _dispatch: t.Dict[type, t.Optional[t.Callable]] = {}
+    # Whether handle_generic is overridden
+    _generic = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._methods = {
+            name[7:]: getattr(cls, name)
+            for name in dir(cls)
+            if name.startswith("handle_") and name != "handle_generic"
+        }
+        cls._dispatch = {}
+        cls._generic = cls.handle_generic is not PacketHandler.handle_generic
+
     def __init__(self, listener: PacketListener):
         self.listener = listener
 
     def handle_generic(self, packet):
         pass
 
+    @classmethod
+    def _method(cls, packet_type: type) -> t.Optional[t.Callable]:
+        name = packet_type.__name__
+        if name.startswith("Packet"):
+            name = name[6:]
+        method = cls._dispatch[packet_type] = cls._methods.get(name)
+        return method
+
+    @classmethod
+    def packet_ids(cls) -> t.Optional[t.FrozenSet[int]]:
+        """Returns the ids of the packets subscribed to, or ``None`` for every
+        packet."""
+        names = cls.subscriptions
+        if names is None:
+            if cls._generic:
+                return None
+            names = cls._methods
+
+        ids = specs.load(specs.LATEST).HEADER_FIELD_TO_PACKET_TYPE.packet_ids()
+        unknown = [_ for _ in names if f"Packet{_}" not in ids]
+        if unknown and cls.subscriptions is not None:
+            raise ValueError(f"Unknown packets {unknown} in {cls.__name__}")
+        return frozenset(ids[f"Packet{_}"] for _ in names if f"Packet{_}" in ids)
+
+    def subscribe(self) -> None:
+        """Narrows the ``only`` of the listener, if it has one, down to the
+        packets subscribed to."""
+        if hasattr(self.listener, "only"):
+            self.listener.only = narrow(self.listener.only, self.packet_ids())
+
+    def dispatch(self, packet) -> None:
+        """Hands a packet over to ``handle_generic`` and its ``handle_<Name>``
+        method, if any."""
+        if self._generic:
+            self.handle_generic(packet)
+
+        try:
+            method = self._dispatch[type(packet)]
+        except KeyError:
+            method = self._method(type(packet))
+        if method is not None:
+            method(self, packet)
+
     def handle(self):
+        self.subscribe()
+
+        # Zero-copy packets are only valid for the duration of the handler
+        # calls, after which their buffer is given back to the listener.
+        release = getattr(self.listener, "release", None)
+        dispatch = self.dispatch
+
         for packet in self.listener:
-            self.handle_generic(packet)
+            dispatch(packet)
 
-            name = packet.__class__.__name__
-            if name.startswith("Packet"):
-                name = name[6:]
-            handler = getattr(self, f"handle_{name}", None)
-            if handler is not None:
-                handler(packet)
+            if release is not None:
+                release(packet)
@@ -0,0 +1,199 @@
+"""
+Lazy packets that decode fields on first access.
+
+A lazy packet only holds on to the raw packet data and decodes a field, or an
+element of an array of structures, the first time it is accessed, using
+offsets precomputed from the ``_fields_`` of the corresponding ``Packet``
+type. Lazy packet types have the same names and attributes as their ``Packet``
+counterparts, so they can be used with ``PacketHandler``, e.g. ::
+
+    listener = PacketListener(backend=lazy_type)
+"""
+
+import ctypes
+import struct
+import typing as t
+
+from f1.packets import column_reader
+from f1.packets import struct_code
+
+
+class LazyField:
+    """A field descriptor that decodes the value on first access and caches it
+    in the instance dictionary."""
+
+    __slots__ = ("name", "decode")
+
+    def __init__(self, name: str, decode: t.Callable[[t.Any, int], t.Any]) -> None:
+        self.name = name
+        self.decode = decode
+
+    def __get__(self, packet, owner=None):
+        if packet is None:
+            return self
+
+        value = packet.__dict__[self.name] = self.decode(packet._buffer, packet._offset)
+        return value
+
+
+class LazyArray:
+    """An array of lazy structures, created on first access."""
+
+    __slots__ = ("_type", "_buffer", "_offset", "_items")
+
+    def __init__(self, _type: type, length: int, buffer, offset: int) -> None:
+        self._type = _type
+        self._buffer = buffer
+        self._offset = offset
+        self._items: t.List[t.Optional["LazyPacket"]] = [None] * length
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[_] for _ in range(*i.indices(len(self._items)))]
+
+        item = self._items[i]
+        if item is None:
+            if i < 0:
+                i += len(self._items)
+            item = self._items[i] = self._type(
+                self._buffer, self._offset + i * self._type._size_
+            )
+        return item
+
+    def __iter__(self):
+        for i in range(len(self._items)):
+            yield self[i]
+
+    def to_list(self):
+        return [_.to_dict() for _ in self]
+
+
+class LazyPacket:
+    """The base lazy packet class"""
+
+    _fields_: t.List[t.Tuple[str, t.Any]] = []
+    _size_ = 0
+    _packet_type_: t.Optional[type] = None
+
+    def __init__(self, buffer, offset: int = 0) -> None:
+        self._buffer = buffer
+        self._offset = offset
+
+    @classmethod
+    def size(cls):
+        return cls._size_
+
+    @classmethod
+    def unpack(cls, buffer, copy=True):
+        """Wraps the raw packet data without decoding anything
+
+        Args:
+            buffer (bytes):
+                - The encoded buffer to decode
+            copy (bool):
+                - Whether to copy the buffer. When ``False`` the packet keeps
+                  a reference to the given buffer, which must not be reused
+                  for as long as the packet is in use.
+
+        """
+        if len(buffer) < cls._size_:
+            raise ValueError(
+                f"Buffer size too small ({len(buffer)} instead of at least "
+                f"{cls._size_} bytes)"
+            )
+        return cls(bytes(buffer) if copy else buffer)
+
+    def pack(self):
+        return bytes(self._buffer[self._offset : self._offset + self._size_])
+
+    def copy(self):
+        """Returns a copy of the packet that does not share its data"""
+        return type(self)(self.pack())
+
+    def columns(self, name):
+        """See ``PacketMixin.columns``"""
+        return column_reader(self._packet_type_, name)(self._buffer, self._offset)
+
+    def to_dict(self):
+        """Returns a ``dict`` with key-values derived from _fields_"""
+        return {k: _format_value(getattr(self, k)) for k, _ in self._fields_}
+
+    def __repr__(self):
+        return str(self.to_dict())
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        return round(value, 3)
+    if isinstance(value, bytes):
+        return value.decode()
+    if isinstance(value, LazyPacket):
+        return value.to_dict()
+    if isinstance(value, LazyArray):
+        return value.to_list()
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+def _is_structure(ctype) -> bool:
+    return isinstance(ctype, type) and issubclass(
+        ctype, (ctypes.Structure, ctypes.Union)
+    )
+
+
+def _decoder(ctype, offset: int) -> t.Callable[[t.Any, int], t.Any]:
+    if _is_structure(ctype):
+        lazy = lazy_type(ctype)
+        return lambda buffer, base: lazy(buffer, base + offset)
+
+    if issubclass(ctype, ctypes.Array):
+        element, length = ctype._type_, ctype._length_
+
+        if _is_structure(element):
+            lazy = lazy_type(element)
+            return lambda buffer, base: LazyArray(lazy, length, buffer, base + offset)
+
+        if element is ctypes.c_char:
+            # Like ctypes, return the string up to the first null byte
+            s = struct.Struct(f"<{length}s")
+            return lambda buffer, base: s.unpack_from(buffer, base + offset)[0].split(
+                b"\0", 1
+            )[0]
+
+        s = struct.Struct(f"<{length}{struct_code(element)}")
+        return lambda buffer, base: s.unpack_from(buffer, base + offset)
+
+    s = struct.Struct(f"<{struct_code(ctype)}")
+    return lambda buffer, base: s.unpack_from(buffer, base + offset)[0]
+
+
+_LAZY_TYPES: t.Dict[type, t.Type[LazyPacket]] = {}
+
+
+def lazy_type(packet_type: type) -> t.Type[LazyPacket]:
+    """Returns the lazy counterpart of a ``Packet`` type."""
+    try:
+        return _LAZY_TYPES[packet_type]
+    except KeyError:
+        pass
+
+    namespace: t.Dict[str, t.Any] = {
+        "_fields_": packet_type._fields_,
+        "_size_": ctypes.sizeof(packet_type),
+        "_packet_type_": packet_type,
+        "__module__": __name__,
+    }
+    for name, ctype in packet_type._fields_:
+        namespace[name] = LazyField(
+            name, _decoder(ctype, getattr(packet_type, name).offset)
+        )
+
+    lazy = _LAZY_TYPES[packet_type] = type(
+        packet_type.__name__, (LazyPacket,), namespace
+    )
+
+    return lazy
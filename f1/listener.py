@@ -4,23 +4,222 @@ Basic listener to read the UDP packet and convert it to a known packet format.
 
 import platform
 import socket
+import typing as t
 
+from f1.batch import MessageBuffers
+from f1.batch import recv_batch
+from f1.buffers import BufferPool
 from f1.packets import resolve
+from f1.packets import resolve_type
+from f1.stats import PacketStats
+from f1.stats import kernel_drops
 
 
 class PacketListener:
-    def __init__(self, host: str = "", port: int = 20777):
+    """Listen for telemetry packets on a UDP socket.
+
+    When a ``BufferPool`` is given, datagrams are received straight into
+    pooled buffers and the returned packets are views over them, with no
+    copies involved. Such packets are only valid until they are handed back
+    with ``release``, after which their buffer is recycled for new datagrams.
+
+    When ``reuse`` is set, the listener keeps one packet instance per packet
+    type and decodes every datagram in place into it with ``unpack_into``, so
+    that no new packets are allocated. A packet is then only valid until the
+    next packet of the same type is received.
+
+    In both cases, packets that need to outlive that must be copied with
+    ``packet.copy()``.
+
+    ``get_batch`` receives every datagram already queued on the socket in one
+    wakeup (see ``f1.batch``), which keeps up with bursts better than ``get``.
+    Without a pool, the queue is drained with a single ``recvmmsg`` call into
+    buffers owned by the listener, where available. It cannot be used along
+    with ``reuse``, as a batch may hold several packets of the same type.
+
+    If ``only`` is given, only packets with those ids are decoded and
+    returned; any other datagram is dropped after a peek at its header.
+
+    The ``backend`` is passed on to ``resolve`` to pick the type packets are
+    decoded with.
+
+    If ``stats`` is given, every datagram received is accounted for in that
+    ``PacketStats``, before any filtering, including by the stages that
+    receive from the listener's socket themselves, e.g. ``PacketPipeline``,
+    ``PacketWorkers``, ``PacketRelay``, ``Downsampler`` and
+    ``PacketRecorder``. ``rcvbuf`` sets the size of the
+    socket receive buffer (``SO_RCVBUF``), which is reported by the
+    ``rcvbuf`` property along with ``kernel_drops`` to tune it.
+    """
+
+    def __init__(
+        self,
+        host: str = "",
+        port: int = 20777,
+        pool: t.Optional[BufferPool] = None,
+        only: t.Optional[t.Container[int]] = None,
+        backend: t.Optional[t.Callable[[type], type]] = None,
+        reuse: bool = False,
+        stats: t.Optional[PacketStats] = None,
+        rcvbuf: t.Optional[int] = None,
+    ):
+        if reuse and (pool is not None or backend is not None):
+            raise ValueError("Packet reuse cannot be combined with a pool or backend")
+
         self.socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
         if platform.system() == "Windows":
             self.socket.settimeout(0.5)
+        if rcvbuf is not None:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
         self.socket.bind((host, port))
+        self.pool = pool
+        self.only = only
+        self.backend = backend
+        self.reuse = reuse
+        self.stats = stats
+        self._batches: t.Dict[int, MessageBuffers] = {}
+
+        if reuse:
+            self._buffer = bytearray(2048)
+            self._packets: t.Dict[type, t.Any] = {}
+            self._get = self._get_reused
+        elif pool is not None:
+            self._get = self._get_pooled
+        else:
+            self._get = self._get_copied
+
+    def _get_copied(self):
+        data = self.socket.recv(2048)
+        if self.stats is not None:
+            self.stats.update(data)
+        return resolve(data, only=self.only, backend=self.backend)
+
+    def _get_pooled(self):
+        buffer = self.pool.acquire()
+        try:
+            n = self.socket.recv_into(buffer)
+        except socket.timeout:
+            self.pool.release(buffer)
+            raise
+        return self._resolve_pooled(buffer, n)
+
+    def _resolve_pooled(self, buffer, n):
+        data = memoryview(buffer)[:n]
+        if self.stats is not None:
+            self.stats.update(data)
+
+        packet = resolve(data, copy=False, only=self.only, backend=self.backend)
+        if packet is None:
+            self.pool.release(buffer)
+            return None
+
+        try:
+            packet._pool_buffer = buffer
+        except AttributeError:
+            # The packet does not refer to the buffer (e.g. a struct record)
+            self.pool.release(buffer)
+        return packet
+
+    def _get_reused(self):
+        n = self.socket.recv_into(self._buffer)
+        data = memoryview(self._buffer)[:n]
+        if self.stats is not None:
+            self.stats.update(data)
+
+        packet_type = resolve_type(data, self.only)
+        if packet_type is None:
+            return None
+
+        try:
+            packet = self._packets[packet_type]
+        except KeyError:
+            packet = self._packets[packet_type] = packet_type()
+
+        packet.unpack_into(data)
+        return packet
+
+    def _get_batch(self, size):
+        if self.pool is None:
+            try:
+                batch = self._batches[size]
+            except KeyError:
+                batch = self._batches[size] = MessageBuffers(size)
+            sizes = batch.recv(self.socket)
+            only, backend, stats = self.only, self.backend, self.stats
+            packets = []
+            for view, n in zip(batch.views, sizes):
+                data = view[:n]
+                if stats is not None:
+                    stats.update(data)
+                packet = resolve(data, True, only, backend)
+                if packet is not None:
+                    packets.append(packet)
+            return packets
+
+        buffers = [self.pool.acquire() for _ in range(size)]
+        sizes: t.List[int] = []
+        try:
+            sizes = recv_batch(self.socket, buffers)
+        finally:
+            # Give back the buffers nothing was received into
+            for buffer in buffers[len(sizes) :]:
+                self.pool.release(buffer)
+
+        packets = (self._resolve_pooled(*_) for _ in zip(buffers, sizes))
+        return [_ for _ in packets if _ is not None]
+
+    def get_batch(self, size: int = 64):
+        """Returns the packets of all the datagrams received in one wakeup.
+
+        Blocks until at least one packet is received, then returns it along
+        with the packets of up to ``size - 1`` datagrams that were already
+        queued, in the order they were received.
+        """
+        if self.reuse:
+            raise ValueError("Batched receive cannot be combined with packet reuse")
+
+        while True:
+            try:
+                packets = self._get_batch(size)
+            except socket.timeout:
+                continue
+            if packets:
+                return packets
 
     def get(self):
         while True:
             try:
-                return resolve(self.socket.recv(2048))
+                packet = self._get()
             except socket.timeout:
-                pass
+                continue
+            if packet is not None:
+                return packet
+
+    @property
+    def rcvbuf(self) -> int:
+        """The size of the socket receive buffer, as reported by the OS (Linux
+        reports twice the size that was set, for bookkeeping overhead)"""
+        return self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+
+    def kernel_drops(self) -> t.Optional[int]:
+        """See ``f1.stats.kernel_drops``"""
+        return kernel_drops(self.socket)
+
+    def release(self, packet) -> None:
+        """Return the buffer backing a zero-copy packet to the pool.
+
+        This is a no-op for packets that do not come from the pool, and for
+        packets that have already been released.
+        """
+        if self.pool is None:
+            return
+
+        try:
+            buffer = packet._pool_buffer
+            del packet._pool_buffer
+        except AttributeError:
+            return
+        self.pool.release(buffer)
 
     def __iter__(self):
         while True:
@@ -0,0 +1,164 @@
+"""
+Listener over many UDP sockets at once, e.g. one port per console in a rig
+room, multiplexed on a single ``selectors`` loop (epoll on Linux) ::
+
+    listener = MultiPacketListener([("", 20777), ("", 20778)])
+    listener.serve({20777: Dashboard(listener)}, default=Logger(listener))
+"""
+
+import collections
+import selectors
+import socket
+import struct
+import typing as t
+
+from f1.handler import narrow
+from f1.handler import subscriptions
+from f1.packets import resolve
+
+_SESSION_UID = struct.Struct("<7xQ")
+
+
+class SourcedPacket(t.NamedTuple):
+    """A packet along with where it came from"""
+
+    packet: t.Any
+    # The address of the sender
+    address: t.Tuple[str, int]
+    # The local port the packet was received on
+    port: int
+    session_uid: int
+
+
+class MultiPacketListener:
+    """Listen for telemetry packets on several UDP sockets.
+
+    Sockets are non-blocking and registered with a selector; on every wakeup
+    at most ``burst`` datagrams are read from each ready socket, so that a
+    busy source cannot starve the others. Packets are returned as
+    ``SourcedPacket``, tagged with their sender address, local port and
+    session uid.
+
+    The ``only`` and ``backend`` are passed on to ``resolve``, as for
+    ``PacketListener``.
+
+    Args:
+        addresses (Iterable[Tuple[str, int]]):
+            - The ``(host, port)`` to bind a socket to, more can be added
+              with ``bind``
+        burst (int):
+            - The maximum number of datagrams read from a socket per wakeup
+        rcvbuf (int):
+            - The size of the receive buffer of every socket, if given
+
+    """
+
+    def __init__(
+        self,
+        addresses: t.Iterable[t.Tuple[str, int]] = (),
+        only: t.Optional[t.Container[int]] = None,
+        backend: t.Optional[t.Callable[[type], type]] = None,
+        burst: int = 64,
+        rcvbuf: t.Optional[int] = None,
+    ):
+        self.only = only
+        self.backend = backend
+        self.burst = burst
+        self.rcvbuf = rcvbuf
+        self.selector = selectors.DefaultSelector()
+        self.sockets: t.Dict[int, socket.socket] = {}
+        # The source of the packet being served, see ``serve``
+        self.source: t.Optional[SourcedPacket] = None
+        self._ready: t.Deque[SourcedPacket] = collections.deque()
+
+        for host, port in addresses:
+            self.bind(host, port)
+
+    def bind(self, host: str = "", port: int = 20777) -> socket.socket:
+        """Binds and registers a new socket, returns it. Its local port, e.g.
+        when ``port`` is 0, is then a key of ``sockets``."""
+        sock = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
+        if self.rcvbuf is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
+        sock.bind((host, port))
+        sock.setblocking(False)
+
+        port = sock.getsockname()[1]
+        self.sockets[port] = sock
+        self.selector.register(sock, selectors.EVENT_READ, port)
+        return sock
+
+    def close(self) -> None:
+        for sock in self.sockets.values():
+            self.selector.unregister(sock)
+            sock.close()
+        self.sockets.clear()
+        self.selector.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _poll(self, timeout: t.Optional[float]) -> None:
+        append = self._ready.append
+        only, backend, burst = self.only, self.backend, self.burst
+
+        for key, _ in self.selector.select(timeout):
+            recvfrom = key.fileobj.recvfrom
+            port = key.data
+            for _ in range(burst):
+                try:
+                    data, address = recvfrom(2048)
+                except BlockingIOError:
+                    break
+
+                packet = resolve(data, only=only, backend=backend)
+                if packet is not None:
+                    (session_uid,) = _SESSION_UID.unpack_from(data)
+                    append(SourcedPacket(packet, address, port, session_uid))
+
+    def get(self, timeout: t.Optional[float] = None) -> t.Optional[SourcedPacket]:
+        """Returns the next packet from any of the sockets, or ``None`` if
+        none arrived within ``timeout`` seconds."""
+        if not self._ready:
+            self._poll(timeout)
+            while timeout is None and not self._ready:
+                self._poll(None)
+        return self._ready.popleft() if self._ready else None
+
+    def __iter__(self):
+        while True:
+            yield self.get()
+
+    def serve(
+        self,
+        handlers: t.Optional[t.Mapping[int, t.Any]] = None,
+        default: t.Optional[t.Any] = None,
+        count: t.Optional[int] = None,
+    ) -> None:
+        """Hands packets over to ``PacketHandler`` instances, forever or until
+        ``count`` packets have been served.
+
+        ``handlers`` maps a local port to the handler of its source, and any
+        other port goes to the ``default`` handler, which thus serves as a
+        handler shared by several sources. While a handler runs, the
+        ``SourcedPacket`` being handled is in ``source``.
+
+        The ``only`` of the listener is narrowed down to the packets that at
+        least one of the handlers is subscribed to.
+        """
+        handlers = handlers or {}
+        self.only = narrow(self.only, subscriptions((*handlers.values(), default)))
+
+        served = 0
+        for source in self:
+            handler = handlers.get(source.port, default)
+            if handler is not None:
+                self.source = source
+                handler.dispatch(source.packet)
+            served += 1
+            if count is not None and served >= count:
+                break
+        self.source = None
@@ -1,15 +1,31 @@
 """
 Spec taken from:
 https://answers.ea.com/t5/General-Discussion/F1-22-UDP-Specification/m-p/11551274
+
+The packet types of every supported spec are generated into the modules of
+``f1.specs``. For backward compatibility, those of the latest spec, along with
+their HEADER_FIELD_TO_PACKET_TYPE, can also be imported from here.
 """
 
+import array
 import ctypes
+import struct
 from enum import Enum
 
+from f1 import specs
+
 
 class PacketMixin(object):
     """A base set of helper methods for ctypes based packets"""
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Specialise to_dict for the fields of the new class
+        fields = cls.__dict__.get("_fields_")
+        if fields is not None:
+            cls.to_dict = _compile_to_dict(cls.__name__, fields)
+
     def get_value(self, field):
         """Returns the field's value and formats the types value"""
         return self._format_type(getattr(self, field))
@@ -29,15 +45,56 @@ class PacketMixin(object):
         return ctypes.sizeof(cls)
 
     @classmethod
-    def unpack(cls, buffer):
+    def unpack(cls, buffer, copy=True):
         """Attempts to unpack the binary structure into a python structure
 
         Args:
             buffer (bytes):
                 - The encoded buffer to decode
+            copy (bool):
+                - Whether to copy the buffer. When ``False`` the returned
+                  structure is a view over the given writable buffer, which
+                  must not be reused for as long as the structure is in use.
 
         """
-        return cls.from_buffer_copy(buffer)
+        if copy:
+            return cls.from_buffer_copy(buffer)
+        return cls.from_buffer(buffer)
+
+    def unpack_into(self, buffer):
+        """Unpacks the binary structure in place, overwriting the current data
+
+        This is cheaper than ``unpack`` as no new structure is created, which
+        makes it possible to reuse the same instance for every packet of a
+        given type.
+
+        Args:
+            buffer (bytes):
+                - The encoded buffer to decode
+
+        """
+        # The view is not kept on the instance, as that would make a
+        # reference cycle out of every reused packet
+        view = memoryview(self).cast("B")
+        size = len(view)
+        data = memoryview(buffer)[:size]
+        if len(data) < size:
+            raise ValueError(
+                f"Buffer size too small ({len(data)} instead of at least {size} bytes)"
+            )
+        view[:] = data
+
+    def copy(self):
+        """Returns a copy of the structure that does not share its data"""
+        return type(self).from_buffer_copy(self)
+
+    def columns(self, name):
+        """Returns the values of a field across an array of structures, e.g.
+        the speed of every car with ``columns("speed")``.
+
+        See ``column_reader`` for details.
+        """
+        return column_reader(type(self), name)(self, 0)
 
     def to_dict(self):
         """Returns a ``dict`` with key-values derived from _fields_"""
@@ -74,6 +131,133 @@ def _format_array_type(value):
     return results
 
 
+def _field_to_dict(ctype, value):
+    """Returns the expression that formats a field value like ``_format_type``"""
+    if issubclass(ctype, (ctypes.Structure, ctypes.Union)):
+        return f"{value}.to_dict()"
+
+    if issubclass(ctype, ctypes.Array):
+        if ctype._type_ is ctypes.c_char:
+            return f"{value}.decode()"
+        if issubclass(ctype._type_, (ctypes.Structure, ctypes.Union)):
+            return f"[_.to_dict() for _ in {value}]"
+        return f"{value}[:]"
+
+    code = struct_code(ctype)
+    if code in "fd":
+        return f"round({value}, 3)"
+    if code == "c":
+        return f"{value}.decode()"
+
+    return value
+
+
+def _compile_to_dict(name, fields):
+    """Compiles a ``to_dict`` method with the kind of every field resolved
+    upfront, instead of on every call as ``PacketMixin.to_dict`` does."""
+    items = "".join(
+        f"        {k!r}: {_field_to_dict(ctype, f'self.{k}')},\n" for k, ctype in fields
+    )
+    namespace = {}
+    exec(f"def to_dict(self):\n    return {{\n{items}    }}\n", {}, namespace)
+
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"{name}.to_dict"
+    to_dict.__doc__ = PacketMixin.to_dict.__doc__
+
+    return to_dict
+
+
+def struct_code(ctype):
+    """Returns the ``struct`` format code of a ctypes scalar type.
+
+    Codes are chosen by size rather than taken from ``ctype._type_``, which
+    refers to native sizes (e.g. ``c_uint64`` is ``L`` on most platforms).
+    """
+    code = ctype._type_
+    if code in "cdf?":
+        return code
+
+    code = "bhiq"[(ctypes.sizeof(ctype)).bit_length() - 1]
+    return code if ctype._type_.islower() else code.upper()
+
+
+_COLUMN_READERS = {}
+
+
+def column_reader(packet_type, name):
+    """Returns a function that reads a field across an array of structures.
+
+    The field is looked up in the first array of structures of the packet type
+    that has it, unless qualified with the array name, as in
+    ``"weather_forecast_samples.weather"``. The returned function takes the raw
+    packet data and the offset of the packet within it, and unpacks the field
+    of every element with a single precompiled ``struct``, without creating
+    any intermediate structures.
+
+    Scalar fields are returned as a one-dimensional ``memoryview``, and array
+    fields, like ``tyres_pressure``, as a two-dimensional one, with one row
+    per element. Strings are returned as a tuple of ``bytes``.
+    """
+    try:
+        return _COLUMN_READERS[(packet_type, name)]
+    except KeyError:
+        pass
+
+    array_name, _, field_name = name.rpartition(".")
+    for _name, ctype in packet_type._fields_:
+        if array_name and _name != array_name:
+            continue
+        if not issubclass(ctype, ctypes.Array) or not issubclass(
+            ctype._type_, ctypes.Structure
+        ):
+            continue
+        element = ctype._type_
+        field_type = dict(element._fields_).get(field_name)
+        if field_type is not None:
+            break
+    else:
+        raise AttributeError(f"{packet_type.__name__} has no column {name!r}")
+
+    length = ctype._length_
+    offset = getattr(packet_type, _name).offset + getattr(element, field_name).offset
+    padding = ctypes.sizeof(element) - ctypes.sizeof(field_type)
+
+    if issubclass(field_type, (ctypes.Structure, ctypes.Union)) or (
+        issubclass(field_type, ctypes.Array)
+        and issubclass(field_type._type_, (ctypes.Structure, ctypes.Union))
+    ):
+        raise TypeError(f"Column {name!r} of {packet_type.__name__} is a structure")
+
+    if issubclass(field_type, ctypes.Array) and field_type._type_ is ctypes.c_char:
+        column = struct.Struct(
+            "<" + f"{padding}x".join([f"{field_type._length_}s"] * length)
+        )
+
+        def reader(buffer, base):
+            return tuple(
+                _.split(b"\0", 1)[0] for _ in column.unpack_from(buffer, base + offset)
+            )
+
+    else:
+        count = 1
+        if issubclass(field_type, ctypes.Array):
+            field_type, count = field_type._type_, field_type._length_
+        code = struct_code(field_type)
+        column = struct.Struct("<" + f"{padding}x".join([f"{count}{code}"] * length))
+        shape = (length, count)
+
+        def reader(buffer, base):
+            view = memoryview(
+                array.array(code, column.unpack_from(buffer, base + offset))
+            )
+            return view if count == 1 else view.cast("B").cast(code, shape)
+
+    _COLUMN_READERS[(packet_type, name)] = reader
+
+    return reader
+
+
 class Packet(ctypes.LittleEndianStructure, PacketMixin):
     """The base packet class"""
 
@@ -83,719 +267,93 @@ class Packet(ctypes.LittleEndianStructure, PacketMixin):
         return str(self.to_dict())
 
 
-# [[[cog
-# import sys; sys.path.append("./scripts"); import genspec
-# ]]]
-class PacketHeader(Packet):
-    _fields_ = [
-        ("packet_format", ctypes.c_uint16),
-        ("game_year", ctypes.c_uint8),
-        ("game_major_version", ctypes.c_uint8),
-        ("game_minor_version", ctypes.c_uint8),
-        ("packet_version", ctypes.c_uint8),
-        ("packet_id", ctypes.c_uint8),
-        ("session_uid", ctypes.c_uint64),
-        ("session_time", ctypes.c_float),
-        ("frame_identifier", ctypes.c_uint32),
-        ("overall_frame_identifier", ctypes.c_uint32),
-        ("player_car_index", ctypes.c_uint8),
-        ("secondary_player_car_index", ctypes.c_uint8),
-    ]
-
-
-class CarMotionData(Packet):
-    _fields_ = [
-        ("world_position_x", ctypes.c_float),
-        ("world_position_y", ctypes.c_float),
-        ("world_position_z", ctypes.c_float),
-        ("world_velocity_x", ctypes.c_float),
-        ("world_velocity_y", ctypes.c_float),
-        ("world_velocity_z", ctypes.c_float),
-        ("world_forward_dir_x", ctypes.c_int16),
-        ("world_forward_dir_y", ctypes.c_int16),
-        ("world_forward_dir_z", ctypes.c_int16),
-        ("world_right_dir_x", ctypes.c_int16),
-        ("world_right_dir_y", ctypes.c_int16),
-        ("world_right_dir_z", ctypes.c_int16),
-        ("g_force_lateral", ctypes.c_float),
-        ("g_force_longitudinal", ctypes.c_float),
-        ("g_force_vertical", ctypes.c_float),
-        ("yaw", ctypes.c_float),
-        ("pitch", ctypes.c_float),
-        ("roll", ctypes.c_float),
-    ]
-
-
-class PacketMotionData(Packet):
-    _fields_ = [
-        ("header", PacketHeader),
-        ("car_motion_data", CarMotionData * 22),
-    ]
-
-
-class MarshalZone(Packet):
-    _fields_ = [
-        ("zone_start", ctypes.c_float),
-        ("zone_flag", ctypes.c_int8),
-    ]
-
-
-class WeatherForecastSample(Packet):
-    _fields_ = [
-        ("session_type", ctypes.c_uint8),
-        ("time_offset", ctypes.c_uint8),
-        ("weather", ctypes.c_uint8),
-        ("track_temperature", ctypes.c_int8),
-        ("track_temperature_change", ctypes.c_int8),
-        ("air_temperature", ctypes.c_int8),
-        ("air_temperature_change", ctypes.c_int8),
-        ("rain_percentage", ctypes.c_uint8),
-    ]
-
-
-class PacketSessionData(Packet):
-    _fields_ = [
-        ("header", PacketHeader),
-        ("weather", ctypes.c_uint8),
-        ("track_temperature", ctypes.c_int8),
-        ("air_temperature", ctypes.c_int8),
-        ("total_laps", ctypes.c_uint8),
-        ("track_length", ctypes.c_uint16),
-        ("session_type", ctypes.c_uint8),
-        ("track_id", ctypes.c_int8),
-        ("formula", ctypes.c_uint8),
-        ("session_time_left", ctypes.c_uint16),
-        ("session_duration", ctypes.c_uint16),
-        ("pit_speed_limit", ctypes.c_uint8),
-        ("game_paused", ctypes.c_uint8),
-        ("is_spectating", ctypes.c_uint8),
-        ("spectator_car_index", ctypes.c_uint8),
-        ("sli_pro_native_support", ctypes.c_uint8),
-        ("num_marshal_zones", ctypes.c_uint8),
-        ("marshal_zones", MarshalZone * 21),
-        ("safety_car_status", ctypes.c_uint8),
-        ("network_game", ctypes.c_uint8),
-        ("num_weather_forecast_samples", ctypes.c_uint8),
-        ("weather_forecast_samples", WeatherForecastSample * 64),
-        ("forecast_accuracy", ctypes.c_uint8),
-        ("ai_difficulty", ctypes.c_uint8),
-        ("season_link_identifier", ctypes.c_uint32),
-        ("weekend_link_identifier", ctypes.c_uint32),
-        ("session_link_identifier", ctypes.c_uint32),
-        ("pit_stop_window_ideal_lap", ctypes.c_uint8),
-        ("pit_stop_window_latest_lap", ctypes.c_uint8),
-        ("pit_stop_rejoin_position", ctypes.c_uint8),
-        ("steering_assist", ctypes.c_uint8),
-        ("braking_assist", ctypes.c_uint8),
-        ("gearbox_assist", ctypes.c_uint8),
-        ("pit_assist", ctypes.c_uint8),
-        ("pit_release_assist", ctypes.c_uint8),
-        ("ers_assist", ctypes.c_uint8),
-        ("drs_assist", ctypes.c_uint8),
-        ("dynamic_racing_line", ctypes.c_uint8),
-        ("dynamic_racing_line_type", ctypes.c_uint8),
-        ("game_mode", ctypes.c_uint8),
-        ("rule_set", ctypes.c_uint8),
-        ("time_of_day", ctypes.c_uint32),
-        ("session_length", ctypes.c_uint8),
-        ("speed_units_lead_player", ctypes.c_uint8),
-        ("temperature_units_lead_player", ctypes.c_uint8),
-        ("speed_units_secondary_player", ctypes.c_uint8),
-        ("temperature_units_secondary_player", ctypes.c_uint8),
-        ("num_safety_car_periods", ctypes.c_uint8),
-        ("num_virtual_safety_car_periods", ctypes.c_uint8),
-        ("num_red_flag_periods", ctypes.c_uint8),
-        ("equal_car_performance", ctypes.c_uint8),
-        ("recovery_mode", ctypes.c_uint8),
-        ("flashback_limit", ctypes.c_uint8),
-        ("surface_type", ctypes.c_uint8),
-        ("low_fuel_mode", ctypes.c_uint8),
-        ("race_starts", ctypes.c_uint8),
-        ("tyre_temperature", ctypes.c_uint8),
-        ("pit_lane_tyre_sim", ctypes.c_uint8),
-        ("car_damage", ctypes.c_uint8),
-        ("car_damage_rate", ctypes.c_uint8),
-        ("collisions", ctypes.c_uint8),
-        ("collisions_off_for_first_lap_only", ctypes.c_uint8),
-        ("mp_unsafe_pit_release", ctypes.c_uint8),
-        ("mp_off_for_griefing", ctypes.c_uint8),
-        ("corner_cutting_stringency", ctypes.c_uint8),
-        ("parc_ferme_rules", ctypes.c_uint8),
-        ("pit_stop_experience", ctypes.c_uint8),
-        ("safety_car", ctypes.c_uint8),
-        ("safety_car_experience", ctypes.c_uint8),
-        ("formation_lap", ctypes.c_uint8),
-        ("formation_lap_experience", ctypes.c_uint8),
-        ("red_flags", ctypes.c_uint8),
-        ("affects_licence_level_solo", ctypes.c_uint8),
-        ("affects_licence_level_mp", ctypes.c_uint8),
-        ("num_sessions_in_weekend", ctypes.c_uint8),
-        ("weekend_structure", ctypes.c_uint8 * 12),
-        ("sector2_lap_distance_start", ctypes.c_float),
-        ("sector3_lap_distance_start", ctypes.c_float),
-    ]
-
-
-class LapData(Packet):
-    _fields_ = [
-        ("last_lap_time_in_ms", ctypes.c_uint32),
-        ("current_lap_time_in_ms", ctypes.c_uint32),
-        ("sector1_time_ms_part", ctypes.c_uint16),
-        ("sector1_time_minutes_part", ctypes.c_uint8),
-        ("sector2_time_ms_part", ctypes.c_uint16),
-        ("sector2_time_minutes_part", ctypes.c_uint8),
-        ("delta_to_car_in_front_ms_part", ctypes.c_uint16),
-        ("delta_to_car_in_front_minutes_part", ctypes.c_uint8),
-        ("delta_to_race_leader_ms_part", ctypes.c_uint16),
-        ("delta_to_race_leader_minutes_part", ctypes.c_uint8),
-        ("lap_distance", ctypes.c_float),
-        ("total_distance", ctypes.c_float),
-        ("safety_car_delta", ctypes.c_float),
-        ("car_position", ctypes.c_uint8),
-        ("current_lap_num", ctypes.c_uint8),
-        ("pit_status", ctypes.c_uint8),
-        ("num_pit_stops", ctypes.c_uint8),
-        ("sector", ctypes.c_uint8),
-        ("current_lap_invalid", ctypes.c_uint8),
-        ("penalties", ctypes.c_uint8),
-        ("total_warnings", ctypes.c_uint8),
-        ("corner_cutting_warnings", ctypes.c_uint8),
-        ("num_unserved_drive_through_pens", ctypes.c_uint8),
-        ("num_unserved_stop_go_pens", ctypes.c_uint8),
-        ("grid_position", ctypes.c_uint8),
-        ("driver_status", ctypes.c_uint8),
-        ("result_status", ctypes.c_uint8),
-        ("pit_lane_timer_active", ctypes.c_uint8),
-        ("pit_lane_time_in_lane_in_ms", ctypes.c_uint16),
-        ("pit_stop_timer_in_ms", ctypes.c_uint16),
-        ("pit_stop_should_serve_pen", ctypes.c_uint8),
-        ("speed_trap_fastest_speed", ctypes.c_float),
-        ("speed_trap_fastest_lap", ctypes.c_uint8),
-    ]
-
-
-class PacketLapData(Packet):
-    _fields_ = [
-        ("header", PacketHeader),
-        ("lap_data", LapData * 22),
-        ("time_trial_pb_car_idx", ctypes.c_uint8),
-        ("time_trial_rival_car_idx", ctypes.c_uint8),
-    ]
-
-
-class FastestLap(Packet):
-    _fields_ = [
-        ("vehicle_idx", ctypes.c_uint8),
-        ("lap_time", ctypes.c_float),
-    ]
-
-
-class Retirement(Packet):
-    _fields_ = [
-        ("vehicle_idx", ctypes.c_uint8),
-        ("reason", ctypes.c_uint8),
-    ]
-
-
-class DrsDisabled(Packet):
-    _fields_ = [
-        ("reason", ctypes.c_uint8),
-    ]
-
-
-class TeamMateInPits(Packet):
-    _fields_ = [
-        ("vehicle_idx", ctypes.c_uint8),
-    ]
-
-
-class RaceWinner(Packet):
-    _fields_ = [
-        ("vehicle_idx", ctypes.c_uint8),
-    ]
-
-
-class Penalty(Packet):
-    _fields_ = [
-        ("penalty_type", ctypes.c_uint8),
-        ("infringement_type", ctypes.c_uint8),
-        ("vehicle_idx", ctypes.c_uint8),
-        ("other_vehicle_idx", ctypes.c_uint8),
-        ("time", ctypes.c_uint8),
-        ("lap_num", ctypes.c_uint8),
-        ("places_gained", ctypes.c_uint8),
-    ]
-
-
-class SpeedTrap(Packet):
-    _fields_ = [
-        ("vehicle_idx", ctypes.c_uint8),
-        ("speed", ctypes.c_float),
-        ("is_overall_fastest_in_session", ctypes.c_uint8),
-        ("is_driver_fastest_in_session", ctypes.c_uint8),
-        ("fastest_vehicle_idx_in_session", ctypes.c_uint8),
-        ("fastest_speed_in_session", ctypes.c_float),
-    ]
-
-
-class StartLights(Packet):
-    _fields_ = [
-        ("num_lights", ctypes.c_uint8),
-    ]
-
-
-class DriveThroughPenaltyServed(Packet):
-    _fields_ = [
-        ("vehicle_idx", ctypes.c_uint8),
-    ]
-
-
-class StopGoPenaltyServed(Packet):
-    _fields_ = [
-        ("vehicle_idx", ctypes.c_uint8),
-        ("stop_time", ctypes.c_float),
-    ]
-
-
-class Flashback(Packet):
-    _fields_ = [
-        ("flashback_frame_identifier", ctypes.c_uint32),
-        ("flashback_session_time", ctypes.c_float),
-    ]
-
-
-class Buttons(Packet):
-    _fields_ = [
-        ("button_status", ctypes.c_uint32),
-    ]
-
-
-class Overtake(Packet):
-    _fields_ = [
-        ("overtaking_vehicle_idx", ctypes.c_uint8),
-        ("being_overtaken_vehicle_idx", ctypes.c_uint8),
-    ]
-
-
-class SafetyCar(Packet):
-    _fields_ = [
-        ("safety_car_type", ctypes.c_uint8),
-        ("event_type", ctypes.c_uint8),
-    ]
-
-
-class Collision(Packet):
-    _fields_ = [
-        ("vehicle1_idx", ctypes.c_uint8),
-        ("vehicle2_idx", ctypes.c_uint8),
-    ]
-
-
-class EventDataDetails(ctypes.Union, PacketMixin):
-    _fields_ = [
-        ("fastest_lap", FastestLap),
-        ("retirement", Retirement),
-        ("drs_disabled", DrsDisabled),
-        ("team_mate_in_pits", TeamMateInPits),
-        ("race_winner", RaceWinner),
-        ("penalty", Penalty),
-        ("speed_trap", SpeedTrap),
-        ("start_lights", StartLights),
-        ("drive_through_penalty_served", DriveThroughPenaltyServed),
-        ("stop_go_penalty_served", StopGoPenaltyServed),
-        ("flashback", Flashback),
-        ("buttons", Buttons),
-        ("overtake", Overtake),
-        ("safety_car", SafetyCar),
-        ("collision", Collision),
-    ]
-
-
-class PacketEventData(Packet):
-    _fields_ = [
-        ("header", PacketHeader),
-        ("event_string_code", ctypes.c_uint8 * 4),
-        ("event_details", EventDataDetails),
-    ]
-
-
-class LiveryColour(Packet):
-    _fields_ = [
-        ("red", ctypes.c_uint8),
-        ("green", ctypes.c_uint8),
-        ("blue", ctypes.c_uint8),
-    ]
-
-
-class ParticipantData(Packet):
-    _fields_ = [
-        ("ai_controlled", ctypes.c_uint8),
-        ("driver_id", ctypes.c_uint8),
-        ("network_id", ctypes.c_uint8),
-        ("team_id", ctypes.c_uint8),
-        ("my_team", ctypes.c_uint8),
-        ("race_number", ctypes.c_uint8),
-        ("nationality", ctypes.c_uint8),
-        ("name", ctypes.c_char * 32),
-        ("your_telemetry", ctypes.c_uint8),
-        ("show_online_names", ctypes.c_uint8),
-        ("tech_level", ctypes.c_uint16),
-        ("platform", ctypes.c_uint8),
-        ("num_colours", ctypes.c_uint8),
-        ("livery_colours", LiveryColour * 4),
-    ]
-
-
-class PacketParticipantsData(Packet):
-    _fields_ = [
-        ("header", PacketHeader),
-        ("num_active_cars", ctypes.c_uint8),
-        ("participants", ParticipantData * 22),
-    ]
-
-
-class CarSetupData(Packet):
-    _fields_ = [
-        ("front_wing", ctypes.c_uint8),
-        ("rear_wing", ctypes.c_uint8),
-        ("on_throttle", ctypes.c_uint8),
-        ("off_throttle", ctypes.c_uint8),
-        ("front_camber", ctypes.c_float),
-        ("rear_camber", ctypes.c_float),
-        ("front_toe", ctypes.c_float),
-        ("rear_toe", ctypes.c_float),
-        ("front_suspension", ctypes.c_uint8),
-        ("rear_suspension", ctypes.c_uint8),
-        ("front_anti_roll_bar", ctypes.c_uint8),
-        ("rear_anti_roll_bar", ctypes.c_uint8),
-        ("front_suspension_height", ctypes.c_uint8),
-        ("rear_suspension_height", ctypes.c_uint8),
-        ("brake_pressure", ctypes.c_uint8),
-        ("brake_bias", ctypes.c_uint8),
-        ("engine_braking", ctypes.c_uint8),
-        ("rear_left_tyre_pressure", ctypes.c_float),
-        ("rear_right_tyre_pressure", ctypes.c_float),
-        ("front_left_tyre_pressure", ctypes.c_float),
-        ("front_right_tyre_pressure", ctypes.c_float),
-        ("ballast", ctypes.c_uint8),
-        ("fuel_load", ctypes.c_float),
-    ]
-
-
-class PacketCarSetupData(Packet):
-    _fields_ = [
-        ("header", PacketHeader),
-        ("car_setup_data", CarSetupData * 22),
-        ("next_front_wing_value", ctypes.c_float),
-    ]
-
-
-class CarTelemetryData(Packet):
-    _fields_ = [
-        ("speed", ctypes.c_uint16),
-        ("throttle", ctypes.c_float),
-        ("steer", ctypes.c_float),
-        ("brake", ctypes.c_float),
-        ("clutch", ctypes.c_uint8),
-        ("gear", ctypes.c_int8),
-        ("engine_rpm", ctypes.c_uint16),
-        ("drs", ctypes.c_uint8),
-        ("rev_lights_percent", ctypes.c_uint8),
-        ("rev_lights_bit_value", ctypes.c_uint16),
-        ("brakes_temperature", ctypes.c_uint16 * 4),
-        ("tyres_surface_temperature", ctypes.c_uint8 * 4),
-        ("tyres_inner_temperature", ctypes.c_uint8 * 4),
-        ("engine_temperature", ctypes.c_uint16),
-        ("tyres_pressure", ctypes.c_float * 4),
-        ("surface_type", ctypes.c_uint8 * 4),
-    ]
-
-
-class PacketCarTelemetryData(Packet):
-    _fields_ = [
-        ("header", PacketHeader),
-        ("car_telemetry_data", CarTelemetryData * 22),
-        ("mfd_panel_index", ctypes.c_uint8),
-        ("mfd_panel_index_secondary_player", ctypes.c_uint8),
-        ("suggested_gear", ctypes.c_int8),
-    ]
-
-
-class CarStatusData(Packet):
-    _fields_ = [
-        ("traction_control", ctypes.c_uint8),
-        ("anti_lock_brakes", ctypes.c_uint8),
-        ("fuel_mix", ctypes.c_uint8),
-        ("front_brake_bias", ctypes.c_uint8),
-        ("pit_limiter_status", ctypes.c_uint8),
-        ("fuel_in_tank", ctypes.c_float),
-        ("fuel_capacity", ctypes.c_float),
-        ("fuel_remaining_laps", ctypes.c_float),
-        ("max_rpm", ctypes.c_uint16),
-        ("idle_rpm", ctypes.c_uint16),
-        ("max_gears", ctypes.c_uint8),
-        ("drs_allowed", ctypes.c_uint8),
-        ("drs_activation_distance", ctypes.c_uint16),
-        ("actual_tyre_compound", ctypes.c_uint8),
-        ("visual_tyre_compound", ctypes.c_uint8),
-        ("tyres_age_laps", ctypes.c_uint8),
-        ("vehicle_fia_flags", ctypes.c_int8),
-        ("engine_power_ice", ctypes.c_float),
-        ("engine_power_mguk", ctypes.c_float),
-        ("ers_store_energy", ctypes.c_float),
-        ("ers_deploy_mode", ctypes.c_uint8),
-        ("ers_harvested_this_lap_mguk", ctypes.c_float),
-        ("ers_harvested_this_lap_mguh", ctypes.c_float),
-        ("ers_deployed_this_lap", ctypes.c_float),
-        ("network_paused", ctypes.c_uint8),
-    ]
-
-
-class PacketCarStatusData(Packet):
-    _fields_ = [
-        ("header", PacketHeader),
-        ("car_status_data", CarStatusData * 22),
-    ]
-
-
-class FinalClassificationData(Packet):
-    _fields_ = [
-        ("position", ctypes.c_uint8),
-        ("num_laps", ctypes.c_uint8),
-        ("grid_position", ctypes.c_uint8),
-        ("points", ctypes.c_uint8),
-        ("num_pit_stops", ctypes.c_uint8),
-        ("result_status", ctypes.c_uint8),
-        ("result_reason", ctypes.c_uint8),
-        ("best_lap_time_in_ms", ctypes.c_uint32),
-        ("total_race_time", ctypes.c_double),
-        ("penalties_time", ctypes.c_uint8),
-        ("num_penalties", ctypes.c_uint8),
-        ("num_tyre_stints", ctypes.c_uint8),
-        ("tyre_stints_actual", ctypes.c_uint8 * 8),
-        ("tyre_stints_visual", ctypes.c_uint8 * 8),
-        ("tyre_stints_end_laps", ctypes.c_uint8 * 8),
-    ]
-
-
-class PacketFinalClassificationData(Packet):
-    _fields_ = [
-        ("header", PacketHeader),
-        ("num_cars", ctypes.c_uint8),
-        ("classification_data", FinalClassificationData * 22),
-    ]
-
-
-class LobbyInfoData(Packet):
-    _fields_ = [
-        ("ai_controlled", ctypes.c_uint8),
-        ("team_id", ctypes.c_uint8),
-        ("nationality", ctypes.c_uint8),
-        ("platform", ctypes.c_uint8),
-        ("name", ctypes.c_char * 32),
-        ("car_number", ctypes.c_uint8),
-        ("your_telemetry", ctypes.c_uint8),
-        ("show_online_names", ctypes.c_uint8),
-        ("tech_level", ctypes.c_uint16),
-        ("ready_status", ctypes.c_uint8),
-    ]
-
-
-class PacketLobbyInfoData(Packet):
-    _fields_ = [
-        ("header", PacketHeader),
-        ("num_players", ctypes.c_uint8),
-        ("lobby_players", LobbyInfoData * 22),
-    ]
-
-
-class CarDamageData(Packet):
-    _fields_ = [
-        ("tyres_wear", ctypes.c_float * 4),
-        ("tyres_damage", ctypes.c_uint8 * 4),
-        ("brakes_damage", ctypes.c_uint8 * 4),
-        ("tyre_blisters", ctypes.c_uint8 * 4),
-        ("front_left_wing_damage", ctypes.c_uint8),
-        ("front_right_wing_damage", ctypes.c_uint8),
-        ("rear_wing_damage", ctypes.c_uint8),
-        ("floor_damage", ctypes.c_uint8),
-        ("diffuser_damage", ctypes.c_uint8),
-        ("sidepod_damage", ctypes.c_uint8),
-        ("drs_fault", ctypes.c_uint8),
-        ("ers_fault", ctypes.c_uint8),
-        ("gear_box_damage", ctypes.c_uint8),
-        ("engine_damage", ctypes.c_uint8),
-        ("engine_mguh_wear", ctypes.c_uint8),
-        ("engine_es_wear", ctypes.c_uint8),
-        ("engine_ce_wear", ctypes.c_uint8),
-        ("engine_ice_wear", ctypes.c_uint8),
-        ("engine_mguk_wear", ctypes.c_uint8),
-        ("engine_tc_wear", ctypes.c_uint8),
-        ("engine_blown", ctypes.c_uint8),
-        ("engine_seized", ctypes.c_uint8),
-    ]
-
-
-class PacketCarDamageData(Packet):
-    _fields_ = [
-        ("header", PacketHeader),
-        ("car_damage_data", CarDamageData * 22),
-    ]
-
-
-class LapHistoryData(Packet):
-    _fields_ = [
-        ("lap_time_in_ms", ctypes.c_uint32),
-        ("sector1_time_ms_part", ctypes.c_uint16),
-        ("sector1_time_minutes_part", ctypes.c_uint8),
-        ("sector2_time_ms_part", ctypes.c_uint16),
-        ("sector2_time_minutes_part", ctypes.c_uint8),
-        ("sector3_time_ms_part", ctypes.c_uint16),
-        ("sector3_time_minutes_part", ctypes.c_uint8),
-        ("lap_valid_bit_flags", ctypes.c_uint8),
-    ]
-
-
-class TyreStintHistoryData(Packet):
-    _fields_ = [
-        ("end_lap", ctypes.c_uint8),
-        ("tyre_actual_compound", ctypes.c_uint8),
-        ("tyre_visual_compound", ctypes.c_uint8),
-    ]
-
-
-class PacketSessionHistoryData(Packet):
-    _fields_ = [
-        ("header", PacketHeader),
-        ("car_idx", ctypes.c_uint8),
-        ("num_laps", ctypes.c_uint8),
-        ("num_tyre_stints", ctypes.c_uint8),
-        ("best_lap_time_lap_num", ctypes.c_uint8),
-        ("best_sector1_lap_num", ctypes.c_uint8),
-        ("best_sector2_lap_num", ctypes.c_uint8),
-        ("best_sector3_lap_num", ctypes.c_uint8),
-        ("lap_history_data", LapHistoryData * 100),
-        ("tyre_stints_history_data", TyreStintHistoryData * 8),
-    ]
-
-
-class TyreSetData(Packet):
-    _fields_ = [
-        ("actual_tyre_compound", ctypes.c_uint8),
-        ("visual_tyre_compound", ctypes.c_uint8),
-        ("wear", ctypes.c_uint8),
-        ("available", ctypes.c_uint8),
-        ("recommended_session", ctypes.c_uint8),
-        ("life_span", ctypes.c_uint8),
-        ("usable_life", ctypes.c_uint8),
-        ("lap_delta_time", ctypes.c_int16),
-        ("fitted", ctypes.c_uint8),
-    ]
-
-
-class PacketTyreSetsData(Packet):
-    _fields_ = [
-        ("header", PacketHeader),
-        ("car_idx", ctypes.c_uint8),
-        ("tyre_set_data", TyreSetData * 20),
-        ("fitted_idx", ctypes.c_uint8),
-    ]
-
-
-class PacketMotionExData(Packet):
-    _fields_ = [
-        ("header", PacketHeader),
-        ("suspension_position", ctypes.c_float * 4),
-        ("suspension_velocity", ctypes.c_float * 4),
-        ("suspension_acceleration", ctypes.c_float * 4),
-        ("wheel_speed", ctypes.c_float * 4),
-        ("wheel_slip_ratio", ctypes.c_float * 4),
-        ("wheel_slip_angle", ctypes.c_float * 4),
-        ("wheel_lat_force", ctypes.c_float * 4),
-        ("wheel_long_force", ctypes.c_float * 4),
-        ("height_of_cog_above_ground", ctypes.c_float),
-        ("local_velocity_x", ctypes.c_float),
-        ("local_velocity_y", ctypes.c_float),
-        ("local_velocity_z", ctypes.c_float),
-        ("angular_velocity_x", ctypes.c_float),
-        ("angular_velocity_y", ctypes.c_float),
-        ("angular_velocity_z", ctypes.c_float),
-        ("angular_acceleration_x", ctypes.c_float),
-        ("angular_acceleration_y", ctypes.c_float),
-        ("angular_acceleration_z", ctypes.c_float),
-        ("front_wheels_angle", ctypes.c_float),
-        ("wheel_vert_force", ctypes.c_float * 4),
-        ("front_aero_height", ctypes.c_float),
-        ("rear_aero_height", ctypes.c_float),
-        ("front_roll_angle", ctypes.c_float),
-        ("rear_roll_angle", ctypes.c_float),
-        ("chassis_yaw", ctypes.c_float),
-        ("chassis_pitch", ctypes.c_float),
-        ("wheel_camber", ctypes.c_float * 4),
-        ("wheel_camber_gain", ctypes.c_float * 4),
-    ]
-
-
-class TimeTrialDataSet(Packet):
-    _fields_ = [
-        ("car_idx", ctypes.c_uint8),
-        ("team_id", ctypes.c_uint8),
-        ("lap_time_in_ms", ctypes.c_uint),
-        ("sector1_time_in_ms", ctypes.c_uint),
-        ("sector2_time_in_ms", ctypes.c_uint),
-        ("sector3_time_in_ms", ctypes.c_uint),
-        ("traction_control", ctypes.c_uint8),
-        ("gearbox_assist", ctypes.c_uint8),
-        ("anti_lock_brakes", ctypes.c_uint8),
-        ("equal_car_performance", ctypes.c_uint8),
-        ("custom_setup", ctypes.c_uint8),
-        ("valid", ctypes.c_uint8),
-    ]
-
-
-class PacketTimeTrialData(Packet):
-    _fields_ = [
-        ("header", PacketHeader),
-        ("player_session_best_data_set", TimeTrialDataSet),
-        ("personal_best_data_set", TimeTrialDataSet),
-        ("rival_data_set", TimeTrialDataSet),
-    ]
-
-
-class PacketLapPositionsData(Packet):
-    _fields_ = [
-        ("header", PacketHeader),
-        ("num_laps", ctypes.c_uint8),
-        ("lap_start", ctypes.c_uint8),
-        ("position_for_vehicle_idx", ctypes.c_uint8 * 1100),
-    ]
-
-
-HEADER_FIELD_TO_PACKET_TYPE = {
-    (2025, 1, 0): PacketMotionData,
-    (2025, 1, 1): PacketSessionData,
-    (2025, 1, 2): PacketLapData,
-    (2025, 1, 3): PacketEventData,
-    (2025, 1, 4): PacketParticipantsData,
-    (2025, 1, 5): PacketCarSetupData,
-    (2025, 1, 6): PacketCarTelemetryData,
-    (2025, 1, 7): PacketCarStatusData,
-    (2025, 1, 8): PacketFinalClassificationData,
-    (2025, 1, 9): PacketLobbyInfoData,
-    (2025, 1, 10): PacketCarDamageData,
-    (2025, 1, 11): PacketSessionHistoryData,
-    (2025, 1, 12): PacketTyreSetsData,
-    (2025, 1, 13): PacketMotionExData,
-    (2025, 1, 14): PacketTimeTrialData,
-    (2025, 1, 15): PacketLapPositionsData,
-}
-# [[[end]]]
+# Precompiled views over the header prefix, to look at a packet without
+# decoding it. The key prefix unpacks straight into a key of
+# HEADER_FIELD_TO_PACKET_TYPE. The header layout is the same for all the
+# supported specs.
+PACKET_KEY = struct.Struct("<H3xBB")
+PACKET_PEEK = struct.Struct("<H3xBBQ4xI")
+
+# The packet types looked up so far, by key, across all the packet formats
+_PACKET_TYPES = {}
+
+
+def peek(packet):
+    """Returns the ``(packet_format, packet_version, packet_id, session_uid,
+    frame_identifier)`` tuple of a raw packet without decoding it."""
+    return PACKET_PEEK.unpack_from(packet)
+
+
+def resolve_type(packet, only=None):
+    """Returns the packet type of a raw packet, without decoding it.
+
+    Returns ``None`` if the packet is not of a known type, its packet id is
+    not in ``only``, if given, or it is truncated.
+    """
+    if len(packet) < PACKET_KEY.size:
+        return None
+
+    key = PACKET_KEY.unpack_from(packet)
+    if only is not None and key[2] not in only:
+        return None
+
+    try:
+        packet_type = _PACKET_TYPES[key]
+    except KeyError:
+        spec = specs.load(key[0])
+        if spec is None:
+            return None
+
+        # Only builds this packet type. Unknown keys of a supported spec are
+        # cached too, there are at most 65536 of them
+        packet_type = _PACKET_TYPES[key] = spec.HEADER_FIELD_TO_PACKET_TYPE.get(key)
+
+    if packet_type is None:
+        return None
+
+    if len(packet) < packet_type.size():
+        return None
+
+    return packet_type
+
+
+def resolve(packet, copy=True, only=None, backend=None):
+    """Decodes a raw packet into its packet type.
+
+    Args:
+        packet (bytes):
+            - The raw packet
+        copy (bool):
+            - Whether to copy the packet data (see ``PacketMixin.unpack``)
+        only (Container[int]):
+            - The packet ids to decode, or ``None`` to decode all of them
+        backend (Callable[[type], type]):
+            - Maps a ``Packet`` type to the type to decode the packet with,
+              e.g. ``f1.lazy.lazy_type``. Defaults to the ``Packet`` type
+
+    Returns:
+        The decoded packet, or ``None`` if the packet is not of a known type,
+        was not asked for or is truncated.
+    """
+    packet_type = resolve_type(packet, only)
+    if packet_type is None:
+        return None
+
+    if backend is not None:
+        packet_type = backend(packet_type)
+
+    return packet_type.unpack(packet, copy)
 
 
-def resolve(packet):
-    header = PacketHeader.from_buffer_copy(packet)
-    key = (header.packet_format, header.packet_version, header.packet_id)
-    return HEADER_FIELD_TO_PACKET_TYPE[key].unpack(packet)
+def __getattr__(name):
+    # Fall back to the packet types of the latest spec. Dunder lookups, such
+    # as the import system probing for __path__, must not load it
+    try:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(specs.load(specs.LATEST), name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
 
 class Tyre(Enum):
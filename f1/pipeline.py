@@ -0,0 +1,184 @@
+"""
+Receive/decode pipeline, decoupling the socket from slow packet handlers.
+"""
+
+import collections
+import socket
+import threading
+import typing as t
+
+from f1.listener import PacketListener
+from f1.packets import PACKET_KEY
+from f1.packets import resolve
+
+DROP_OLDEST = "oldest"
+DROP_NEWEST = "newest"
+DROP_PRIORITY = "priority"
+
+
+class PacketPipeline:
+    """Receive datagrams on a dedicated thread and decode them on demand.
+
+    The receiver thread only pulls raw datagrams off the listener's socket
+    into a bounded queue, so that a slow consumer does not make the kernel
+    drop datagrams. Packets are decoded by ``get``, on the consumer side. A
+    pipeline can be used in place of a listener, e.g. with ``PacketHandler``.
+
+    When the queue is full, the ``drop`` policy decides which datagram goes:
+
+    - ``DROP_OLDEST`` drops the oldest queued datagram
+    - ``DROP_NEWEST`` drops the datagram just received
+    - ``DROP_PRIORITY`` drops the oldest queued datagram of the lowest
+      priority, as given by ``priorities`` (packet id -> priority, 0 by
+      default), or the datagram just received if everything queued has a
+      higher priority than it, e.g. ``priorities={3: 1}`` never drops event
+      packets in favour of other packets.
+
+    The number of datagrams dropped so far, by packet id, is in ``dropped``.
+    The ``only`` and ``backend`` of the listener are honoured, its ``pool``
+    and ``reuse`` are not, as datagrams are received as ``bytes``.
+    """
+
+    def __init__(
+        self,
+        listener: PacketListener,
+        maxsize: int = 1024,
+        drop: str = DROP_OLDEST,
+        priorities: t.Optional[t.Mapping[int, int]] = None,
+    ):
+        if drop not in (DROP_OLDEST, DROP_NEWEST, DROP_PRIORITY):
+            raise ValueError(f"Unknown drop policy {drop!r}")
+        if priorities is not None and drop != DROP_PRIORITY:
+            raise ValueError("Priorities require the DROP_PRIORITY policy")
+
+        self.listener = listener
+        self.maxsize = maxsize
+        self.drop = drop
+        self.priorities = priorities or {}
+        self.dropped: t.Counter[int] = collections.Counter()
+
+        # One queue of (sequence number, packet id, datagram) per priority
+        self._queues: t.Dict[int, t.Deque[t.Tuple[int, int, bytes]]] = {}
+        self._size = 0
+        self._sequence = 0
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread: t.Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._running = True
+        self._thread = threading.Thread(target=self._receive, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the receiver thread, once it is done with the datagram being
+        received."""
+        if self._thread is None:
+            return
+
+        self._running = False
+        # Wake the receiver thread up with an empty datagram
+        host, port = self.listener.socket.getsockname()
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.sendto(b"", (host if host != "0.0.0.0" else "127.0.0.1", port))
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def only(self) -> t.Optional[t.Container[int]]:
+        """The ``only`` of the listener, which takes effect on the next
+        datagram received when set, e.g. by a ``PacketHandler``"""
+        return self.listener.only
+
+    @only.setter
+    def only(self, only: t.Optional[t.Container[int]]) -> None:
+        self.listener.only = only
+
+    def _receive(self) -> None:
+        listener = self.listener
+        recv = listener.socket.recv
+        stats = listener.stats
+
+        while self._running:
+            try:
+                data = recv(2048)
+            except socket.timeout:
+                continue
+            if stats is not None:
+                stats.update(data)
+            if len(data) < PACKET_KEY.size:
+                continue
+
+            packet_id = PACKET_KEY.unpack_from(data)[2]
+            only = listener.only
+            if only is None or packet_id in only:
+                self._put(packet_id, data)
+
+    def _put(self, packet_id: int, data: bytes) -> None:
+        priority = self.priorities.get(packet_id, 0)
+
+        with self._condition:
+            if self._size >= self.maxsize:
+                if self.drop == DROP_NEWEST:
+                    self.dropped[packet_id] += 1
+                    return
+
+                lowest = min(_ for _, queue in self._queues.items() if queue)
+                if lowest > priority:
+                    self.dropped[packet_id] += 1
+                    return
+
+                _, dropped, _ = self._queues[lowest].popleft()
+                self.dropped[dropped] += 1
+                self._size -= 1
+
+            try:
+                queue = self._queues[priority]
+            except KeyError:
+                queue = self._queues[priority] = collections.deque()
+
+            queue.append((self._sequence, packet_id, data))
+            self._sequence += 1
+            self._size += 1
+            self._condition.notify()
+
+    def get_datagram(self, timeout: t.Optional[float] = None) -> t.Optional[bytes]:
+        """Returns the next raw datagram, in the order they were received, or
+        ``None`` on timeout."""
+        self.start()
+
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._size, timeout):
+                return None
+
+            # The oldest datagram is at the head of one of the queues
+            queue = min((_ for _ in self._queues.values() if _), key=lambda _: _[0][0])
+            self._size -= 1
+            return queue.popleft()[2]
+
+    def get(self):
+        while True:
+            packet = resolve(
+                self.get_datagram(),
+                only=self.listener.only,
+                backend=self.listener.backend,
+            )
+            if packet is not None:
+                return packet
+
+    def __iter__(self):
+        while True:
+            yield self.get()
@@ -0,0 +1,226 @@
+"""
+Streaming capture of raw datagrams to disk, and replay.
+
+A capture is a directory of append-only files, each starting with ``MAGIC``
+and followed by one record per datagram: a ``RECORD`` header with the
+receive time, the sender address and the datagram length, then the datagram
+itself. Writes are buffered and synced to disk periodically, even while no
+datagram arrives, so a crash loses at most the last ``fsync_interval``
+seconds, and files are rotated by
+size and age, so that sessions of any length can be captured ::
+
+    with PacketRecorder("captures/monza") as recorder:
+        recorder.record(PacketListener())
+
+    for timestamp, address, datagram in read("captures/monza"):
+        packet = resolve(datagram)
+"""
+
+import os
+import socket
+import struct
+import time
+import typing as t
+from pathlib import Path
+
+from f1.listener import PacketListener
+
+MAGIC = b"F1CAP\x00\x00\x01"
+# Receive time, IPv4 address and port of the sender, datagram length
+RECORD = struct.Struct("<d4sHH")
+SUFFIX = ".f1cap"
+
+
+class Record(t.NamedTuple):
+    timestamp: float
+    address: t.Tuple[str, int]
+    datagram: bytes
+
+
+class PacketRecorder:
+    """Append datagrams to the capture files of a directory.
+
+    Args:
+        path (str):
+            - The directory of the capture, created if needed
+        buffer_size (int):
+            - The size of the write buffer, in bytes
+        fsync_interval (float):
+            - How often buffered records are flushed and synced to disk, in
+              seconds
+        max_bytes (int):
+            - The size after which a new file is started, if given
+        max_age (float):
+            - The age in seconds after which a new file is started, if given
+
+    """
+
+    def __init__(
+        self,
+        path: t.Union[str, Path],
+        buffer_size: int = 1 << 20,
+        fsync_interval: float = 1.0,
+        max_bytes: t.Optional[int] = 1 << 30,
+        max_age: t.Optional[float] = None,
+        clock: t.Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.buffer_size = buffer_size
+        self.fsync_interval = fsync_interval
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.clock = clock
+        self.recorded = 0
+        self._file: t.Optional[t.BinaryIO] = None
+        self._size = 0
+        self._opened = 0.0
+        self._synced = 0.0
+        # Whether records were written since the last sync
+        self._dirty = False
+        self._sequence = 0
+
+    def _open(self, now: float) -> t.BinaryIO:
+        # Named after the time the file was started, so that they sort in
+        # order, with a sequence number for files started within a second
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.gmtime(now))
+        while True:
+            name = f"{stamp}-{self._sequence:04d}{SUFFIX}"
+            self._sequence += 1
+            try:
+                f = open(self.path / name, "xb", buffering=self.buffer_size)
+            except FileExistsError:
+                continue
+            break
+
+        f.write(MAGIC)
+        self._file = f
+        self._size = len(MAGIC)
+        self._opened = self._synced = now
+        return f
+
+    def _close_file(self) -> None:
+        if self._file is None:
+            return
+        self._sync()
+        self._file.close()
+        self._file = None
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._dirty = False
+
+    def write(
+        self,
+        datagram,
+        address: t.Tuple[str, int] = ("0.0.0.0", 0),
+        timestamp: t.Optional[float] = None,
+    ) -> None:
+        """Appends a datagram, received now unless ``timestamp`` is given"""
+        now = self.clock()
+        f = self._file
+        if f is None:
+            f = self._open(now)
+        elif (self.max_bytes is not None and self._size >= self.max_bytes) or (
+            self.max_age is not None and now - self._opened >= self.max_age
+        ):
+            self._close_file()
+            f = self._open(now)
+
+        host, port = address
+        f.write(
+            RECORD.pack(
+                now if timestamp is None else timestamp,
+                socket.inet_aton(host or "0.0.0.0"),
+                port,
+                len(datagram),
+            )
+        )
+        f.write(datagram)
+        self._size += RECORD.size + len(datagram)
+        self.recorded += 1
+        self._dirty = True
+
+        if now - self._synced >= self.fsync_interval:
+            self._sync()
+            self._synced = now
+
+    def record(self, listener: PacketListener, count: t.Optional[int] = None) -> None:
+        """Records the raw datagrams of a listener, forever or until ``count``
+        datagrams have been received. The ``only`` of the listener is not
+        applied, every datagram is recorded.
+
+        The socket of the listener times out at least every
+        ``fsync_interval`` seconds while recording, so that the records
+        buffered before an idle period are synced too."""
+        sock = listener.socket
+        timeout = sock.gettimeout()
+        if self.fsync_interval > 0 and (
+            timeout is None or timeout > self.fsync_interval
+        ):
+            sock.settimeout(self.fsync_interval)
+
+        recvfrom = sock.recvfrom
+        stats = listener.stats
+        write = self.write
+
+        received = 0
+        try:
+            while count is None or received < count:
+                try:
+                    datagram, address = recvfrom(2048)
+                except socket.timeout:
+                    self._idle()
+                    continue
+                if stats is not None:
+                    stats.update(datagram)
+                write(datagram, address)
+                received += 1
+        finally:
+            sock.settimeout(timeout)
+
+    def _idle(self) -> None:
+        now = self.clock()
+        if self._dirty and now - self._synced >= self.fsync_interval:
+            self._sync()
+            self._synced = now
+
+    def close(self) -> None:
+        self._close_file()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def files(path: t.Union[str, Path]) -> t.List[Path]:
+    """Returns the files of a capture directory, in the order they were
+    written, or the given file itself"""
+    path = Path(path)
+    if path.is_dir():
+        return sorted(path.glob(f"*{SUFFIX}"))
+    return [path]
+
+
+def read(path: t.Union[str, Path]) -> t.Iterator[Record]:
+    """Reads the records of a capture file or directory, one at a time.
+
+    A record truncated by a crash at the end of a file is ignored.
+    """
+    for name in files(path):
+        with open(name, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{name} is not a capture file")
+
+            while True:
+                header = f.read(RECORD.size)
+                if len(header) < RECORD.size:
+                    break
+                timestamp, host, port, size = RECORD.unpack(header)
+                datagram = f.read(size)
+                if len(datagram) < size:
+                    break
+                yield Record(timestamp, (socket.inet_ntoa(host), port), datagram)
@@ -0,0 +1,109 @@
+"""
+Raw UDP fan-out relay, to feed several consumers from the single telemetry
+port of the game.
+"""
+
+import socket
+import time
+import typing as t
+
+from f1.listener import PacketListener
+from f1.packets import PACKET_KEY
+
+
+class Destination:
+    """A relay destination.
+
+    Args:
+        address (Tuple[str, int]):
+            - The address to forward datagrams to
+        only (Container[int]):
+            - The packet ids to forward, or ``None`` to forward all of them
+        rate (float):
+            - The maximum number of datagrams of each packet id to forward per
+              second, or ``None`` for no limit. Datagrams over the limit are
+              skipped, e.g. a rate of 10 forwards one in 6 packets sent at
+              60Hz
+
+    """
+
+    __slots__ = ("address", "only", "interval", "forwarded", "skipped", "_last")
+
+    def __init__(
+        self,
+        address: t.Tuple[str, int],
+        only: t.Optional[t.Container[int]] = None,
+        rate: t.Optional[float] = None,
+    ):
+        self.address = address
+        self.only = only
+        self.interval = 1 / rate if rate else 0.0
+        self.forwarded = 0
+        self.skipped = 0
+        # packet id -> time of the last datagram forwarded
+        self._last: t.Dict[int, float] = {}
+
+
+class PacketRelay:
+    """Forward the raw datagrams received by a listener, unchanged, to several
+    destinations.
+
+    Datagrams are never decoded: the packet id is read straight from the
+    header to apply the filter and rate limit of every destination. The
+    datagrams are sent from the listener's socket.
+    """
+
+    def __init__(
+        self,
+        listener: PacketListener,
+        destinations: t.Iterable[Destination],
+        clock: t.Callable[[], float] = time.monotonic,
+    ):
+        self.listener = listener
+        self.destinations = list(destinations)
+        self.clock = clock
+
+    def forward(self, datagram) -> None:
+        """Forwards a raw datagram to the destinations that want it"""
+        if len(datagram) < PACKET_KEY.size:
+            return
+
+        # The packet id is the 7th byte of the header
+        packet_id = datagram[6]
+        sendto = self.listener.socket.sendto
+        now = None
+
+        for destination in self.destinations:
+            only = destination.only
+            if only is not None and packet_id not in only:
+                continue
+
+            if destination.interval:
+                if now is None:
+                    now = self.clock()
+                last = destination._last.get(packet_id)
+                if last is not None and now - last < destination.interval:
+                    destination.skipped += 1
+                    continue
+                destination._last[packet_id] = now
+
+            sendto(datagram, destination.address)
+            destination.forwarded += 1
+
+    def run(self, count: t.Optional[int] = None) -> None:
+        """Relays datagrams, forever or until ``count`` datagrams have been
+        received."""
+        recv = self.listener.socket.recv
+        stats = self.listener.stats
+        forward = self.forward
+
+        received = 0
+        while count is None or received < count:
+            try:
+                datagram = recv(2048)
+            except socket.timeout:
+                continue
+            if stats is not None:
+                stats.update(datagram)
+            forward(datagram)
+            received += 1
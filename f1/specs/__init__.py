@@ -0,0 +1,101 @@
+"""
+Registry of the packet specs of every supported game, by packet format.
+
+The packet types of each spec live in a generated ``f1_<packet format>``
+module, which is only imported when its first packet is resolved, so a
+process only pays for the packet formats it actually receives. Within a spec
+module, the packet types are themselves only built on first use.
+
+This module is imported by ``f1.packets`` and is kept free of heavier imports,
+such as ``typing``, to keep that import cheap.
+"""
+
+import importlib
+import threading
+from collections.abc import Mapping
+
+# Packet format -> spec module, or None for unsupported formats
+SPECS = {}
+
+# Packet formats with a generated spec module, oldest first
+FORMATS = (2025,)
+
+LATEST = FORMATS[-1]
+
+
+def load(packet_format):
+    """Returns the spec module of a packet format, importing it on first use.
+
+    Returns ``None`` if the packet format is not supported.
+    """
+    try:
+        return SPECS[packet_format]
+    except KeyError:
+        pass
+
+    spec = SPECS[packet_format] = (
+        importlib.import_module(f"{__name__}.f1_{packet_format}")
+        if packet_format in FORMATS
+        else None
+    )
+
+    return spec
+
+
+def lazy_getattr(namespace, builders):
+    """Returns a module ``__getattr__`` that builds packet types on first use.
+
+    Args:
+        namespace (dict):
+            - The ``globals()`` of the spec module
+        builders (dict):
+            - Maps the name of every lazily built type to the function that
+              builds it, along with the other types it depends on
+
+    """
+    module = namespace["__name__"]
+    lock = threading.Lock()
+
+    def __getattr__(name):
+        try:
+            build = builders[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {module!r} has no attribute {name!r}"
+            ) from None
+
+        with lock:
+            # Another thread may have built it while waiting for the lock
+            if name not in namespace:
+                for _type in build():
+                    # Make the types look as if defined at the module level,
+                    # e.g. for pickle to find them
+                    _type.__qualname__ = _type.__name__
+                    namespace[_type.__name__] = _type
+
+        return namespace[name]
+
+    return __getattr__
+
+
+class PacketTypes(Mapping):
+    """The ``HEADER_FIELD_TO_PACKET_TYPE`` of a spec, which only builds the
+    packet types that are looked up."""
+
+    def __init__(self, module, names):
+        self._module = module
+        self._names = names
+
+    def __getitem__(self, key):
+        return getattr(importlib.import_module(self._module), self._names[key])
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def packet_ids(self):
+        """Returns the packet id of every packet type, by name, without
+        building them"""
+        return {name: key[2] for key, name in self._names.items()}
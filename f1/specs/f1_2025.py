@@ -0,0 +1,808 @@
+"""
+Packet types of the F1 25 UDP specification, for packet format 2025.
+"""
+
+import ctypes
+
+from f1 import specs
+from f1.packets import Packet
+from f1.packets import PacketMixin
+
+
+# [[[cog
+# import sys; sys.path.append("./scripts"); import genspec; genspec.emit_ctypes(2025)
+# ]]]
+class PacketHeader(Packet):
+    _fields_ = [
+        ("packet_format", ctypes.c_uint16),
+        ("game_year", ctypes.c_uint8),
+        ("game_major_version", ctypes.c_uint8),
+        ("game_minor_version", ctypes.c_uint8),
+        ("packet_version", ctypes.c_uint8),
+        ("packet_id", ctypes.c_uint8),
+        ("session_uid", ctypes.c_uint64),
+        ("session_time", ctypes.c_float),
+        ("frame_identifier", ctypes.c_uint32),
+        ("overall_frame_identifier", ctypes.c_uint32),
+        ("player_car_index", ctypes.c_uint8),
+        ("secondary_player_car_index", ctypes.c_uint8),
+    ]
+
+
+def _build_packet_motion_data():
+    class CarMotionData(Packet):
+        _fields_ = [
+            ("world_position_x", ctypes.c_float),
+            ("world_position_y", ctypes.c_float),
+            ("world_position_z", ctypes.c_float),
+            ("world_velocity_x", ctypes.c_float),
+            ("world_velocity_y", ctypes.c_float),
+            ("world_velocity_z", ctypes.c_float),
+            ("world_forward_dir_x", ctypes.c_int16),
+            ("world_forward_dir_y", ctypes.c_int16),
+            ("world_forward_dir_z", ctypes.c_int16),
+            ("world_right_dir_x", ctypes.c_int16),
+            ("world_right_dir_y", ctypes.c_int16),
+            ("world_right_dir_z", ctypes.c_int16),
+            ("g_force_lateral", ctypes.c_float),
+            ("g_force_longitudinal", ctypes.c_float),
+            ("g_force_vertical", ctypes.c_float),
+            ("yaw", ctypes.c_float),
+            ("pitch", ctypes.c_float),
+            ("roll", ctypes.c_float),
+        ]
+
+    class PacketMotionData(Packet):
+        _fields_ = [
+            ("header", PacketHeader),
+            ("car_motion_data", CarMotionData * 22),
+        ]
+
+    return CarMotionData, PacketMotionData
+
+
+def _build_packet_session_data():
+    class MarshalZone(Packet):
+        _fields_ = [
+            ("zone_start", ctypes.c_float),
+            ("zone_flag", ctypes.c_int8),
+        ]
+
+    class WeatherForecastSample(Packet):
+        _fields_ = [
+            ("session_type", ctypes.c_uint8),
+            ("time_offset", ctypes.c_uint8),
+            ("weather", ctypes.c_uint8),
+            ("track_temperature", ctypes.c_int8),
+            ("track_temperature_change", ctypes.c_int8),
+            ("air_temperature", ctypes.c_int8),
+            ("air_temperature_change", ctypes.c_int8),
+            ("rain_percentage", ctypes.c_uint8),
+        ]
+
+    class PacketSessionData(Packet):
+        _fields_ = [
+            ("header", PacketHeader),
+            ("weather", ctypes.c_uint8),
+            ("track_temperature", ctypes.c_int8),
+            ("air_temperature", ctypes.c_int8),
+            ("total_laps", ctypes.c_uint8),
+            ("track_length", ctypes.c_uint16),
+            ("session_type", ctypes.c_uint8),
+            ("track_id", ctypes.c_int8),
+            ("formula", ctypes.c_uint8),
+            ("session_time_left", ctypes.c_uint16),
+            ("session_duration", ctypes.c_uint16),
+            ("pit_speed_limit", ctypes.c_uint8),
+            ("game_paused", ctypes.c_uint8),
+            ("is_spectating", ctypes.c_uint8),
+            ("spectator_car_index", ctypes.c_uint8),
+            ("sli_pro_native_support", ctypes.c_uint8),
+            ("num_marshal_zones", ctypes.c_uint8),
+            ("marshal_zones", MarshalZone * 21),
+            ("safety_car_status", ctypes.c_uint8),
+            ("network_game", ctypes.c_uint8),
+            ("num_weather_forecast_samples", ctypes.c_uint8),
+            ("weather_forecast_samples", WeatherForecastSample * 64),
+            ("forecast_accuracy", ctypes.c_uint8),
+            ("ai_difficulty", ctypes.c_uint8),
+            ("season_link_identifier", ctypes.c_uint32),
+            ("weekend_link_identifier", ctypes.c_uint32),
+            ("session_link_identifier", ctypes.c_uint32),
+            ("pit_stop_window_ideal_lap", ctypes.c_uint8),
+            ("pit_stop_window_latest_lap", ctypes.c_uint8),
+            ("pit_stop_rejoin_position", ctypes.c_uint8),
+            ("steering_assist", ctypes.c_uint8),
+            ("braking_assist", ctypes.c_uint8),
+            ("gearbox_assist", ctypes.c_uint8),
+            ("pit_assist", ctypes.c_uint8),
+            ("pit_release_assist", ctypes.c_uint8),
+            ("ers_assist", ctypes.c_uint8),
+            ("drs_assist", ctypes.c_uint8),
+            ("dynamic_racing_line", ctypes.c_uint8),
+            ("dynamic_racing_line_type", ctypes.c_uint8),
+            ("game_mode", ctypes.c_uint8),
+            ("rule_set", ctypes.c_uint8),
+            ("time_of_day", ctypes.c_uint32),
+            ("session_length", ctypes.c_uint8),
+            ("speed_units_lead_player", ctypes.c_uint8),
+            ("temperature_units_lead_player", ctypes.c_uint8),
+            ("speed_units_secondary_player", ctypes.c_uint8),
+            ("temperature_units_secondary_player", ctypes.c_uint8),
+            ("num_safety_car_periods", ctypes.c_uint8),
+            ("num_virtual_safety_car_periods", ctypes.c_uint8),
+            ("num_red_flag_periods", ctypes.c_uint8),
+            ("equal_car_performance", ctypes.c_uint8),
+            ("recovery_mode", ctypes.c_uint8),
+            ("flashback_limit", ctypes.c_uint8),
+            ("surface_type", ctypes.c_uint8),
+            ("low_fuel_mode", ctypes.c_uint8),
+            ("race_starts", ctypes.c_uint8),
+            ("tyre_temperature", ctypes.c_uint8),
+            ("pit_lane_tyre_sim", ctypes.c_uint8),
+            ("car_damage", ctypes.c_uint8),
+            ("car_damage_rate", ctypes.c_uint8),
+            ("collisions", ctypes.c_uint8),
+            ("collisions_off_for_first_lap_only", ctypes.c_uint8),
+            ("mp_unsafe_pit_release", ctypes.c_uint8),
+            ("mp_off_for_griefing", ctypes.c_uint8),
+            ("corner_cutting_stringency", ctypes.c_uint8),
+            ("parc_ferme_rules", ctypes.c_uint8),
+            ("pit_stop_experience", ctypes.c_uint8),
+            ("safety_car", ctypes.c_uint8),
+            ("safety_car_experience", ctypes.c_uint8),
+            ("formation_lap", ctypes.c_uint8),
+            ("formation_lap_experience", ctypes.c_uint8),
+            ("red_flags", ctypes.c_uint8),
+            ("affects_licence_level_solo", ctypes.c_uint8),
+            ("affects_licence_level_mp", ctypes.c_uint8),
+            ("num_sessions_in_weekend", ctypes.c_uint8),
+            ("weekend_structure", ctypes.c_uint8 * 12),
+            ("sector2_lap_distance_start", ctypes.c_float),
+            ("sector3_lap_distance_start", ctypes.c_float),
+        ]
+
+    return MarshalZone, WeatherForecastSample, PacketSessionData
+
+
+def _build_packet_lap_data():
+    class LapData(Packet):
+        _fields_ = [
+            ("last_lap_time_in_ms", ctypes.c_uint32),
+            ("current_lap_time_in_ms", ctypes.c_uint32),
+            ("sector1_time_ms_part", ctypes.c_uint16),
+            ("sector1_time_minutes_part", ctypes.c_uint8),
+            ("sector2_time_ms_part", ctypes.c_uint16),
+            ("sector2_time_minutes_part", ctypes.c_uint8),
+            ("delta_to_car_in_front_ms_part", ctypes.c_uint16),
+            ("delta_to_car_in_front_minutes_part", ctypes.c_uint8),
+            ("delta_to_race_leader_ms_part", ctypes.c_uint16),
+            ("delta_to_race_leader_minutes_part", ctypes.c_uint8),
+            ("lap_distance", ctypes.c_float),
+            ("total_distance", ctypes.c_float),
+            ("safety_car_delta", ctypes.c_float),
+            ("car_position", ctypes.c_uint8),
+            ("current_lap_num", ctypes.c_uint8),
+            ("pit_status", ctypes.c_uint8),
+            ("num_pit_stops", ctypes.c_uint8),
+            ("sector", ctypes.c_uint8),
+            ("current_lap_invalid", ctypes.c_uint8),
+            ("penalties", ctypes.c_uint8),
+            ("total_warnings", ctypes.c_uint8),
+            ("corner_cutting_warnings", ctypes.c_uint8),
+            ("num_unserved_drive_through_pens", ctypes.c_uint8),
+            ("num_unserved_stop_go_pens", ctypes.c_uint8),
+            ("grid_position", ctypes.c_uint8),
+            ("driver_status", ctypes.c_uint8),
+            ("result_status", ctypes.c_uint8),
+            ("pit_lane_timer_active", ctypes.c_uint8),
+            ("pit_lane_time_in_lane_in_ms", ctypes.c_uint16),
+            ("pit_stop_timer_in_ms", ctypes.c_uint16),
+            ("pit_stop_should_serve_pen", ctypes.c_uint8),
+            ("speed_trap_fastest_speed", ctypes.c_float),
+            ("speed_trap_fastest_lap", ctypes.c_uint8),
+        ]
+
+    class PacketLapData(Packet):
+        _fields_ = [
+            ("header", PacketHeader),
+            ("lap_data", LapData * 22),
+            ("time_trial_pb_car_idx", ctypes.c_uint8),
+            ("time_trial_rival_car_idx", ctypes.c_uint8),
+        ]
+
+    return LapData, PacketLapData
+
+
+def _build_packet_event_data():
+    class FastestLap(Packet):
+        _fields_ = [
+            ("vehicle_idx", ctypes.c_uint8),
+            ("lap_time", ctypes.c_float),
+        ]
+
+    class Retirement(Packet):
+        _fields_ = [
+            ("vehicle_idx", ctypes.c_uint8),
+            ("reason", ctypes.c_uint8),
+        ]
+
+    class DrsDisabled(Packet):
+        _fields_ = [
+            ("reason", ctypes.c_uint8),
+        ]
+
+    class TeamMateInPits(Packet):
+        _fields_ = [
+            ("vehicle_idx", ctypes.c_uint8),
+        ]
+
+    class RaceWinner(Packet):
+        _fields_ = [
+            ("vehicle_idx", ctypes.c_uint8),
+        ]
+
+    class Penalty(Packet):
+        _fields_ = [
+            ("penalty_type", ctypes.c_uint8),
+            ("infringement_type", ctypes.c_uint8),
+            ("vehicle_idx", ctypes.c_uint8),
+            ("other_vehicle_idx", ctypes.c_uint8),
+            ("time", ctypes.c_uint8),
+            ("lap_num", ctypes.c_uint8),
+            ("places_gained", ctypes.c_uint8),
+        ]
+
+    class SpeedTrap(Packet):
+        _fields_ = [
+            ("vehicle_idx", ctypes.c_uint8),
+            ("speed", ctypes.c_float),
+            ("is_overall_fastest_in_session", ctypes.c_uint8),
+            ("is_driver_fastest_in_session", ctypes.c_uint8),
+            ("fastest_vehicle_idx_in_session", ctypes.c_uint8),
+            ("fastest_speed_in_session", ctypes.c_float),
+        ]
+
+    class StartLights(Packet):
+        _fields_ = [
+            ("num_lights", ctypes.c_uint8),
+        ]
+
+    class DriveThroughPenaltyServed(Packet):
+        _fields_ = [
+            ("vehicle_idx", ctypes.c_uint8),
+        ]
+
+    class StopGoPenaltyServed(Packet):
+        _fields_ = [
+            ("vehicle_idx", ctypes.c_uint8),
+            ("stop_time", ctypes.c_float),
+        ]
+
+    class Flashback(Packet):
+        _fields_ = [
+            ("flashback_frame_identifier", ctypes.c_uint32),
+            ("flashback_session_time", ctypes.c_float),
+        ]
+
+    class Buttons(Packet):
+        _fields_ = [
+            ("button_status", ctypes.c_uint32),
+        ]
+
+    class Overtake(Packet):
+        _fields_ = [
+            ("overtaking_vehicle_idx", ctypes.c_uint8),
+            ("being_overtaken_vehicle_idx", ctypes.c_uint8),
+        ]
+
+    class SafetyCar(Packet):
+        _fields_ = [
+            ("safety_car_type", ctypes.c_uint8),
+            ("event_type", ctypes.c_uint8),
+        ]
+
+    class Collision(Packet):
+        _fields_ = [
+            ("vehicle1_idx", ctypes.c_uint8),
+            ("vehicle2_idx", ctypes.c_uint8),
+        ]
+
+    class EventDataDetails(ctypes.Union, PacketMixin):
+        _fields_ = [
+            ("fastest_lap", FastestLap),
+            ("retirement", Retirement),
+            ("drs_disabled", DrsDisabled),
+            ("team_mate_in_pits", TeamMateInPits),
+            ("race_winner", RaceWinner),
+            ("penalty", Penalty),
+            ("speed_trap", SpeedTrap),
+            ("start_lights", StartLights),
+            ("drive_through_penalty_served", DriveThroughPenaltyServed),
+            ("stop_go_penalty_served", StopGoPenaltyServed),
+            ("flashback", Flashback),
+            ("buttons", Buttons),
+            ("overtake", Overtake),
+            ("safety_car", SafetyCar),
+            ("collision", Collision),
+        ]
+
+    class PacketEventData(Packet):
+        _fields_ = [
+            ("header", PacketHeader),
+            ("event_string_code", ctypes.c_uint8 * 4),
+            ("event_details", EventDataDetails),
+        ]
+
+    return (
+        FastestLap,
+        Retirement,
+        DrsDisabled,
+        TeamMateInPits,
+        RaceWinner,
+        Penalty,
+        SpeedTrap,
+        StartLights,
+        DriveThroughPenaltyServed,
+        StopGoPenaltyServed,
+        Flashback,
+        Buttons,
+        Overtake,
+        SafetyCar,
+        Collision,
+        EventDataDetails,
+        PacketEventData,
+    )
+
+
+def _build_packet_participants_data():
+    class LiveryColour(Packet):
+        _fields_ = [
+            ("red", ctypes.c_uint8),
+            ("green", ctypes.c_uint8),
+            ("blue", ctypes.c_uint8),
+        ]
+
+    class ParticipantData(Packet):
+        _fields_ = [
+            ("ai_controlled", ctypes.c_uint8),
+            ("driver_id", ctypes.c_uint8),
+            ("network_id", ctypes.c_uint8),
+            ("team_id", ctypes.c_uint8),
+            ("my_team", ctypes.c_uint8),
+            ("race_number", ctypes.c_uint8),
+            ("nationality", ctypes.c_uint8),
+            ("name", ctypes.c_char * 32),
+            ("your_telemetry", ctypes.c_uint8),
+            ("show_online_names", ctypes.c_uint8),
+            ("tech_level", ctypes.c_uint16),
+            ("platform", ctypes.c_uint8),
+            ("num_colours", ctypes.c_uint8),
+            ("livery_colours", LiveryColour * 4),
+        ]
+
+    class PacketParticipantsData(Packet):
+        _fields_ = [
+            ("header", PacketHeader),
+            ("num_active_cars", ctypes.c_uint8),
+            ("participants", ParticipantData * 22),
+        ]
+
+    return LiveryColour, ParticipantData, PacketParticipantsData
+
+
+def _build_packet_car_setup_data():
+    class CarSetupData(Packet):
+        _fields_ = [
+            ("front_wing", ctypes.c_uint8),
+            ("rear_wing", ctypes.c_uint8),
+            ("on_throttle", ctypes.c_uint8),
+            ("off_throttle", ctypes.c_uint8),
+            ("front_camber", ctypes.c_float),
+            ("rear_camber", ctypes.c_float),
+            ("front_toe", ctypes.c_float),
+            ("rear_toe", ctypes.c_float),
+            ("front_suspension", ctypes.c_uint8),
+            ("rear_suspension", ctypes.c_uint8),
+            ("front_anti_roll_bar", ctypes.c_uint8),
+            ("rear_anti_roll_bar", ctypes.c_uint8),
+            ("front_suspension_height", ctypes.c_uint8),
+            ("rear_suspension_height", ctypes.c_uint8),
+            ("brake_pressure", ctypes.c_uint8),
+            ("brake_bias", ctypes.c_uint8),
+            ("engine_braking", ctypes.c_uint8),
+            ("rear_left_tyre_pressure", ctypes.c_float),
+            ("rear_right_tyre_pressure", ctypes.c_float),
+            ("front_left_tyre_pressure", ctypes.c_float),
+            ("front_right_tyre_pressure", ctypes.c_float),
+            ("ballast", ctypes.c_uint8),
+            ("fuel_load", ctypes.c_float),
+        ]
+
+    class PacketCarSetupData(Packet):
+        _fields_ = [
+            ("header", PacketHeader),
+            ("car_setup_data", CarSetupData * 22),
+            ("next_front_wing_value", ctypes.c_float),
+        ]
+
+    return CarSetupData, PacketCarSetupData
+
+
+def _build_packet_car_telemetry_data():
+    class CarTelemetryData(Packet):
+        _fields_ = [
+            ("speed", ctypes.c_uint16),
+            ("throttle", ctypes.c_float),
+            ("steer", ctypes.c_float),
+            ("brake", ctypes.c_float),
+            ("clutch", ctypes.c_uint8),
+            ("gear", ctypes.c_int8),
+            ("engine_rpm", ctypes.c_uint16),
+            ("drs", ctypes.c_uint8),
+            ("rev_lights_percent", ctypes.c_uint8),
+            ("rev_lights_bit_value", ctypes.c_uint16),
+            ("brakes_temperature", ctypes.c_uint16 * 4),
+            ("tyres_surface_temperature", ctypes.c_uint8 * 4),
+            ("tyres_inner_temperature", ctypes.c_uint8 * 4),
+            ("engine_temperature", ctypes.c_uint16),
+            ("tyres_pressure", ctypes.c_float * 4),
+            ("surface_type", ctypes.c_uint8 * 4),
+        ]
+
+    class PacketCarTelemetryData(Packet):
+        _fields_ = [
+            ("header", PacketHeader),
+            ("car_telemetry_data", CarTelemetryData * 22),
+            ("mfd_panel_index", ctypes.c_uint8),
+            ("mfd_panel_index_secondary_player", ctypes.c_uint8),
+            ("suggested_gear", ctypes.c_int8),
+        ]
+
+    return CarTelemetryData, PacketCarTelemetryData
+
+
+def _build_packet_car_status_data():
+    class CarStatusData(Packet):
+        _fields_ = [
+            ("traction_control", ctypes.c_uint8),
+            ("anti_lock_brakes", ctypes.c_uint8),
+            ("fuel_mix", ctypes.c_uint8),
+            ("front_brake_bias", ctypes.c_uint8),
+            ("pit_limiter_status", ctypes.c_uint8),
+            ("fuel_in_tank", ctypes.c_float),
+            ("fuel_capacity", ctypes.c_float),
+            ("fuel_remaining_laps", ctypes.c_float),
+            ("max_rpm", ctypes.c_uint16),
+            ("idle_rpm", ctypes.c_uint16),
+            ("max_gears", ctypes.c_uint8),
+            ("drs_allowed", ctypes.c_uint8),
+            ("drs_activation_distance", ctypes.c_uint16),
+            ("actual_tyre_compound", ctypes.c_uint8),
+            ("visual_tyre_compound", ctypes.c_uint8),
+            ("tyres_age_laps", ctypes.c_uint8),
+            ("vehicle_fia_flags", ctypes.c_int8),
+            ("engine_power_ice", ctypes.c_float),
+            ("engine_power_mguk", ctypes.c_float),
+            ("ers_store_energy", ctypes.c_float),
+            ("ers_deploy_mode", ctypes.c_uint8),
+            ("ers_harvested_this_lap_mguk", ctypes.c_float),
+            ("ers_harvested_this_lap_mguh", ctypes.c_float),
+            ("ers_deployed_this_lap", ctypes.c_float),
+            ("network_paused", ctypes.c_uint8),
+        ]
+
+    class PacketCarStatusData(Packet):
+        _fields_ = [
+            ("header", PacketHeader),
+            ("car_status_data", CarStatusData * 22),
+        ]
+
+    return CarStatusData, PacketCarStatusData
+
+
+def _build_packet_final_classification_data():
+    class FinalClassificationData(Packet):
+        _fields_ = [
+            ("position", ctypes.c_uint8),
+            ("num_laps", ctypes.c_uint8),
+            ("grid_position", ctypes.c_uint8),
+            ("points", ctypes.c_uint8),
+            ("num_pit_stops", ctypes.c_uint8),
+            ("result_status", ctypes.c_uint8),
+            ("result_reason", ctypes.c_uint8),
+            ("best_lap_time_in_ms", ctypes.c_uint32),
+            ("total_race_time", ctypes.c_double),
+            ("penalties_time", ctypes.c_uint8),
+            ("num_penalties", ctypes.c_uint8),
+            ("num_tyre_stints", ctypes.c_uint8),
+            ("tyre_stints_actual", ctypes.c_uint8 * 8),
+            ("tyre_stints_visual", ctypes.c_uint8 * 8),
+            ("tyre_stints_end_laps", ctypes.c_uint8 * 8),
+        ]
+
+    class PacketFinalClassificationData(Packet):
+        _fields_ = [
+            ("header", PacketHeader),
+            ("num_cars", ctypes.c_uint8),
+            ("classification_data", FinalClassificationData * 22),
+        ]
+
+    return FinalClassificationData, PacketFinalClassificationData
+
+
+def _build_packet_lobby_info_data():
+    class LobbyInfoData(Packet):
+        _fields_ = [
+            ("ai_controlled", ctypes.c_uint8),
+            ("team_id", ctypes.c_uint8),
+            ("nationality", ctypes.c_uint8),
+            ("platform", ctypes.c_uint8),
+            ("name", ctypes.c_char * 32),
+            ("car_number", ctypes.c_uint8),
+            ("your_telemetry", ctypes.c_uint8),
+            ("show_online_names", ctypes.c_uint8),
+            ("tech_level", ctypes.c_uint16),
+            ("ready_status", ctypes.c_uint8),
+        ]
+
+    class PacketLobbyInfoData(Packet):
+        _fields_ = [
+            ("header", PacketHeader),
+            ("num_players", ctypes.c_uint8),
+            ("lobby_players", LobbyInfoData * 22),
+        ]
+
+    return LobbyInfoData, PacketLobbyInfoData
+
+
+def _build_packet_car_damage_data():
+    class CarDamageData(Packet):
+        _fields_ = [
+            ("tyres_wear", ctypes.c_float * 4),
+            ("tyres_damage", ctypes.c_uint8 * 4),
+            ("brakes_damage", ctypes.c_uint8 * 4),
+            ("tyre_blisters", ctypes.c_uint8 * 4),
+            ("front_left_wing_damage", ctypes.c_uint8),
+            ("front_right_wing_damage", ctypes.c_uint8),
+            ("rear_wing_damage", ctypes.c_uint8),
+            ("floor_damage", ctypes.c_uint8),
+            ("diffuser_damage", ctypes.c_uint8),
+            ("sidepod_damage", ctypes.c_uint8),
+            ("drs_fault", ctypes.c_uint8),
+            ("ers_fault", ctypes.c_uint8),
+            ("gear_box_damage", ctypes.c_uint8),
+            ("engine_damage", ctypes.c_uint8),
+            ("engine_mguh_wear", ctypes.c_uint8),
+            ("engine_es_wear", ctypes.c_uint8),
+            ("engine_ce_wear", ctypes.c_uint8),
+            ("engine_ice_wear", ctypes.c_uint8),
+            ("engine_mguk_wear", ctypes.c_uint8),
+            ("engine_tc_wear", ctypes.c_uint8),
+            ("engine_blown", ctypes.c_uint8),
+            ("engine_seized", ctypes.c_uint8),
+        ]
+
+    class PacketCarDamageData(Packet):
+        _fields_ = [
+            ("header", PacketHeader),
+            ("car_damage_data", CarDamageData * 22),
+        ]
+
+    return CarDamageData, PacketCarDamageData
+
+
+def _build_packet_session_history_data():
+    class LapHistoryData(Packet):
+        _fields_ = [
+            ("lap_time_in_ms", ctypes.c_uint32),
+            ("sector1_time_ms_part", ctypes.c_uint16),
+            ("sector1_time_minutes_part", ctypes.c_uint8),
+            ("sector2_time_ms_part", ctypes.c_uint16),
+            ("sector2_time_minutes_part", ctypes.c_uint8),
+            ("sector3_time_ms_part", ctypes.c_uint16),
+            ("sector3_time_minutes_part", ctypes.c_uint8),
+            ("lap_valid_bit_flags", ctypes.c_uint8),
+        ]
+
+    class TyreStintHistoryData(Packet):
+        _fields_ = [
+            ("end_lap", ctypes.c_uint8),
+            ("tyre_actual_compound", ctypes.c_uint8),
+            ("tyre_visual_compound", ctypes.c_uint8),
+        ]
+
+    class PacketSessionHistoryData(Packet):
+        _fields_ = [
+            ("header", PacketHeader),
+            ("car_idx", ctypes.c_uint8),
+            ("num_laps", ctypes.c_uint8),
+            ("num_tyre_stints", ctypes.c_uint8),
+            ("best_lap_time_lap_num", ctypes.c_uint8),
+            ("best_sector1_lap_num", ctypes.c_uint8),
+            ("best_sector2_lap_num", ctypes.c_uint8),
+            ("best_sector3_lap_num", ctypes.c_uint8),
+            ("lap_history_data", LapHistoryData * 100),
+            ("tyre_stints_history_data", TyreStintHistoryData * 8),
+        ]
+
+    return LapHistoryData, TyreStintHistoryData, PacketSessionHistoryData
+
+
+def _build_packet_tyre_sets_data():
+    class TyreSetData(Packet):
+        _fields_ = [
+            ("actual_tyre_compound", ctypes.c_uint8),
+            ("visual_tyre_compound", ctypes.c_uint8),
+            ("wear", ctypes.c_uint8),
+            ("available", ctypes.c_uint8),
+            ("recommended_session", ctypes.c_uint8),
+            ("life_span", ctypes.c_uint8),
+            ("usable_life", ctypes.c_uint8),
+            ("lap_delta_time", ctypes.c_int16),
+            ("fitted", ctypes.c_uint8),
+        ]
+
+    class PacketTyreSetsData(Packet):
+        _fields_ = [
+            ("header", PacketHeader),
+            ("car_idx", ctypes.c_uint8),
+            ("tyre_set_data", TyreSetData * 20),
+            ("fitted_idx", ctypes.c_uint8),
+        ]
+
+    return TyreSetData, PacketTyreSetsData
+
+
+def _build_packet_motion_ex_data():
+    class PacketMotionExData(Packet):
+        _fields_ = [
+            ("header", PacketHeader),
+            ("suspension_position", ctypes.c_float * 4),
+            ("suspension_velocity", ctypes.c_float * 4),
+            ("suspension_acceleration", ctypes.c_float * 4),
+            ("wheel_speed", ctypes.c_float * 4),
+            ("wheel_slip_ratio", ctypes.c_float * 4),
+            ("wheel_slip_angle", ctypes.c_float * 4),
+            ("wheel_lat_force", ctypes.c_float * 4),
+            ("wheel_long_force", ctypes.c_float * 4),
+            ("height_of_cog_above_ground", ctypes.c_float),
+            ("local_velocity_x", ctypes.c_float),
+            ("local_velocity_y", ctypes.c_float),
+            ("local_velocity_z", ctypes.c_float),
+            ("angular_velocity_x", ctypes.c_float),
+            ("angular_velocity_y", ctypes.c_float),
+            ("angular_velocity_z", ctypes.c_float),
+            ("angular_acceleration_x", ctypes.c_float),
+            ("angular_acceleration_y", ctypes.c_float),
+            ("angular_acceleration_z", ctypes.c_float),
+            ("front_wheels_angle", ctypes.c_float),
+            ("wheel_vert_force", ctypes.c_float * 4),
+            ("front_aero_height", ctypes.c_float),
+            ("rear_aero_height", ctypes.c_float),
+            ("front_roll_angle", ctypes.c_float),
+            ("rear_roll_angle", ctypes.c_float),
+            ("chassis_yaw", ctypes.c_float),
+            ("chassis_pitch", ctypes.c_float),
+            ("wheel_camber", ctypes.c_float * 4),
+            ("wheel_camber_gain", ctypes.c_float * 4),
+        ]
+
+    return (PacketMotionExData,)
+
+
+def _build_packet_time_trial_data():
+    class TimeTrialDataSet(Packet):
+        _fields_ = [
+            ("car_idx", ctypes.c_uint8),
+            ("team_id", ctypes.c_uint8),
+            ("lap_time_in_ms", ctypes.c_uint),
+            ("sector1_time_in_ms", ctypes.c_uint),
+            ("sector2_time_in_ms", ctypes.c_uint),
+            ("sector3_time_in_ms", ctypes.c_uint),
+            ("traction_control", ctypes.c_uint8),
+            ("gearbox_assist", ctypes.c_uint8),
+            ("anti_lock_brakes", ctypes.c_uint8),
+            ("equal_car_performance", ctypes.c_uint8),
+            ("custom_setup", ctypes.c_uint8),
+            ("valid", ctypes.c_uint8),
+        ]
+
+    class PacketTimeTrialData(Packet):
+        _fields_ = [
+            ("header", PacketHeader),
+            ("player_session_best_data_set", TimeTrialDataSet),
+            ("personal_best_data_set", TimeTrialDataSet),
+            ("rival_data_set", TimeTrialDataSet),
+        ]
+
+    return TimeTrialDataSet, PacketTimeTrialData
+
+
+def _build_packet_lap_positions_data():
+    class PacketLapPositionsData(Packet):
+        _fields_ = [
+            ("header", PacketHeader),
+            ("num_laps", ctypes.c_uint8),
+            ("lap_start", ctypes.c_uint8),
+            ("position_for_vehicle_idx", ctypes.c_uint8 * 1100),
+        ]
+
+    return (PacketLapPositionsData,)
+
+
+_BUILDERS = {
+    "CarMotionData": _build_packet_motion_data,
+    "PacketMotionData": _build_packet_motion_data,
+    "MarshalZone": _build_packet_session_data,
+    "WeatherForecastSample": _build_packet_session_data,
+    "PacketSessionData": _build_packet_session_data,
+    "LapData": _build_packet_lap_data,
+    "PacketLapData": _build_packet_lap_data,
+    "FastestLap": _build_packet_event_data,
+    "Retirement": _build_packet_event_data,
+    "DrsDisabled": _build_packet_event_data,
+    "TeamMateInPits": _build_packet_event_data,
+    "RaceWinner": _build_packet_event_data,
+    "Penalty": _build_packet_event_data,
+    "SpeedTrap": _build_packet_event_data,
+    "StartLights": _build_packet_event_data,
+    "DriveThroughPenaltyServed": _build_packet_event_data,
+    "StopGoPenaltyServed": _build_packet_event_data,
+    "Flashback": _build_packet_event_data,
+    "Buttons": _build_packet_event_data,
+    "Overtake": _build_packet_event_data,
+    "SafetyCar": _build_packet_event_data,
+    "Collision": _build_packet_event_data,
+    "EventDataDetails": _build_packet_event_data,
+    "PacketEventData": _build_packet_event_data,
+    "LiveryColour": _build_packet_participants_data,
+    "ParticipantData": _build_packet_participants_data,
+    "PacketParticipantsData": _build_packet_participants_data,
+    "CarSetupData": _build_packet_car_setup_data,
+    "PacketCarSetupData": _build_packet_car_setup_data,
+    "CarTelemetryData": _build_packet_car_telemetry_data,
+    "PacketCarTelemetryData": _build_packet_car_telemetry_data,
+    "CarStatusData": _build_packet_car_status_data,
+    "PacketCarStatusData": _build_packet_car_status_data,
+    "FinalClassificationData": _build_packet_final_classification_data,
+    "PacketFinalClassificationData": _build_packet_final_classification_data,
+    "LobbyInfoData": _build_packet_lobby_info_data,
+    "PacketLobbyInfoData": _build_packet_lobby_info_data,
+    "CarDamageData": _build_packet_car_damage_data,
+    "PacketCarDamageData": _build_packet_car_damage_data,
+    "LapHistoryData": _build_packet_session_history_data,
+    "TyreStintHistoryData": _build_packet_session_history_data,
+    "PacketSessionHistoryData": _build_packet_session_history_data,
+    "TyreSetData": _build_packet_tyre_sets_data,
+    "PacketTyreSetsData": _build_packet_tyre_sets_data,
+    "PacketMotionExData": _build_packet_motion_ex_data,
+    "TimeTrialDataSet": _build_packet_time_trial_data,
+    "PacketTimeTrialData": _build_packet_time_trial_data,
+    "PacketLapPositionsData": _build_packet_lap_positions_data,
+}
+
+__getattr__ = specs.lazy_getattr(globals(), _BUILDERS)
+
+HEADER_FIELD_TO_PACKET_TYPE = specs.PacketTypes(
+    __name__,
+    {
+        (2025, 1, 0): "PacketMotionData",
+        (2025, 1, 1): "PacketSessionData",
+        (2025, 1, 2): "PacketLapData",
+        (2025, 1, 3): "PacketEventData",
+        (2025, 1, 4): "PacketParticipantsData",
+        (2025, 1, 5): "PacketCarSetupData",
+        (2025, 1, 6): "PacketCarTelemetryData",
+        (2025, 1, 7): "PacketCarStatusData",
+        (2025, 1, 8): "PacketFinalClassificationData",
+        (2025, 1, 9): "PacketLobbyInfoData",
+        (2025, 1, 10): "PacketCarDamageData",
+        (2025, 1, 11): "PacketSessionHistoryData",
+        (2025, 1, 12): "PacketTyreSetsData",
+        (2025, 1, 13): "PacketMotionExData",
+        (2025, 1, 14): "PacketTimeTrialData",
+        (2025, 1, 15): "PacketLapPositionsData",
+    },
+)
+# [[[end]]]
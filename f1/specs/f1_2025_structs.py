@@ -0,0 +1,1097 @@
+"""
+Records of the F1 25 UDP specification for the pure ``struct`` backend.
+"""
+
+from f1.structs import Record
+from f1.structs import UnionMember
+from f1.structs import UnionRecord
+
+_new = tuple.__new__
+
+
+# [[[cog
+# import sys; sys.path.append("./scripts"); import genspec; genspec.emit_structs(2025)
+# ]]]
+class PacketHeader(Record):
+    __slots__ = ()
+    _fields_ = (
+        "packet_format",
+        "game_year",
+        "game_major_version",
+        "game_minor_version",
+        "packet_version",
+        "packet_id",
+        "session_uid",
+        "session_time",
+        "frame_identifier",
+        "overall_frame_identifier",
+        "player_car_index",
+        "secondary_player_car_index",
+    )
+    _format_ = "HBBBBBQfIIBB"
+    _length_ = 12
+
+
+class CarMotionData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "world_position_x",
+        "world_position_y",
+        "world_position_z",
+        "world_velocity_x",
+        "world_velocity_y",
+        "world_velocity_z",
+        "world_forward_dir_x",
+        "world_forward_dir_y",
+        "world_forward_dir_z",
+        "world_right_dir_x",
+        "world_right_dir_y",
+        "world_right_dir_z",
+        "g_force_lateral",
+        "g_force_longitudinal",
+        "g_force_vertical",
+        "yaw",
+        "pitch",
+        "roll",
+    )
+    _format_ = "ffffffhhhhhhffffff"
+    _length_ = 18
+
+
+class PacketMotionData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "header",
+        "car_motion_data",
+    )
+    _format_ = PacketHeader._format_ + CarMotionData._format_ * 22
+    _length_ = 408
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            PacketMotionData,
+            (
+                PacketHeader._build(v, i),
+                [CarMotionData._build(v, j) for j in range(i + 12, i + 408, 18)],
+            ),
+        )
+
+
+class MarshalZone(Record):
+    __slots__ = ()
+    _fields_ = (
+        "zone_start",
+        "zone_flag",
+    )
+    _format_ = "fb"
+    _length_ = 2
+
+
+class WeatherForecastSample(Record):
+    __slots__ = ()
+    _fields_ = (
+        "session_type",
+        "time_offset",
+        "weather",
+        "track_temperature",
+        "track_temperature_change",
+        "air_temperature",
+        "air_temperature_change",
+        "rain_percentage",
+    )
+    _format_ = "BBBbbbbB"
+    _length_ = 8
+
+
+class PacketSessionData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "header",
+        "weather",
+        "track_temperature",
+        "air_temperature",
+        "total_laps",
+        "track_length",
+        "session_type",
+        "track_id",
+        "formula",
+        "session_time_left",
+        "session_duration",
+        "pit_speed_limit",
+        "game_paused",
+        "is_spectating",
+        "spectator_car_index",
+        "sli_pro_native_support",
+        "num_marshal_zones",
+        "marshal_zones",
+        "safety_car_status",
+        "network_game",
+        "num_weather_forecast_samples",
+        "weather_forecast_samples",
+        "forecast_accuracy",
+        "ai_difficulty",
+        "season_link_identifier",
+        "weekend_link_identifier",
+        "session_link_identifier",
+        "pit_stop_window_ideal_lap",
+        "pit_stop_window_latest_lap",
+        "pit_stop_rejoin_position",
+        "steering_assist",
+        "braking_assist",
+        "gearbox_assist",
+        "pit_assist",
+        "pit_release_assist",
+        "ers_assist",
+        "drs_assist",
+        "dynamic_racing_line",
+        "dynamic_racing_line_type",
+        "game_mode",
+        "rule_set",
+        "time_of_day",
+        "session_length",
+        "speed_units_lead_player",
+        "temperature_units_lead_player",
+        "speed_units_secondary_player",
+        "temperature_units_secondary_player",
+        "num_safety_car_periods",
+        "num_virtual_safety_car_periods",
+        "num_red_flag_periods",
+        "equal_car_performance",
+        "recovery_mode",
+        "flashback_limit",
+        "surface_type",
+        "low_fuel_mode",
+        "race_starts",
+        "tyre_temperature",
+        "pit_lane_tyre_sim",
+        "car_damage",
+        "car_damage_rate",
+        "collisions",
+        "collisions_off_for_first_lap_only",
+        "mp_unsafe_pit_release",
+        "mp_off_for_griefing",
+        "corner_cutting_stringency",
+        "parc_ferme_rules",
+        "pit_stop_experience",
+        "safety_car",
+        "safety_car_experience",
+        "formation_lap",
+        "formation_lap_experience",
+        "red_flags",
+        "affects_licence_level_solo",
+        "affects_licence_level_mp",
+        "num_sessions_in_weekend",
+        "weekend_structure",
+        "sector2_lap_distance_start",
+        "sector3_lap_distance_start",
+    )
+    _format_ = (
+        PacketHeader._format_
+        + "BbbBHBbBHHBBBBBB"
+        + MarshalZone._format_ * 21
+        + "BBB"
+        + WeatherForecastSample._format_ * 64
+        + "BBIIIBBBBBBBBBBBBBBIBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB12Bff"
+    )
+    _length_ = 652
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            PacketSessionData,
+            (
+                PacketHeader._build(v, i),
+                *v[i + 12 : i + 28],
+                [MarshalZone._build(v, j) for j in range(i + 28, i + 70, 2)],
+                *v[i + 70 : i + 73],
+                [WeatherForecastSample._build(v, j) for j in range(i + 73, i + 585, 8)],
+                *v[i + 585 : i + 638],
+                v[i + 638 : i + 650],
+                *v[i + 650 : i + 652],
+            ),
+        )
+
+
+class LapData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "last_lap_time_in_ms",
+        "current_lap_time_in_ms",
+        "sector1_time_ms_part",
+        "sector1_time_minutes_part",
+        "sector2_time_ms_part",
+        "sector2_time_minutes_part",
+        "delta_to_car_in_front_ms_part",
+        "delta_to_car_in_front_minutes_part",
+        "delta_to_race_leader_ms_part",
+        "delta_to_race_leader_minutes_part",
+        "lap_distance",
+        "total_distance",
+        "safety_car_delta",
+        "car_position",
+        "current_lap_num",
+        "pit_status",
+        "num_pit_stops",
+        "sector",
+        "current_lap_invalid",
+        "penalties",
+        "total_warnings",
+        "corner_cutting_warnings",
+        "num_unserved_drive_through_pens",
+        "num_unserved_stop_go_pens",
+        "grid_position",
+        "driver_status",
+        "result_status",
+        "pit_lane_timer_active",
+        "pit_lane_time_in_lane_in_ms",
+        "pit_stop_timer_in_ms",
+        "pit_stop_should_serve_pen",
+        "speed_trap_fastest_speed",
+        "speed_trap_fastest_lap",
+    )
+    _format_ = "IIHBHBHBHBfffBBBBBBBBBBBBBBBHHBfB"
+    _length_ = 33
+
+
+class PacketLapData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "header",
+        "lap_data",
+        "time_trial_pb_car_idx",
+        "time_trial_rival_car_idx",
+    )
+    _format_ = PacketHeader._format_ + LapData._format_ * 22 + "BB"
+    _length_ = 740
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            PacketLapData,
+            (
+                PacketHeader._build(v, i),
+                [LapData._build(v, j) for j in range(i + 12, i + 738, 33)],
+                *v[i + 738 : i + 740],
+            ),
+        )
+
+
+class FastestLap(Record):
+    __slots__ = ()
+    _fields_ = (
+        "vehicle_idx",
+        "lap_time",
+    )
+    _format_ = "Bf"
+    _length_ = 2
+
+
+class Retirement(Record):
+    __slots__ = ()
+    _fields_ = (
+        "vehicle_idx",
+        "reason",
+    )
+    _format_ = "BB"
+    _length_ = 2
+
+
+class DrsDisabled(Record):
+    __slots__ = ()
+    _fields_ = ("reason",)
+    _format_ = "B"
+    _length_ = 1
+
+
+class TeamMateInPits(Record):
+    __slots__ = ()
+    _fields_ = ("vehicle_idx",)
+    _format_ = "B"
+    _length_ = 1
+
+
+class RaceWinner(Record):
+    __slots__ = ()
+    _fields_ = ("vehicle_idx",)
+    _format_ = "B"
+    _length_ = 1
+
+
+class Penalty(Record):
+    __slots__ = ()
+    _fields_ = (
+        "penalty_type",
+        "infringement_type",
+        "vehicle_idx",
+        "other_vehicle_idx",
+        "time",
+        "lap_num",
+        "places_gained",
+    )
+    _format_ = "BBBBBBB"
+    _length_ = 7
+
+
+class SpeedTrap(Record):
+    __slots__ = ()
+    _fields_ = (
+        "vehicle_idx",
+        "speed",
+        "is_overall_fastest_in_session",
+        "is_driver_fastest_in_session",
+        "fastest_vehicle_idx_in_session",
+        "fastest_speed_in_session",
+    )
+    _format_ = "BfBBBf"
+    _length_ = 6
+
+
+class StartLights(Record):
+    __slots__ = ()
+    _fields_ = ("num_lights",)
+    _format_ = "B"
+    _length_ = 1
+
+
+class DriveThroughPenaltyServed(Record):
+    __slots__ = ()
+    _fields_ = ("vehicle_idx",)
+    _format_ = "B"
+    _length_ = 1
+
+
+class StopGoPenaltyServed(Record):
+    __slots__ = ()
+    _fields_ = (
+        "vehicle_idx",
+        "stop_time",
+    )
+    _format_ = "Bf"
+    _length_ = 2
+
+
+class Flashback(Record):
+    __slots__ = ()
+    _fields_ = (
+        "flashback_frame_identifier",
+        "flashback_session_time",
+    )
+    _format_ = "If"
+    _length_ = 2
+
+
+class Buttons(Record):
+    __slots__ = ()
+    _fields_ = ("button_status",)
+    _format_ = "I"
+    _length_ = 1
+
+
+class Overtake(Record):
+    __slots__ = ()
+    _fields_ = (
+        "overtaking_vehicle_idx",
+        "being_overtaken_vehicle_idx",
+    )
+    _format_ = "BB"
+    _length_ = 2
+
+
+class SafetyCar(Record):
+    __slots__ = ()
+    _fields_ = (
+        "safety_car_type",
+        "event_type",
+    )
+    _format_ = "BB"
+    _length_ = 2
+
+
+class Collision(Record):
+    __slots__ = ()
+    _fields_ = (
+        "vehicle1_idx",
+        "vehicle2_idx",
+    )
+    _format_ = "BB"
+    _length_ = 2
+
+
+class EventDataDetails(UnionRecord):
+    __slots__ = ()
+    _format_ = "12s"
+
+    fastest_lap = UnionMember(FastestLap)
+    retirement = UnionMember(Retirement)
+    drs_disabled = UnionMember(DrsDisabled)
+    team_mate_in_pits = UnionMember(TeamMateInPits)
+    race_winner = UnionMember(RaceWinner)
+    penalty = UnionMember(Penalty)
+    speed_trap = UnionMember(SpeedTrap)
+    start_lights = UnionMember(StartLights)
+    drive_through_penalty_served = UnionMember(DriveThroughPenaltyServed)
+    stop_go_penalty_served = UnionMember(StopGoPenaltyServed)
+    flashback = UnionMember(Flashback)
+    buttons = UnionMember(Buttons)
+    overtake = UnionMember(Overtake)
+    safety_car = UnionMember(SafetyCar)
+    collision = UnionMember(Collision)
+
+
+class PacketEventData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "header",
+        "event_string_code",
+        "event_details",
+    )
+    _format_ = PacketHeader._format_ + "4B" + EventDataDetails._format_
+    _length_ = 17
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            PacketEventData,
+            (
+                PacketHeader._build(v, i),
+                v[i + 12 : i + 16],
+                EventDataDetails._build(v, i + 16),
+            ),
+        )
+
+
+class LiveryColour(Record):
+    __slots__ = ()
+    _fields_ = (
+        "red",
+        "green",
+        "blue",
+    )
+    _format_ = "BBB"
+    _length_ = 3
+
+
+class ParticipantData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "ai_controlled",
+        "driver_id",
+        "network_id",
+        "team_id",
+        "my_team",
+        "race_number",
+        "nationality",
+        "name",
+        "your_telemetry",
+        "show_online_names",
+        "tech_level",
+        "platform",
+        "num_colours",
+        "livery_colours",
+    )
+    _format_ = "BBBBBBB32sBBHBB" + LiveryColour._format_ * 4
+    _length_ = 25
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            ParticipantData,
+            (
+                *v[i : i + 7],
+                v[i + 7].split(b"\0", 1)[0],
+                *v[i + 8 : i + 13],
+                [LiveryColour._build(v, j) for j in range(i + 13, i + 25, 3)],
+            ),
+        )
+
+
+class PacketParticipantsData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "header",
+        "num_active_cars",
+        "participants",
+    )
+    _format_ = PacketHeader._format_ + "B" + ParticipantData._format_ * 22
+    _length_ = 563
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            PacketParticipantsData,
+            (
+                PacketHeader._build(v, i),
+                v[i + 12],
+                [ParticipantData._build(v, j) for j in range(i + 13, i + 563, 25)],
+            ),
+        )
+
+
+class CarSetupData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "front_wing",
+        "rear_wing",
+        "on_throttle",
+        "off_throttle",
+        "front_camber",
+        "rear_camber",
+        "front_toe",
+        "rear_toe",
+        "front_suspension",
+        "rear_suspension",
+        "front_anti_roll_bar",
+        "rear_anti_roll_bar",
+        "front_suspension_height",
+        "rear_suspension_height",
+        "brake_pressure",
+        "brake_bias",
+        "engine_braking",
+        "rear_left_tyre_pressure",
+        "rear_right_tyre_pressure",
+        "front_left_tyre_pressure",
+        "front_right_tyre_pressure",
+        "ballast",
+        "fuel_load",
+    )
+    _format_ = "BBBBffffBBBBBBBBBffffBf"
+    _length_ = 23
+
+
+class PacketCarSetupData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "header",
+        "car_setup_data",
+        "next_front_wing_value",
+    )
+    _format_ = PacketHeader._format_ + CarSetupData._format_ * 22 + "f"
+    _length_ = 519
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            PacketCarSetupData,
+            (
+                PacketHeader._build(v, i),
+                [CarSetupData._build(v, j) for j in range(i + 12, i + 518, 23)],
+                v[i + 518],
+            ),
+        )
+
+
+class CarTelemetryData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "speed",
+        "throttle",
+        "steer",
+        "brake",
+        "clutch",
+        "gear",
+        "engine_rpm",
+        "drs",
+        "rev_lights_percent",
+        "rev_lights_bit_value",
+        "brakes_temperature",
+        "tyres_surface_temperature",
+        "tyres_inner_temperature",
+        "engine_temperature",
+        "tyres_pressure",
+        "surface_type",
+    )
+    _format_ = "HfffBbHBBH4H4B4BH4f4B"
+    _length_ = 31
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            CarTelemetryData,
+            (
+                *v[i : i + 10],
+                v[i + 10 : i + 14],
+                v[i + 14 : i + 18],
+                v[i + 18 : i + 22],
+                v[i + 22],
+                v[i + 23 : i + 27],
+                v[i + 27 : i + 31],
+            ),
+        )
+
+
+class PacketCarTelemetryData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "header",
+        "car_telemetry_data",
+        "mfd_panel_index",
+        "mfd_panel_index_secondary_player",
+        "suggested_gear",
+    )
+    _format_ = PacketHeader._format_ + CarTelemetryData._format_ * 22 + "BBb"
+    _length_ = 697
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            PacketCarTelemetryData,
+            (
+                PacketHeader._build(v, i),
+                [CarTelemetryData._build(v, j) for j in range(i + 12, i + 694, 31)],
+                *v[i + 694 : i + 697],
+            ),
+        )
+
+
+class CarStatusData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "traction_control",
+        "anti_lock_brakes",
+        "fuel_mix",
+        "front_brake_bias",
+        "pit_limiter_status",
+        "fuel_in_tank",
+        "fuel_capacity",
+        "fuel_remaining_laps",
+        "max_rpm",
+        "idle_rpm",
+        "max_gears",
+        "drs_allowed",
+        "drs_activation_distance",
+        "actual_tyre_compound",
+        "visual_tyre_compound",
+        "tyres_age_laps",
+        "vehicle_fia_flags",
+        "engine_power_ice",
+        "engine_power_mguk",
+        "ers_store_energy",
+        "ers_deploy_mode",
+        "ers_harvested_this_lap_mguk",
+        "ers_harvested_this_lap_mguh",
+        "ers_deployed_this_lap",
+        "network_paused",
+    )
+    _format_ = "BBBBBfffHHBBHBBBbfffBfffB"
+    _length_ = 25
+
+
+class PacketCarStatusData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "header",
+        "car_status_data",
+    )
+    _format_ = PacketHeader._format_ + CarStatusData._format_ * 22
+    _length_ = 562
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            PacketCarStatusData,
+            (
+                PacketHeader._build(v, i),
+                [CarStatusData._build(v, j) for j in range(i + 12, i + 562, 25)],
+            ),
+        )
+
+
+class FinalClassificationData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "position",
+        "num_laps",
+        "grid_position",
+        "points",
+        "num_pit_stops",
+        "result_status",
+        "result_reason",
+        "best_lap_time_in_ms",
+        "total_race_time",
+        "penalties_time",
+        "num_penalties",
+        "num_tyre_stints",
+        "tyre_stints_actual",
+        "tyre_stints_visual",
+        "tyre_stints_end_laps",
+    )
+    _format_ = "BBBBBBBIdBBB8B8B8B"
+    _length_ = 36
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            FinalClassificationData,
+            (
+                *v[i : i + 12],
+                v[i + 12 : i + 20],
+                v[i + 20 : i + 28],
+                v[i + 28 : i + 36],
+            ),
+        )
+
+
+class PacketFinalClassificationData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "header",
+        "num_cars",
+        "classification_data",
+    )
+    _format_ = PacketHeader._format_ + "B" + FinalClassificationData._format_ * 22
+    _length_ = 805
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            PacketFinalClassificationData,
+            (
+                PacketHeader._build(v, i),
+                v[i + 12],
+                [
+                    FinalClassificationData._build(v, j)
+                    for j in range(i + 13, i + 805, 36)
+                ],
+            ),
+        )
+
+
+class LobbyInfoData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "ai_controlled",
+        "team_id",
+        "nationality",
+        "platform",
+        "name",
+        "car_number",
+        "your_telemetry",
+        "show_online_names",
+        "tech_level",
+        "ready_status",
+    )
+    _format_ = "BBBB32sBBBHB"
+    _length_ = 10
+
+
+class PacketLobbyInfoData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "header",
+        "num_players",
+        "lobby_players",
+    )
+    _format_ = PacketHeader._format_ + "B" + LobbyInfoData._format_ * 22
+    _length_ = 233
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            PacketLobbyInfoData,
+            (
+                PacketHeader._build(v, i),
+                v[i + 12],
+                [LobbyInfoData._build(v, j) for j in range(i + 13, i + 233, 10)],
+            ),
+        )
+
+
+class CarDamageData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "tyres_wear",
+        "tyres_damage",
+        "brakes_damage",
+        "tyre_blisters",
+        "front_left_wing_damage",
+        "front_right_wing_damage",
+        "rear_wing_damage",
+        "floor_damage",
+        "diffuser_damage",
+        "sidepod_damage",
+        "drs_fault",
+        "ers_fault",
+        "gear_box_damage",
+        "engine_damage",
+        "engine_mguh_wear",
+        "engine_es_wear",
+        "engine_ce_wear",
+        "engine_ice_wear",
+        "engine_mguk_wear",
+        "engine_tc_wear",
+        "engine_blown",
+        "engine_seized",
+    )
+    _format_ = "4f4B4B4BBBBBBBBBBBBBBBBBBB"
+    _length_ = 34
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            CarDamageData,
+            (
+                v[i : i + 4],
+                v[i + 4 : i + 8],
+                v[i + 8 : i + 12],
+                v[i + 12 : i + 16],
+                *v[i + 16 : i + 34],
+            ),
+        )
+
+
+class PacketCarDamageData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "header",
+        "car_damage_data",
+    )
+    _format_ = PacketHeader._format_ + CarDamageData._format_ * 22
+    _length_ = 760
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            PacketCarDamageData,
+            (
+                PacketHeader._build(v, i),
+                [CarDamageData._build(v, j) for j in range(i + 12, i + 760, 34)],
+            ),
+        )
+
+
+class LapHistoryData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "lap_time_in_ms",
+        "sector1_time_ms_part",
+        "sector1_time_minutes_part",
+        "sector2_time_ms_part",
+        "sector2_time_minutes_part",
+        "sector3_time_ms_part",
+        "sector3_time_minutes_part",
+        "lap_valid_bit_flags",
+    )
+    _format_ = "IHBHBHBB"
+    _length_ = 8
+
+
+class TyreStintHistoryData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "end_lap",
+        "tyre_actual_compound",
+        "tyre_visual_compound",
+    )
+    _format_ = "BBB"
+    _length_ = 3
+
+
+class PacketSessionHistoryData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "header",
+        "car_idx",
+        "num_laps",
+        "num_tyre_stints",
+        "best_lap_time_lap_num",
+        "best_sector1_lap_num",
+        "best_sector2_lap_num",
+        "best_sector3_lap_num",
+        "lap_history_data",
+        "tyre_stints_history_data",
+    )
+    _format_ = (
+        PacketHeader._format_
+        + "BBBBBBB"
+        + LapHistoryData._format_ * 100
+        + TyreStintHistoryData._format_ * 8
+    )
+    _length_ = 843
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            PacketSessionHistoryData,
+            (
+                PacketHeader._build(v, i),
+                *v[i + 12 : i + 19],
+                [LapHistoryData._build(v, j) for j in range(i + 19, i + 819, 8)],
+                [TyreStintHistoryData._build(v, j) for j in range(i + 819, i + 843, 3)],
+            ),
+        )
+
+
+class TyreSetData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "actual_tyre_compound",
+        "visual_tyre_compound",
+        "wear",
+        "available",
+        "recommended_session",
+        "life_span",
+        "usable_life",
+        "lap_delta_time",
+        "fitted",
+    )
+    _format_ = "BBBBBBBhB"
+    _length_ = 9
+
+
+class PacketTyreSetsData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "header",
+        "car_idx",
+        "tyre_set_data",
+        "fitted_idx",
+    )
+    _format_ = PacketHeader._format_ + "B" + TyreSetData._format_ * 20 + "B"
+    _length_ = 194
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            PacketTyreSetsData,
+            (
+                PacketHeader._build(v, i),
+                v[i + 12],
+                [TyreSetData._build(v, j) for j in range(i + 13, i + 193, 9)],
+                v[i + 193],
+            ),
+        )
+
+
+class PacketMotionExData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "header",
+        "suspension_position",
+        "suspension_velocity",
+        "suspension_acceleration",
+        "wheel_speed",
+        "wheel_slip_ratio",
+        "wheel_slip_angle",
+        "wheel_lat_force",
+        "wheel_long_force",
+        "height_of_cog_above_ground",
+        "local_velocity_x",
+        "local_velocity_y",
+        "local_velocity_z",
+        "angular_velocity_x",
+        "angular_velocity_y",
+        "angular_velocity_z",
+        "angular_acceleration_x",
+        "angular_acceleration_y",
+        "angular_acceleration_z",
+        "front_wheels_angle",
+        "wheel_vert_force",
+        "front_aero_height",
+        "rear_aero_height",
+        "front_roll_angle",
+        "rear_roll_angle",
+        "chassis_yaw",
+        "chassis_pitch",
+        "wheel_camber",
+        "wheel_camber_gain",
+    )
+    _format_ = PacketHeader._format_ + "4f4f4f4f4f4f4f4ffffffffffff4fffffff4f4f"
+    _length_ = 73
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            PacketMotionExData,
+            (
+                PacketHeader._build(v, i),
+                v[i + 12 : i + 16],
+                v[i + 16 : i + 20],
+                v[i + 20 : i + 24],
+                v[i + 24 : i + 28],
+                v[i + 28 : i + 32],
+                v[i + 32 : i + 36],
+                v[i + 36 : i + 40],
+                v[i + 40 : i + 44],
+                *v[i + 44 : i + 55],
+                v[i + 55 : i + 59],
+                *v[i + 59 : i + 65],
+                v[i + 65 : i + 69],
+                v[i + 69 : i + 73],
+            ),
+        )
+
+
+class TimeTrialDataSet(Record):
+    __slots__ = ()
+    _fields_ = (
+        "car_idx",
+        "team_id",
+        "lap_time_in_ms",
+        "sector1_time_in_ms",
+        "sector2_time_in_ms",
+        "sector3_time_in_ms",
+        "traction_control",
+        "gearbox_assist",
+        "anti_lock_brakes",
+        "equal_car_performance",
+        "custom_setup",
+        "valid",
+    )
+    _format_ = "BBIIIIBBBBBB"
+    _length_ = 12
+
+
+class PacketTimeTrialData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "header",
+        "player_session_best_data_set",
+        "personal_best_data_set",
+        "rival_data_set",
+    )
+    _format_ = (
+        PacketHeader._format_
+        + TimeTrialDataSet._format_
+        + TimeTrialDataSet._format_
+        + TimeTrialDataSet._format_
+    )
+    _length_ = 48
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            PacketTimeTrialData,
+            (
+                PacketHeader._build(v, i),
+                TimeTrialDataSet._build(v, i + 12),
+                TimeTrialDataSet._build(v, i + 24),
+                TimeTrialDataSet._build(v, i + 36),
+            ),
+        )
+
+
+class PacketLapPositionsData(Record):
+    __slots__ = ()
+    _fields_ = (
+        "header",
+        "num_laps",
+        "lap_start",
+        "position_for_vehicle_idx",
+    )
+    _format_ = PacketHeader._format_ + "BB1100B"
+    _length_ = 1114
+
+    @staticmethod
+    def _build(v, i):
+        return _new(
+            PacketLapPositionsData,
+            (
+                PacketHeader._build(v, i),
+                *v[i + 12 : i + 14],
+                v[i + 14 : i + 1114],
+            ),
+        )
+
+
+# [[[end]]]
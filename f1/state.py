@@ -0,0 +1,209 @@
+"""
+Live state of a session and of every car in it, updated in place as packets
+arrive ::
+
+    state = SessionState()
+    handler = SessionStateHandler(PacketListener(), state)
+    threading.Thread(target=handler.handle, daemon=True).start()
+    ...
+    snapshot = state.snapshot()
+"""
+
+import operator
+import threading
+import typing as t
+
+from f1.handler import PacketHandler
+
+# The number of car slots in the packets
+MAX_CARS = 22
+
+# The fields of every section, named after the packet fields they come from
+LAP = (
+    "car_position",
+    "current_lap_num",
+    "lap_distance",
+    "last_lap_time_in_ms",
+    "current_lap_time_in_ms",
+    "pit_status",
+    "num_pit_stops",
+    "result_status",
+)
+STATUS = (
+    "fuel_in_tank",
+    "fuel_remaining_laps",
+    "actual_tyre_compound",
+    "visual_tyre_compound",
+    "tyres_age_laps",
+    "ers_store_energy",
+    "drs_allowed",
+)
+DAMAGE = (
+    "tyres_wear",
+    "tyres_damage",
+    "front_left_wing_damage",
+    "front_right_wing_damage",
+    "rear_wing_damage",
+    "floor_damage",
+    "gear_box_damage",
+    "engine_damage",
+)
+PARTICIPANTS = (
+    "name",
+    "driver_id",
+    "team_id",
+    "race_number",
+    "nationality",
+    "ai_controlled",
+)
+SESSION = (
+    "track_id",
+    "session_type",
+    "weather",
+    "track_temperature",
+    "air_temperature",
+    "total_laps",
+    "session_time_left",
+    "safety_car_status",
+)
+
+
+class CarState:
+    """The latest known state of a car, ``None`` until first received"""
+
+    __slots__ = LAP + STATUS + DAMAGE + PARTICIPANTS
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        for name in self.__slots__:
+            setattr(self, name, None)
+
+    def to_dict(self):
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def __repr__(self):
+        return str(self.to_dict())
+
+
+def _updater(fields: t.Tuple[str, ...]):
+    """Returns a function that copies the fields of a packet's car data to a
+    car state"""
+    get = operator.attrgetter(*fields)
+    # The indices of the fields that are arrays or strings
+    arrays = [i for i, _ in enumerate(fields) if _ in ("tyres_wear", "tyres_damage")]
+    strings = [i for i, _ in enumerate(fields) if _ == "name"]
+
+    def update(car: CarState, data) -> None:
+        values = list(get(data))
+        for i in arrays:
+            values[i] = tuple(values[i])
+        for i in strings:
+            values[i] = values[i].decode(errors="replace")
+        for name, value in zip(fields, values):
+            setattr(car, name, value)
+
+    return update
+
+
+class SessionState:
+    """The state of a session and its cars, from the latest lap, car status,
+    car damage, participants and session packets.
+
+    Every car has a preallocated ``CarState`` slot in ``cars``, updated in
+    place. Every section (``"lap"``, ``"status"``, ``"damage"``,
+    ``"participants"`` and ``"session"``) has a version in ``versions``,
+    bumped on every update, so that readers can tell what changed cheaply.
+
+    Updates and ``snapshot`` are serialised by a lock, so that a snapshot,
+    taken from another thread, never mixes two updates of a section.
+
+    A packet from a new session resets the state of the previous one, and
+    bumps every version, so that a snapshot never mixes two sessions.
+    """
+
+    _sections = {
+        "lap": ("lap_data", _updater(LAP)),
+        "status": ("car_status_data", _updater(STATUS)),
+        "damage": ("car_damage_data", _updater(DAMAGE)),
+        "participants": ("participants", _updater(PARTICIPANTS)),
+    }
+
+    def __init__(self) -> None:
+        self.session_uid: t.Optional[int] = None
+        self.num_active_cars = 0
+        self.player_car_index: t.Optional[int] = None
+        self.session: t.Dict[str, t.Any] = dict.fromkeys(SESSION)
+        self.cars = [CarState() for _ in range(MAX_CARS)]
+        self.versions = dict.fromkeys((*self._sections, "session"), 0)
+        self._lock = threading.Lock()
+        self._get_session = operator.attrgetter(*SESSION)
+
+    def _header(self, packet) -> None:
+        header = packet.header
+        if header.session_uid != self.session_uid:
+            if self.session_uid is not None:
+                self._reset()
+            self.session_uid = header.session_uid
+        self.player_car_index = header.player_car_index
+
+    def _reset(self) -> None:
+        self.num_active_cars = 0
+        self.session = dict.fromkeys(SESSION)
+        for car in self.cars:
+            car.reset()
+        for section in self.versions:
+            self.versions[section] += 1
+
+    def update_cars(self, section: str, packet) -> None:
+        """Updates a section of every car from a packet"""
+        field, update = self._sections[section]
+        with self._lock:
+            self._header(packet)
+            for car, data in zip(self.cars, getattr(packet, field)):
+                update(car, data)
+            if section == "participants":
+                self.num_active_cars = packet.num_active_cars
+            self.versions[section] += 1
+
+    def update_session(self, packet) -> None:
+        with self._lock:
+            self._header(packet)
+            self.session.update(zip(SESSION, self._get_session(packet)))
+            self.versions["session"] += 1
+
+    def snapshot(self) -> t.Dict[str, t.Any]:
+        """Returns a consistent copy of the whole state, as plain dicts"""
+        with self._lock:
+            return {
+                "session_uid": self.session_uid,
+                "player_car_index": self.player_car_index,
+                "num_active_cars": self.num_active_cars,
+                "versions": dict(self.versions),
+                "session": dict(self.session),
+                "cars": [_.to_dict() for _ in self.cars],
+            }
+
+
+class SessionStateHandler(PacketHandler):
+    """Feeds a ``SessionState`` from the packets of a listener"""
+
+    def __init__(self, listener, state: t.Optional[SessionState] = None):
+        super().__init__(listener)
+        self.state = state if state is not None else SessionState()
+
+    def handle_LapData(self, packet):
+        self.state.update_cars("lap", packet)
+
+    def handle_CarStatusData(self, packet):
+        self.state.update_cars("status", packet)
+
+    def handle_CarDamageData(self, packet):
+        self.state.update_cars("damage", packet)
+
+    def handle_ParticipantsData(self, packet):
+        self.state.update_cars("participants", packet)
+
+    def handle_SessionData(self, packet):
+        self.state.update_session(packet)
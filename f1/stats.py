@@ -0,0 +1,146 @@
+"""
+Packet loss and lateness statistics, from a peek at the packet headers.
+"""
+
+import os
+import socket
+import struct
+import sys
+import time
+import typing as t
+
+# packet_id, session_uid, session_time and overall_frame_identifier, which
+# unlike frame_identifier does not go back on flashbacks
+_PEEK = struct.Struct("<6xBQf4xI")
+
+
+class StreamStats:
+    """The statistics of the packets of a given id in a given session.
+
+    Not every packet type is sent on every frame, so ``lost`` only counts
+    packets actually lost for those that are, e.g. motion, lap or telemetry
+    packets; for the others it counts the frames they were not sent on.
+    """
+
+    __slots__ = ("received", "lost", "duplicates", "out_of_order", "last_frame")
+
+    def __init__(self) -> None:
+        self.received = 0
+        self.lost = 0
+        self.duplicates = 0
+        self.out_of_order = 0
+        self.last_frame = -1
+
+    def to_dict(self):
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def __repr__(self):
+        return str(self.to_dict())
+
+
+class SessionStats:
+    """The lateness of the packets of a session.
+
+    The offset between the receive time and the session time of the packets
+    is at its lowest for the packets that arrived the fastest, so lateness is
+    measured as the excess of a packet's offset over the lowest one so far.
+    """
+
+    __slots__ = ("offset", "lateness", "max_lateness")
+
+    def __init__(self) -> None:
+        self.offset = float("inf")
+        self.lateness = 0.0
+        self.max_lateness = 0.0
+
+    def to_dict(self):
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def __repr__(self):
+        return str(self.to_dict())
+
+
+class PacketStats:
+    """Sequence and lateness statistics of the datagrams received.
+
+    ``streams`` holds the ``StreamStats`` of every ``(session_uid,
+    packet_id)`` and ``sessions`` the ``SessionStats`` of every session uid.
+    Updating them only costs a peek at the header and a few dict lookups.
+    """
+
+    def __init__(self, clock: t.Callable[[], float] = time.monotonic) -> None:
+        self.clock = clock
+        self.streams: t.Dict[t.Tuple[int, int], StreamStats] = {}
+        self.sessions: t.Dict[int, SessionStats] = {}
+
+    def update(self, datagram) -> None:
+        """Accounts for a raw datagram just received"""
+        if len(datagram) < _PEEK.size:
+            return
+        packet_id, session_uid, session_time, frame = _PEEK.unpack_from(datagram)
+
+        try:
+            stream = self.streams[session_uid, packet_id]
+        except KeyError:
+            stream = self.streams[session_uid, packet_id] = StreamStats()
+
+        stream.received += 1
+        last = stream.last_frame
+        if frame > last:
+            if last >= 0:
+                stream.lost += frame - last - 1
+            stream.last_frame = frame
+        elif frame == last:
+            stream.duplicates += 1
+        else:
+            stream.out_of_order += 1
+            # Counted as lost when the gap was seen
+            if stream.lost:
+                stream.lost -= 1
+
+        try:
+            session = self.sessions[session_uid]
+        except KeyError:
+            session = self.sessions[session_uid] = SessionStats()
+
+        offset = self.clock() - session_time
+        if offset < session.offset:
+            session.offset = offset
+        session.lateness = lateness = offset - session.offset
+        if lateness > session.max_lateness:
+            session.max_lateness = lateness
+
+    def to_dict(self):
+        return {
+            "streams": {k: v.to_dict() for k, v in self.streams.items()},
+            "sessions": {k: v.to_dict() for k, v in self.sessions.items()},
+        }
+
+    def __repr__(self):
+        return str(self.to_dict())
+
+
+def kernel_drops(sock: socket.socket) -> t.Optional[int]:
+    """Returns the number of datagrams the kernel dropped on a UDP socket
+    because its receive buffer was full.
+
+    Only available on Linux, from ``/proc/net/udp``; returns ``None``
+    elsewhere, or if the socket is not found there.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+
+    inode = str(os.fstat(sock.fileno()).st_ino)
+    for path in ("/proc/net/udp", "/proc/net/udp6"):
+        try:
+            with open(path) as f:
+                lines = f.readlines()[1:]
+        except OSError:
+            continue
+
+        for line in lines:
+            fields = line.split()
+            if fields[9] == inode:
+                return int(fields[-1])
+
+    return None
@@ -0,0 +1,136 @@
+"""
+Pure ``struct`` backend, with packets decoded into lightweight records.
+
+Every packet type is flattened into a single precompiled ``struct`` format, so
+a whole packet is unpacked with one ``unpack_from`` call and the values are
+then sliced into tuple-based records. Records have the same names and
+attributes as their ``Packet`` counterparts, so they can be used with
+``PacketHandler``, e.g. ::
+
+    listener = PacketListener(backend=struct_type)
+
+The records are generated by ``scripts/genspec.py`` along with the ctypes
+packet types.
+"""
+
+import importlib
+import struct
+from operator import itemgetter
+
+_new = tuple.__new__
+
+
+class Record(tuple):
+    """The base record class"""
+
+    __slots__ = ()
+
+    _fields_ = ()
+    _format_ = ""
+    _length_ = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        for i, name in enumerate(cls.__dict__.get("_fields_", ())):
+            setattr(cls, name, property(itemgetter(i)))
+        cls._struct_ = struct.Struct("<" + cls._format_)
+
+    @classmethod
+    def _build(cls, v, i):
+        """Builds the record from the flat values at index i"""
+        return _new(cls, v[i : i + cls._length_])
+
+    @classmethod
+    def size(cls):
+        return cls._struct_.size
+
+    @classmethod
+    def unpack(cls, buffer, copy=True):
+        """Unpacks the binary structure into a record
+
+        Args:
+            buffer (bytes):
+                - The encoded buffer to decode
+            copy (bool):
+                - Ignored, as records never refer to the buffer
+
+        """
+        return cls._build(cls._struct_.unpack_from(buffer), 0)
+
+    def copy(self):
+        """Records are immutable and never refer to the buffer, so this is the
+        record itself"""
+        return self
+
+    def to_dict(self):
+        """Returns a ``dict`` with key-values derived from _fields_"""
+        return {k: _format_value(v) for k, v in zip(self._fields_, self)}
+
+    def __repr__(self):
+        return str(self.to_dict())
+
+
+class UnionMember:
+    """A union member, decoded from the raw union data on access."""
+
+    def __init__(self, record):
+        self.record = record
+
+    def __get__(self, union, owner=None):
+        if union is None:
+            return self
+        return self.record.unpack(union[0])
+
+
+class UnionRecord(Record):
+    """The base union record class, which holds the raw union data"""
+
+    __slots__ = ()
+
+    _length_ = 1
+    _members_ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        cls._members_ = tuple(
+            k for k, v in cls.__dict__.items() if isinstance(v, UnionMember)
+        )
+
+    def to_dict(self):
+        return {k: getattr(self, k).to_dict() for k in self._members_}
+
+
+def _format_value(value):
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, float):
+        return round(value, 3)
+    if isinstance(value, bytes):
+        return value.decode()
+    if isinstance(value, list):
+        return [_.to_dict() for _ in value]
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+_RECORD_TYPES = {}
+
+
+def struct_type(packet_type):
+    """Returns the record counterpart of a ``Packet`` type.
+
+    The records of the spec module ``f1.specs.f1_<year>`` are generated into
+    ``f1.specs.f1_<year>_structs``, which is imported on first use.
+    """
+    try:
+        return _RECORD_TYPES[packet_type]
+    except KeyError:
+        pass
+
+    module = importlib.import_module(f"{packet_type.__module__}_structs")
+    record_type = _RECORD_TYPES[packet_type] = getattr(module, packet_type.__name__)
+
+    return record_type
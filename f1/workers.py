@@ -0,0 +1,251 @@
+"""
+Multi-process packet handling over shared-memory ring buffers.
+
+One process receives the datagrams and shards them across worker processes,
+each with its own single-producer single-consumer ring buffer in shared
+memory. Every worker decodes the datagrams of its shard and hands them to its
+own ``PacketHandler``, which gets around the GIL for heavy handlers, e.g. ::
+
+    workers = PacketWorkers(PacketListener(), MyHandler, workers=4)
+    with workers:
+        workers.run()
+"""
+
+import collections
+import multiprocessing
+import socket
+import struct
+import time
+import typing as t
+from multiprocessing import shared_memory
+
+from f1.handler import narrow
+from f1.listener import PacketListener
+from f1.packets import PACKET_KEY
+from f1.packets import resolve
+
+# The read position of the consumer, at the start of the ring
+_READ = struct.Struct("<Q")
+# The length prefix of every slot
+_LENGTH = struct.Struct("<I")
+
+# The offsets of the header fields used to shard datagrams
+_PACKET_ID = struct.Struct("<6xB")
+_SESSION = struct.Struct("<7xQ12xB")
+
+
+def by_packet_id(datagram) -> int:
+    """Shards datagrams by packet id, which keeps the packets of each type in
+    order."""
+    return _PACKET_ID.unpack_from(datagram)[0]
+
+
+def by_session(datagram) -> int:
+    """Shards datagrams by session uid and player car index, i.e. by game,
+    which keeps all the packets sent by a game in order. All the packets of
+    a game go to the same worker, so this only spreads the load when several
+    games send to the same listener."""
+    session_uid, car = _SESSION.unpack_from(datagram)
+    return session_uid + car
+
+
+class Ring:
+    """A single-producer single-consumer ring of datagrams in shared memory.
+
+    Datagrams are written to fixed-size slots, each prefixed with its length,
+    and the consumer keeps how far it has read in the ring header, where the
+    producer checks it for free slots. The producer signals every datagram it
+    writes on ``ready``, which also orders the writes to the slots before the
+    consumer reads them.
+    """
+
+    def __init__(
+        self,
+        slots: int = 1024,
+        slot_size: int = 2048 + _LENGTH.size,
+        name: t.Optional[str] = None,
+        ready=None,
+    ):
+        self.slots = slots
+        self.slot_size = slot_size
+        self.ready = ready if ready is not None else multiprocessing.Semaphore(0)
+        self.memory = shared_memory.SharedMemory(
+            name, create=name is None, size=_READ.size + slots * slot_size
+        )
+        self._buffer = self.memory.buf
+        self._position = 0
+
+    def __reduce__(self):
+        # Attach to the same shared memory in the worker processes
+        return type(self), (self.slots, self.slot_size, self.memory.name, self.ready)
+
+    def __len__(self) -> int:
+        """The number of datagrams written but not read yet"""
+        return self._position - _READ.unpack_from(self._buffer)[0]
+
+    def _slot(self, position: int) -> int:
+        return _READ.size + position % self.slots * self.slot_size
+
+    def put(self, datagram) -> bool:
+        """Writes a datagram to the ring, as the producer.
+
+        Returns ``False`` if the ring is full and the datagram was dropped.
+        """
+        if len(self) >= self.slots:
+            return False
+        position = self._position
+
+        offset = self._slot(position)
+        size = len(datagram)
+        _LENGTH.pack_into(self._buffer, offset, size)
+        offset += _LENGTH.size
+        self._buffer[offset : offset + size] = datagram
+
+        self._position = position + 1
+        self.ready.release()
+        return True
+
+    def get(self) -> bytes:
+        """Waits for and returns the next datagram, as the consumer."""
+        self.ready.acquire()
+
+        # Kept in the header rather than on the instance, as the consumer may
+        # be a copy of the ring made before the producer started
+        (position,) = _READ.unpack_from(self._buffer)
+        offset = self._slot(position)
+        (size,) = _LENGTH.unpack_from(self._buffer, offset)
+        offset += _LENGTH.size
+        datagram = bytes(self._buffer[offset : offset + size])
+
+        _READ.pack_into(self._buffer, 0, position + 1)
+        return datagram
+
+    def close(self, unlink: bool = False) -> None:
+        self._buffer.release()
+        self.memory.close()
+        if unlink:
+            self.memory.unlink()
+
+
+class RingListener:
+    """A listener over a ring, to run a ``PacketHandler`` in a worker. The
+    iteration stops at the empty datagram that marks the end of the ring."""
+
+    def __init__(self, ring: Ring, backend=None):
+        self.ring = ring
+        self.backend = backend
+
+    def __iter__(self):
+        get = self.ring.get
+        while True:
+            datagram = get()
+            if not datagram:
+                return
+            packet = resolve(datagram, backend=self.backend)
+            if packet is not None:
+                yield packet
+
+
+def _work(ring: Ring, handler: type, backend) -> None:
+    try:
+        handler(RingListener(ring, backend)).handle()
+    finally:
+        ring.close()
+
+
+class PacketWorkers:
+    """Shard the datagrams of a listener across worker processes.
+
+    Every worker runs its own instance of the ``handler`` class, a
+    ``PacketHandler`` subclass, over the packets of its shard. ``shard``
+    maps a raw datagram to an integer, whose remainder by the number of
+    workers picks the worker, e.g. ``by_packet_id`` or ``by_session``. Packets
+    are handled in order within a shard.
+
+    Datagrams that arrive while the ring of their worker is full are dropped,
+    and counted in ``dropped`` by packet id. The ``only`` and ``backend`` of
+    the listener are honoured, and datagrams the handler is not subscribed to
+    are never handed over to the workers.
+    """
+
+    def __init__(
+        self,
+        listener: t.Optional[PacketListener],
+        handler: type,
+        workers: int = 4,
+        shard: t.Callable[[t.Any], int] = by_packet_id,
+        slots: int = 1024,
+    ):
+        self.listener = listener
+        self.handler = handler
+        self.shard = shard
+        # Unsubscribed packets are dropped before they reach the workers
+        self.only = narrow(
+            listener.only if listener is not None else None, handler.packet_ids()
+        )
+        self.backend = listener.backend if listener is not None else None
+        self.dropped: t.Counter[int] = collections.Counter()
+        self.rings = [Ring(slots) for _ in range(workers)]
+        self.processes: t.List[multiprocessing.Process] = []
+
+    def start(self) -> None:
+        self.processes = [
+            multiprocessing.Process(
+                target=_work, args=(ring, self.handler, self.backend), daemon=True
+            )
+            for ring in self.rings
+        ]
+        for process in self.processes:
+            process.start()
+
+    def dispatch(self, datagram) -> None:
+        """Hands a raw datagram over to the worker of its shard."""
+        if len(datagram) < PACKET_KEY.size:
+            return
+        if (
+            self.only is not None
+            and _PACKET_ID.unpack_from(datagram)[0] not in self.only
+        ):
+            return
+
+        ring = self.rings[self.shard(datagram) % len(self.rings)]
+        if not ring.put(datagram):
+            self.dropped[_PACKET_ID.unpack_from(datagram)[0]] += 1
+
+    def run(self, count: t.Optional[int] = None) -> None:
+        """Receives and dispatches datagrams from the listener, forever or
+        until ``count`` datagrams have been received."""
+        recv = self.listener.socket.recv
+        stats = self.listener.stats
+        dispatch = self.dispatch
+
+        received = 0
+        while count is None or received < count:
+            try:
+                datagram = recv(2048)
+            except socket.timeout:
+                continue
+            if stats is not None:
+                stats.update(datagram)
+            dispatch(datagram)
+            received += 1
+
+    def stop(self) -> None:
+        """Waits for the workers to handle every datagram dispatched so far,
+        then stops them."""
+        for ring in self.rings:
+            # The end marker is never dropped
+            while not ring.put(b""):
+                time.sleep(0.001)
+
+        for process in self.processes:
+            process.join()
+        for ring in self.rings:
+            ring.close(unlink=True)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
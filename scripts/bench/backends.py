@@ -0,0 +1,54 @@
+"""
+Compare the ctypes, lazy and struct decoding backends of ``resolve``.
+
+For every packet type this measures decoding alone, decoding and reading a
+couple of fields, and decoding and serialising with ``to_dict``.
+
+Run from the root folder with ``python scripts/bench/backends.py``.
+"""
+
+import sys
+from pathlib import Path
+from timeit import timeit
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from f1.lazy import lazy_type  # noqa: E402
+from f1.packets import HEADER_FIELD_TO_PACKET_TYPE  # noqa: E402
+from f1.packets import resolve  # noqa: E402
+from f1.structs import struct_type  # noqa: E402
+from test.utils import make_packet  # noqa: E402
+
+N = 20_000
+BACKENDS = {"ctypes": None, "lazy": lazy_type, "struct": struct_type}
+
+
+def read(packet, field):
+    packet.header.frame_identifier
+    getattr(packet, field)
+
+
+BENCHMARKS = {
+    "decode": lambda datagram, field, backend: resolve(datagram, backend=backend),
+    "read": lambda datagram, field, backend: read(
+        resolve(datagram, backend=backend), field
+    ),
+    "to_dict": lambda datagram, field, backend: resolve(
+        datagram, backend=backend
+    ).to_dict(),
+}
+
+
+for name, benchmark in BENCHMARKS.items():
+    n = N // 100 if name == "to_dict" else N
+
+    print(f"{name:<32}" + "".join(f"{_:>12}" for _ in BACKENDS))
+    for (_, _, packet_id), packet_type in HEADER_FIELD_TO_PACKET_TYPE.items():
+        datagram = make_packet(packet_id)
+        field, _ = packet_type._fields_[1]
+        timings = (
+            timeit(lambda: benchmark(datagram, field, backend), number=n) / n * 1e6
+            for backend in BACKENDS.values()
+        )
+        print(f"{packet_type.__name__:<32}" + "".join(f"{_:>10.1f}us" for _ in timings))
+    print()
@@ -0,0 +1,87 @@
+"""
+Compare the receive throughput of ``PacketListener.get`` with that of
+``PacketListener.get_batch``, draining the socket with ``recvmmsg`` or with a
+loop of non-blocking ``recv_into``, on bursts of datagrams from a local
+sender. Zero-copy batches are always drained with ``recv_into``, as they are
+received into pooled buffers.
+
+Run from the root folder with ``python scripts/bench/batch.py``.
+"""
+
+import socket
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from f1 import batch  # noqa: E402
+from f1.buffers import BufferPool  # noqa: E402
+from f1.listener import PacketListener  # noqa: E402
+from test.utils import make_packet  # noqa: E402
+
+BURSTS = 1_000
+REPEAT = 5
+
+# The packets of a race frame, sent back to back by the game
+BURST = [make_packet(_) for _ in (0, 2, 6, 7, 10, 13, 1, 2, 6, 7)]
+
+
+def throughput(listener, receive):
+    """Returns the best number of packets received per second"""
+    return max(_throughput(listener, receive) for _ in range(REPEAT))
+
+
+def _throughput(listener, receive):
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    address = listener.socket.getsockname()
+
+    elapsed = 0.0
+    for _ in range(BURSTS):
+        for datagram in BURST:
+            sender.sendto(datagram, address)
+
+        start = perf_counter()
+        received = 0
+        while received < len(BURST):
+            received += receive(listener)
+        elapsed += perf_counter() - start
+
+    return BURSTS * len(BURST) / elapsed
+
+
+def receive_one(listener):
+    listener.release(listener.get())
+    return 1
+
+
+def receive_batch(listener):
+    packets = listener.get_batch(len(BURST))
+    for packet in packets:
+        listener.release(packet)
+    return len(packets)
+
+
+# Toggled off to measure the recv_into fallback of MessageBuffers
+recvmmsg = batch._recvmmsg
+modes = {
+    "get": (receive_one, recvmmsg),
+    "get_batch (recv_into)": (receive_batch, None),
+    "get_batch (recvmmsg)": (receive_batch, recvmmsg),
+}
+
+print(f"{'':<24}{'copy':>14}{'zero-copy':>14}")
+for title, (receive, batch._recvmmsg) in modes.items():
+    if title.endswith("(recvmmsg)") and recvmmsg is None:
+        continue
+
+    print(
+        f"{title:<24}"
+        + "".join(
+            f"{throughput(listener, receive):>10.0f}/s  "
+            for listener in (
+                PacketListener("127.0.0.1", 0),
+                PacketListener("127.0.0.1", 0, pool=BufferPool(len(BURST))),
+            )
+        )
+    )
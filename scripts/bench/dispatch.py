@@ -0,0 +1,76 @@
+"""
+Compare dispatching packets to a handler by name, as ``PacketHandler`` used
+to for every packet, with its dispatch table, and the cost of decoding the
+packets nobody handles with that of dropping them after a header peek.
+
+Run from the root folder with ``python scripts/bench/dispatch.py``.
+"""
+
+import sys
+from pathlib import Path
+from timeit import timeit
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from f1.handler import PacketHandler  # noqa: E402
+from f1.packets import HEADER_FIELD_TO_PACKET_TYPE  # noqa: E402
+from f1.packets import resolve  # noqa: E402
+from test.utils import make_packet  # noqa: E402
+
+N = 20_000
+
+
+class Handler(PacketHandler):
+    def handle_CarTelemetryData(self, packet):
+        pass
+
+    def handle_LapData(self, packet):
+        pass
+
+
+def dispatch_by_name(handler, packet):
+    handler.handle_generic(packet)
+
+    name = packet.__class__.__name__
+    if name.startswith("Packet"):
+        name = name[6:]
+    method = getattr(handler, f"handle_{name}", None)
+    if method is not None:
+        method(packet)
+
+
+handler = Handler(None)
+datagrams = [make_packet(packet_id) for _, _, packet_id in HEADER_FIELD_TO_PACKET_TYPE]
+packets = [resolve(_) for _ in datagrams]
+only = Handler.packet_ids()
+
+
+def report(title, number, statement):
+    timing = timeit(statement, number=N) / N / number * 1e9
+    print(f"{title:<40}{timing:>10.0f}ns per packet")
+
+
+report(
+    "dispatch by name",
+    len(packets),
+    lambda: [dispatch_by_name(handler, _) for _ in packets],
+)
+report(
+    "dispatch table",
+    len(packets),
+    lambda: [handler.dispatch(_) for _ in packets],
+)
+report(
+    "resolve + dispatch, every packet",
+    len(datagrams),
+    lambda: [handler.dispatch(resolve(_)) for _ in datagrams],
+)
+report(
+    "resolve + dispatch, handled packets only",
+    len(datagrams),
+    lambda: [
+        handler.dispatch(packet)
+        for packet in (resolve(_, only=only) for _ in datagrams)
+        if packet is not None
+    ],
+)
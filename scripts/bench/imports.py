@@ -0,0 +1,69 @@
+"""
+Measure the startup cost of the library, each step in a fresh interpreter:
+importing ``f1.packets``, resolving a first packet, which imports its spec and
+builds its packet type, and building every packet type of the spec.
+
+Run from the root folder with ``python scripts/bench/imports.py``.
+"""
+
+import compileall
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parents[2]
+RUNS = 20
+
+# The datagram is made in this process, as making it builds the whole spec
+sys.path.insert(0, str(ROOT))
+
+from test.utils import make_packet  # noqa: E402
+
+STEPS = {
+    "import f1.packets": "import f1.packets",
+    "resolve one packet": (
+        "from f1.packets import resolve\n"
+        f"resolve(bytes.fromhex({make_packet(2).hex()!r}))"
+    ),
+    "build every packet type": (
+        "from f1.packets import HEADER_FIELD_TO_PACKET_TYPE\n"
+        "list(HEADER_FIELD_TO_PACKET_TYPE.values())"
+    ),
+    "to_dict of every packet type": (
+        "from f1.packets import HEADER_FIELD_TO_PACKET_TYPE\n"
+        "[_().to_dict() for _ in HEADER_FIELD_TO_PACKET_TYPE.values()]"
+    ),
+}
+
+TIMER = (
+    "from time import perf_counter\n"
+    "start = perf_counter()\n"
+    "{}\n"
+    "print(perf_counter() - start)\n"
+)
+
+
+# Make sure that no step includes compiling the sources, e.g. when
+# PYTHONDONTWRITEBYTECODE is set
+compileall.compile_dir(ROOT / "f1", quiet=1)
+
+
+def measure(code):
+    """Returns the best time out of ``RUNS`` fresh interpreters, in ms"""
+    return min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", TIMER.format(code)],
+                capture_output=True,
+                check=True,
+                cwd=ROOT,
+                text=True,
+            ).stdout
+        )
+        * 1e3
+        for _ in range(RUNS)
+    )
+
+
+for title, code in STEPS.items():
+    print(f"{title:<32}{measure(code):>8.2f}ms")
@@ -0,0 +1,49 @@
+"""
+Measure the overhead of forwarding a datagram with ``PacketRelay`` to three
+local destinations with filters and rate limits, against plain ``sendto``
+calls to the same destinations.
+
+Run from the root folder with ``python scripts/bench/relay.py``.
+"""
+
+import socket
+import sys
+from pathlib import Path
+from timeit import timeit
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from f1.listener import PacketListener  # noqa: E402
+from f1.relay import Destination  # noqa: E402
+from f1.relay import PacketRelay  # noqa: E402
+from test.utils import make_packet  # noqa: E402
+
+N = 100_000
+
+receivers = [socket.socket(socket.AF_INET, socket.SOCK_DGRAM) for _ in range(3)]
+for receiver in receivers:
+    receiver.bind(("127.0.0.1", 0))
+    # Keep the receive queues from filling up with the datagrams forwarded
+    receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1)
+addresses = [_.getsockname() for _ in receivers]
+
+listener = PacketListener("127.0.0.1", 0)
+relay = PacketRelay(
+    listener,
+    [
+        Destination(addresses[0]),
+        Destination(addresses[1], only={0, 2, 6}),
+        Destination(addresses[2], only={6}, rate=1e9),
+    ],
+)
+datagram = make_packet(6)
+sendto = listener.socket.sendto
+
+
+def plain():
+    for address in addresses:
+        sendto(datagram, address)
+
+
+for title, forward in (("sendto", plain), ("relay", lambda: relay.forward(datagram))):
+    print(f"{title:<12}{timeit(forward, number=N) / N * 1e6:>8.2f}us")
@@ -0,0 +1,79 @@
+"""
+Compare the copying, zero-copy and in-place decode paths, both on their own
+and end-to-end through a ``PacketListener`` on a local socket.
+
+Run from the root folder with ``python scripts/bench/resolve.py``.
+"""
+
+import socket
+import sys
+from pathlib import Path
+from timeit import timeit
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from f1.buffers import BufferPool  # noqa: E402
+from f1.listener import PacketListener  # noqa: E402
+from f1.packets import HEADER_FIELD_TO_PACKET_TYPE  # noqa: E402
+from f1.packets import resolve  # noqa: E402
+from test.utils import make_packet  # noqa: E402
+
+N = 100_000
+MODES = ("copy", "zero-copy", "in-place")
+
+
+def report(title, *timings):
+    print(
+        f"{title:<32}"
+        + "".join(f"{_:>10.0f}ns" for _ in timings)
+        + "".join(f"{timings[0] / _:>9.2f}x" for _ in timings[1:])
+    )
+
+
+def header(title):
+    print(
+        f"{title:<32}"
+        + "".join(f"{_:>12}" for _ in MODES)
+        + "".join(f"{_:>10}" for _ in MODES[1:])
+    )
+
+
+header("resolve")
+for (_, _, packet_id), packet_type in HEADER_FIELD_TO_PACKET_TYPE.items():
+    datagram = make_packet(packet_id)
+    view = memoryview(bytearray(datagram))
+    packet = packet_type()
+
+    report(
+        packet_type.__name__,
+        timeit(lambda: resolve(datagram), number=N) / N * 1e9,
+        timeit(lambda: resolve(view, copy=False), number=N) / N * 1e9,
+        timeit(lambda: packet.unpack_into(datagram), number=N) / N * 1e9,
+    )
+
+
+print()
+header("listener")
+sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+listeners = (
+    PacketListener("127.0.0.1", 0),
+    PacketListener("127.0.0.1", 0, pool=BufferPool()),
+    PacketListener("127.0.0.1", 0, reuse=True),
+)
+
+
+def roundtrip(listener, datagram):
+    sender.sendto(datagram, listener.socket.getsockname())
+    listener.release(listener.get())
+
+
+for (_, _, packet_id), packet_type in HEADER_FIELD_TO_PACKET_TYPE.items():
+    datagram = make_packet(packet_id)
+
+    report(
+        packet_type.__name__,
+        *(
+            timeit(lambda: roundtrip(listener, datagram), number=N // 10) / N * 1e10
+            for listener in listeners
+        ),
+    )
@@ -0,0 +1,59 @@
+"""
+Compare the compiled per-class ``to_dict`` serializers with the generic one
+they replace, which formats every field through ``_format_type``.
+
+Run from the root folder with ``python scripts/bench/to_dict.py``.
+"""
+
+import ctypes
+import sys
+from pathlib import Path
+from timeit import timeit
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from f1.packets import HEADER_FIELD_TO_PACKET_TYPE  # noqa: E402
+from f1.packets import Packet  # noqa: E402
+from f1.packets import resolve  # noqa: E402
+from test.utils import make_packet  # noqa: E402
+
+N = 2_000
+
+
+def generic_to_dict(packet):
+    return {k: generic_format_type(getattr(packet, k)) for k, _ in packet._fields_}
+
+
+def generic_format_type(value):
+    class_name = type(value).__name__
+
+    if class_name == "float":
+        return round(value, 3)
+
+    if class_name == "bytes":
+        return value.decode()
+
+    if isinstance(value, ctypes.Array):
+        return [
+            generic_to_dict(item) if isinstance(item, Packet) else item
+            for item in value
+        ]
+
+    if hasattr(value, "to_dict"):
+        return generic_to_dict(value)
+
+    return value
+
+
+print(f"{'Packet':<32}{'generic':>12}{'compiled':>12}{'speedup':>10}")
+for (_, _, packet_id), packet_type in HEADER_FIELD_TO_PACKET_TYPE.items():
+    packet = resolve(make_packet(packet_id))
+    assert generic_to_dict(packet) == packet.to_dict()
+
+    generic = timeit(lambda: generic_to_dict(packet), number=N) / N * 1e6
+    compiled = timeit(lambda: packet.to_dict(), number=N) / N * 1e6
+
+    print(
+        f"{packet_type.__name__:<32}{generic:>10.1f}us{compiled:>10.1f}us"
+        f"{generic / compiled:>9.2f}x"
+    )
@@ -0,0 +1,50 @@
+"""
+Measure how the handling throughput of ``PacketWorkers`` scales with the
+number of worker processes, with a handler that serializes every packet a few
+times over to stand for heavy analytics.
+
+Run from the root folder with ``python scripts/bench/workers.py [max workers]``,
+which defaults to the number of CPUs.
+"""
+
+import os
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from f1.handler import PacketHandler  # noqa: E402
+from f1.workers import PacketWorkers  # noqa: E402
+from test.utils import make_packet  # noqa: E402
+
+N = 4_000
+WORKERS = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+
+DATAGRAMS = [make_packet(_ % 16, frame_identifier=_) for _ in range(N)]
+
+
+class HeavyHandler(PacketHandler):
+    def handle_generic(self, packet):
+        for _ in range(5):
+            packet.to_dict()
+
+
+def throughput(workers):
+    """Returns the number of packets handled per second"""
+    start = perf_counter()
+    with PacketWorkers(None, HeavyHandler, workers=workers, slots=N) as pool:
+        for datagram in DATAGRAMS:
+            pool.dispatch(datagram)
+    assert not pool.dropped
+
+    return N / (perf_counter() - start)
+
+
+if __name__ == "__main__":
+    single = None
+    print(f"{'workers':<10}{'packets/s':>12}{'speedup':>10}")
+    for workers in range(1, WORKERS + 1):
+        result = throughput(workers)
+        single = single or result
+        print(f"{workers:<10}{result:>12.0f}{result / single:>9.2f}x")
@@ -1,7 +1,7 @@
 import re
+import struct
 import typing as t
 from dataclasses import dataclass, field
-from datetime import date
 from pathlib import Path
 
 
@@ -241,70 +241,340 @@ class SpecParser(StackFSM):
             return
 
 
+def field_name(f: Field) -> t.Optional[str]:
+    name = camel_to_snake(f.name)
+    if name.startswith("*cs_"):
+        return None  # skip local constants
+    if name.startswith("m_"):
+        name = name[2:]
+    return name
+
+
 class SpecVisitor(NodeVisitor):
-    def __init__(self, node: Node) -> None:
+    """Emit the ctypes packet types.
+
+    The types that only a single packet depends on are emitted in a builder
+    function of that packet, so that they are only built on first use. Shared
+    types, such as the header, are built with the module.
+    """
+
+    def __init__(self, node: Node, year: int) -> None:
         super().__init__(node)
+        self._year = year
         self._structures = set()
         self._packets = []
+        # name -> (class lines, names of the structures it depends on)
+        self._classes: t.Dict[str, t.Tuple[t.List[str], t.Set[str]]] = {}
 
     def visit_Structure(self, node: Structure) -> None:
         self._structures.add(node.name)
         if node.name.startswith("Packet"):
             self._packets.append(node.name)
 
-        print(f"class {node.name}(Packet):")
-        print("    _fields_ = [")
+        lines = [f"class {node.name}(Packet):", "    _fields_ = ["]
+        deps = set()
 
         for f in node.fields:
-            name = camel_to_snake(f.name)
-            if name.startswith("*cs_"):
-                continue  # skip local constants
-            if name.startswith("m_"):
-                name = name[2:]
+            name = field_name(f)
+            if name is None:
+                continue
             if isinstance(f.type, Array):
-                _type = (
-                    f.type.type
-                    if f.type.type in self._structures
-                    else f"ctypes.c_{f.type.type}"
-                )
+                if f.type.type in self._structures:
+                    _type = f.type.type
+                    deps.add(_type)
+                else:
+                    _type = f"ctypes.c_{f.type.type}"
 
-                print(" " * 8 + f'("{name}", {_type} * {f.type.size}),')
+                lines.append(" " * 8 + f'("{name}", {_type} * {f.type.size}),')
             else:
-                _type = f.type if f.type in self._structures else f"ctypes.c_{f.type}"
+                if f.type in self._structures:
+                    _type = f.type
+                    deps.add(_type)
+                else:
+                    _type = f"ctypes.c_{f.type}"
+
+                lines.append(" " * 8 + f'("{name}", {_type}),')
+        lines.append("    ]")
 
-                print(" " * 8 + f'("{name}", {_type}),')
-        print("    ]\n\n")
+        self._classes[node.name] = (lines, deps)
 
     def visit_Union(self, node: Union) -> None:
         self._structures.add(node.name)
 
+        lines = [f"class {node.name}(ctypes.Union, PacketMixin):", "    _fields_ = ["]
+        deps = set()
         for field in node.fields:
             field.type.name = snake_to_camel(camel_to_snake(field.name))
             self.visit_Structure(field.type)
 
-        print(f"class {node.name}(ctypes.Union, PacketMixin):")
-        print("    _fields_ = [")
-        for field in node.fields:
             name = camel_to_snake(field.name)
-            _type = snake_to_camel(camel_to_snake(field.name))
-            print(" " * 8 + f'("{name}", {_type}),')
-        print("    ]\n\n")
+            deps.add(field.type.name)
+            lines.append(" " * 8 + f'("{name}", {field.type.name}),')
+        lines.append("    ]")
+
+        self._classes[node.name] = (lines, deps)
+
+    def closure(self, name: str) -> t.Set[str]:
+        """Returns the structures a structure depends on, itself included"""
+        names = {name}
+        for dep in self._classes[name][1]:
+            names |= self.closure(dep)
+        return names
+
+    def emit_builders(self) -> None:
+        packets = self._packets[1:]
+        owners: t.Dict[str, t.List[str]] = {}
+        for packet in packets:
+            for name in self.closure(packet):
+                owners.setdefault(name, []).append(packet)
+
+        # Shared structures are built with the module
+        for name, (lines, _) in self._classes.items():
+            if len(owners.get(name, ())) != 1:
+                print("\n".join(lines))
+                print("\n")
+
+        builders = {}
+        for packet in packets:
+            names = [_ for _ in self._classes if owners.get(_) == [packet]]
+            builder = f"_build_{camel_to_snake(packet)}"
+            builders.update((_, builder) for _ in names)
+
+            print(f"def {builder}():")
+            for name in names:
+                for line in self._classes[name][0]:
+                    print(f"    {line}")
+                print()
+
+            returned = ", ".join(names)
+            if len(names) == 1:
+                print(f"    return ({returned},)")
+            elif len(f"    return {returned}") <= 88:
+                print(f"    return {returned}")
+            elif len(f"        {returned}") <= 88:
+                print("    return (")
+                print(f"        {returned}")
+                print("    )")
+            else:
+                print("    return (")
+                for name in names:
+                    print(f"        {name},")
+                print("    )")
+            print("\n")
+
+        print("_BUILDERS = {")
+        for name, builder in builders.items():
+            print(f'    "{name}": {builder},')
+        print("}")
+        print()
+        print("__getattr__ = specs.lazy_getattr(globals(), _BUILDERS)")
+        print()
 
     def emit_header_field_to_packet_type(self) -> None:
-        year = date.today().year
-        print("HEADER_FIELD_TO_PACKET_TYPE = {")
+        print("HEADER_FIELD_TO_PACKET_TYPE = specs.PacketTypes(")
+        print("    __name__,")
+        print("    {")
         for i, packet in enumerate(self._packets[1:]):
-            print(f"    ({year}, 1, {i}): {packet},")
-        print("}")
+            print(f'        ({self._year}, 1, {i}): "{packet}",')
+        print("    },")
+        print(")")
 
     def visit(self) -> None:
         super().visit()
+        self.emit_builders()
         self.emit_header_field_to_packet_type()
 
 
-text = preprocess(
-    (Path(__file__).parent.parent / "data" / "spec.h").open(encoding="utf-8").read()
-)
+STRUCT_CODES = {
+    "uint8": "B",
+    "int8": "b",
+    "uint16": "H",
+    "int16": "h",
+    "uint32": "I",
+    "int32": "i",
+    "uint": "I",
+    "int": "i",
+    "uint64": "Q",
+    "int64": "q",
+    "float": "f",
+    "double": "d",
+}
+
+
+class StructSpecVisitor(NodeVisitor):
+    """Emit records for the pure struct backend.
+
+    Every structure is flattened into a single struct format, and its record
+    is built from the flat tuple of values with precomputed indices.
+    """
+
+    def __init__(self, node: Node) -> None:
+        super().__init__(node)
+        # name -> (flat format, number of flat values)
+        self._records: t.Dict[str, t.Tuple[str, int]] = {}
+
+    @staticmethod
+    def at(i: int) -> str:
+        return f"i + {i}" if i else "i"
+
+    def visit_Structure(self, node: Structure) -> None:
+        names = []
+        formats = []  # format expressions
+        flat_format = ""
+        values = []  # value expressions, or indices of scalar values
+        length = 0
+
+        for f in node.fields:
+            name = field_name(f)
+            if name is None:
+                continue
+            names.append(name)
+
+            if isinstance(f.type, Array) and f.type.type in self._records:
+                _format, _length = self._records[f.type.type]
+                end = length + f.type.size * _length
+                formats.append(f"{f.type.type}._format_ * {f.type.size}")
+                flat_format += _format * f.type.size
+                values.append(
+                    f"[{f.type.type}._build(v, j) "
+                    f"for j in range({self.at(length)}, i + {end}, {_length})]"
+                )
+                length = end
+
+            elif isinstance(f.type, Array) and f.type.type == "char":
+                formats.append(f'"{f.type.size}s"')
+                flat_format += f"{f.type.size}s"
+                values.append(f'v[{self.at(length)}].split(b"\\0", 1)[0]')
+                length += 1
+
+            elif isinstance(f.type, Array):
+                code = f"{f.type.size}{STRUCT_CODES[f.type.type]}"
+                formats.append(f'"{code}"')
+                flat_format += code
+                values.append(f"v[{self.at(length)} : i + {length + f.type.size}]")
+                length += f.type.size
+
+            elif f.type in self._records:
+                _format, _length = self._records[f.type]
+                formats.append(f"{f.type}._format_")
+                flat_format += _format
+                values.append(f"{f.type}._build(v, {self.at(length)})")
+                length += _length
+
+            else:
+                formats.append(f'"{STRUCT_CODES[f.type]}"')
+                flat_format += STRUCT_CODES[f.type]
+                values.append(length)
+                length += 1
+
+        self._records[node.name] = (flat_format, length)
+
+        # Merge adjacent literal formats
+        merged = []
+        for _format in formats:
+            if merged and merged[-1].endswith('"') and _format.startswith('"'):
+                merged[-1] = merged[-1][:-1] + _format[1:]
+            else:
+                merged.append(_format)
+
+        print(f"class {node.name}(Record):")
+        print("    __slots__ = ()")
+        if len(names) == 1:
+            print(f'    _fields_ = ("{names[0]}",)')
+        else:
+            print("    _fields_ = (")
+            for name in names:
+                print(f'        "{name}",')
+            print("    )")
+        if len(f"    _format_ = {' + '.join(merged)}") <= 88:
+            print(f"    _format_ = {' + '.join(merged)}")
+        else:
+            print("    _format_ = (")
+            print(f"        {merged[0]}")
+            for _format in merged[1:]:
+                print(f"        + {_format}")
+            print("    )")
+        print(f"    _length_ = {length}")
+
+        if length == len(names):
+            # Flat records are built by the base class
+            print("\n")
+            return
+
+        # Splice runs of scalar values from the flat tuple
+        items = []
+        run: t.List[int] = []
+        for value in values + [None]:
+            if isinstance(value, int):
+                run.append(value)
+                continue
+            if len(run) == 1:
+                items.append(f"v[{self.at(run[0])}]")
+            elif run:
+                items.append(f"*v[{self.at(run[0])} : i + {run[-1] + 1}]")
+            run = []
+            if value is not None:
+                items.append(value)
+
+        print()
+        print("    @staticmethod")
+        print("    def _build(v, i):")
+        print("        return _new(")
+        print(f"            {node.name},")
+        print("            (")
+        for item in items:
+            if len(item) + 17 <= 88 or not item.startswith("["):
+                print(f"                {item},")
+                continue
+            expr, _, loop = item[1:-1].partition(" for ")
+            print("                [")
+            print(f"                    {expr}")
+            print(f"                    for {loop}")
+            print("                ],")
+        print("            ),")
+        print("        )")
+        print("\n")
+
+    def visit_Union(self, node: Union) -> None:
+        members = []
+        size = 0
+        for field in node.fields:
+            field.type.name = snake_to_camel(camel_to_snake(field.name))
+            self.visit_Structure(field.type)
+            members.append((camel_to_snake(field.name), field.type.name))
+            size = max(size, struct.calcsize("<" + self._records[field.type.name][0]))
+
+        self._records[node.name] = (f"{size}s", 1)
+
+        print(f"class {node.name}(UnionRecord):")
+        print("    __slots__ = ()")
+        print(f'    _format_ = "{size}s"')
+        print()
+        for name, _type in members:
+            print(f"    {name} = UnionMember({_type})")
+        print("\n")
+
+
+def parse(year: int) -> Spec:
+    """Parse the spec of the given year, i.e. packet format, from data/<year>.h"""
+    text = preprocess(
+        (Path(__file__).parent.parent / "data" / f"{year}.h")
+        .open(encoding="utf-8")
+        .read()
+    )
+
+    return SpecParser(text).parse()
+
+
+def emit_ctypes(year: int) -> None:
+    SpecVisitor(parse(year), year).visit()
+
+
+def emit_structs(year: int) -> None:
+    StructSpecVisitor(parse(year)).visit()
+
+
+if __name__ == "__main__":
+    import sys
 
-spec = SpecParser(text).parse()
-SpecVisitor(spec).visit()
+    emit_ctypes(int(sys.argv[1]))
@@ -1,35 +1,24 @@
-import pickle
-from collections import defaultdict
+"""
+Record the datagrams received on the telemetry port to a capture directory,
+``test/packets`` by default, until interrupted.
 
-import f1.listener
-from f1.handler import PacketHandler
-from f1.listener import PacketListener
+Run from the root folder with ``python scripts/recorder.py [directory]``.
+"""
 
+import sys
+from pathlib import Path
 
-class PacketRecorder(PacketHandler):
-    def __init__(self, listener):
-        super().__init__(listener)
-        self._packets = defaultdict(list)
+sys.path.insert(0, str(Path(__file__).parents[1]))
 
-        self.resolve = f1.listener.resolve
-        f1.listener.resolve = self._resolve
+from f1.listener import PacketListener  # noqa: E402
+from f1.recorder import PacketRecorder  # noqa: E402
 
-    def _resolve(self, packet):
-        resolved = self.resolve(packet)
+path = sys.argv[1] if len(sys.argv) > 1 else "test/packets"
 
-        packet_list = self._packets[type(resolved).__name__]
-        if len(packet_list) < 1000:
-            packet_list.append(packet)
-            print(f"Added packet {len(packet_list)} to {type(resolved).__name__}")
+with PacketRecorder(path) as recorder:
+    try:
+        recorder.record(PacketListener())
+    except KeyboardInterrupt:
+        pass
 
-        return resolved
-
-
-handler = PacketRecorder(PacketListener())
-
-try:
-    handler.handle()
-except KeyboardInterrupt:
-    with open("test/packets.pickle", "wb") as f:
-        pickle.dump(handler._packets, f)
-    print("Data recording completed")
+print(f"Recorded {recorder.recorded} datagrams to {path}")
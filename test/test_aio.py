@@ -0,0 +1,76 @@
+import asyncio
+import socket
+
+from f1.aio import AsyncPacketHandler
+from f1.aio import AsyncPacketListener
+from f1.packets import PacketCarTelemetryData
+from test.utils import make_packet
+
+
+def send(listener, *datagrams):
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        for datagram in datagrams:
+            s.sendto(datagram, listener.getsockname())
+
+
+def test_async_listener():
+    async def main():
+        async with AsyncPacketListener("127.0.0.1", 0, only={6}) as listener:
+            send(listener, make_packet(2), make_packet(6))
+
+            async for packet in listener:
+                return packet
+
+    packet = asyncio.run(main())
+
+    assert isinstance(packet, PacketCarTelemetryData)
+    assert packet.pack() == make_packet(6)
+
+
+def test_async_listener_drops_oldest():
+    async def main():
+        async with AsyncPacketListener("127.0.0.1", 0, maxsize=2) as listener:
+            send(listener, *(make_packet(6, frame_identifier=i) for i in range(4)))
+            while listener._queue.qsize() + listener.dropped < 4:
+                await asyncio.sleep(0.01)
+
+            return listener.dropped, [
+                (await listener.get()).header.frame_identifier for _ in range(2)
+            ]
+
+    assert asyncio.run(main()) == (2, [2, 3])
+
+
+def test_async_handler():
+    class Done(Exception):
+        pass
+
+    class Handler(AsyncPacketHandler):
+        async def handle_CarTelemetryData(self, packet):
+            raise Done(packet)
+
+    async def main():
+        async with AsyncPacketListener("127.0.0.1", 0) as listener:
+            send(listener, make_packet(2), make_packet(6))
+            try:
+                await Handler(listener).handle()
+            except Done as e:
+                return e.args[0]
+
+    assert isinstance(asyncio.run(main()), PacketCarTelemetryData)
+
+
+def test_async_handler_subscriptions():
+    class Handler(AsyncPacketHandler):
+        async def handle_CarTelemetryData(self, packet):
+            pass
+
+    class Generic(Handler):
+        async def handle_generic(self, packet):
+            pass
+
+    listener = AsyncPacketListener("127.0.0.1", 0)
+    Handler(listener).subscribe()
+
+    assert listener.only == {6}
+    assert Generic.packet_ids() is None
@@ -0,0 +1,48 @@
+import ctypes
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from f1.arrays import decode_batch  # noqa: E402
+from f1.arrays import dtype  # noqa: E402
+from f1.packets import HEADER_FIELD_TO_PACKET_TYPE  # noqa: E402
+from f1.packets import PacketCarTelemetryData  # noqa: E402
+from f1.packets import PacketParticipantsData  # noqa: E402
+from test.utils import make_packet  # noqa: E402
+
+
+def test_dtype_size():
+    for packet_type in HEADER_FIELD_TO_PACKET_TYPE.values():
+        assert dtype(packet_type).itemsize == ctypes.sizeof(packet_type)
+
+
+def test_decode_batch():
+    datagrams = [make_packet(6, frame_identifier=i) for i in range(10)]
+    batch = decode_batch(PacketCarTelemetryData, datagrams)
+    packet = PacketCarTelemetryData.unpack(datagrams[-1])
+
+    assert batch.shape == (10,)
+    assert batch["header"]["frame_identifier"].tolist() == list(range(10))
+
+    telemetry = batch["car_telemetry_data"]
+    assert telemetry["speed"].shape == (10, 22)
+    assert telemetry["speed"][-1, 5] == packet.car_telemetry_data[5].speed
+    assert telemetry["tyres_pressure"].shape == (10, 22, 4)
+    assert telemetry["tyres_pressure"][-1, 5].tolist() == list(
+        packet.car_telemetry_data[5].tyres_pressure
+    )
+
+
+def test_decode_batch_strings():
+    (participants,) = decode_batch(PacketParticipantsData, [make_packet(4)])
+
+    assert (
+        participants["participants"]["name"][3]
+        == PacketParticipantsData.unpack(make_packet(4)).participants[3].name
+    )
+
+
+def test_decode_batch_short_buffer():
+    with pytest.raises(ValueError):
+        decode_batch(PacketCarTelemetryData, [make_packet(6)[:-1]])
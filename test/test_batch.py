@@ -0,0 +1,30 @@
+import socket
+
+import pytest
+
+from f1.batch import MessageBuffers
+from f1.batch import recv_batch
+
+
+@pytest.mark.parametrize("use_recvmmsg", [None, True, False])
+def test_recv_batch(use_recvmmsg):
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as receiver:
+        receiver.bind(("127.0.0.1", 0))
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+            for i in range(3):
+                sender.sendto(bytes([i]) * (i + 1), receiver.getsockname())
+
+        if use_recvmmsg is None:
+            buffers = [bytearray(16) for _ in range(4)]
+            sizes = recv_batch(receiver, buffers)
+        else:
+            batch = MessageBuffers(4, 16, use_recvmmsg)
+            buffers = batch.buffers
+            sizes = batch.recv(receiver)
+
+    assert sizes == [1, 2, 3]
+    assert [bytes(_[:n]) for _, n in zip(buffers, sizes)] == [
+        b"\0",
+        b"\1\1",
+        b"\2\2\2",
+    ]
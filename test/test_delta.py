@@ -0,0 +1,34 @@
+import json
+
+from f1.delta import DeltaEncoder
+from f1.packets import PacketCarStatusData
+from f1.packets import resolve
+from test.utils import make_packet
+
+
+def test_delta():
+    encoder = DeltaEncoder(only={7}, keyframe_interval=3)
+    datagram = make_packet(7)
+    packet = PacketCarStatusData.unpack(datagram)
+    packet.car_status_data[3].fuel_in_tank = 12.5
+    packet.car_status_data[3].drs_allowed = 1
+    packet.header.frame_identifier = 1
+
+    keyframe = encoder.encode(datagram)
+    delta = encoder.encode(packet.pack())
+
+    assert encoder.encode(make_packet(6)) is None
+    assert keyframe.keyframe
+    assert keyframe.changes["car_status_data"][3] == (
+        resolve(datagram).car_status_data[3].to_dict()
+    )
+    assert delta == (
+        7,
+        0xF1,
+        1,
+        False,
+        {"car_status_data": {3: {"fuel_in_tank": 12.5, "drs_allowed": 1}}},
+    )
+    assert encoder.encode(packet.pack()) is None
+    assert encoder.encode(packet.pack()).keyframe
+    assert len(json.dumps(delta._asdict())) < len(json.dumps(keyframe._asdict())) / 50
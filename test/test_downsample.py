@@ -0,0 +1,81 @@
+from f1.downsample import Aggregate
+from f1.downsample import Aggregation
+from f1.downsample import Coalesce
+from f1.downsample import Decimate
+from f1.downsample import Downsampler
+from f1.handler import PacketHandler
+from f1.listener import PacketListener
+from f1.packets import PacketCarTelemetryData
+from f1.packets import PacketEventData
+from test.utils import make_packet
+
+
+def telemetry(frame, speed):
+    packet = PacketCarTelemetryData.unpack(make_packet(6, frame_identifier=frame))
+    packet.car_telemetry_data[0].speed = speed
+    packet.car_telemetry_data[0].tyres_pressure[1] = speed
+    return packet.pack()
+
+
+def test_downsampler():
+    now = [0.0]
+    listener = PacketListener("127.0.0.1", 0)
+    downsampler = Downsampler(
+        listener,
+        {0: Decimate(every=3), 2: Coalesce(rate=10), 6: Decimate(rate=10)},
+        clock=lambda: now[0],
+    )
+
+    emitted = []
+    for frame in range(6):
+        now[0] = frame * 0.04
+        for packet_id in (0, 2, 3, 6):
+            packet = downsampler.process(make_packet(packet_id, frame_identifier=frame))
+            if packet is not None:
+                emitted.append(
+                    (packet.header.packet_id, packet.header.frame_identifier)
+                )
+
+    (held,) = downsampler.flush()
+    assert [_ for _ in emitted if _[0] == 0] == [(0, 0), (0, 3)]
+    assert [_ for _ in emitted if _[0] == 2] == [(2, 2)]
+    assert [_ for _ in emitted if _[0] == 3] == [(3, _) for _ in range(6)]
+    assert [_ for _ in emitted if _[0] == 6] == [(6, 0), (6, 3)]
+    assert held.header.frame_identifier == 5
+    assert downsampler.skipped() == {0: 4, 2: 4, 6: 4}
+
+
+def test_downsampler_aggregate():
+    now = [0.0]
+
+    class Handler(PacketHandler):
+        def handle_Aggregation(self, aggregation):
+            self.aggregations.append(aggregation)
+
+        def handle_EventData(self, packet):
+            self.aggregations.append(packet)
+
+    listener = PacketListener("127.0.0.1", 0)
+    downsampler = Downsampler(
+        listener,
+        {6: Aggregate(["speed", "tyres_pressure"], rate=5)},
+        clock=lambda: now[0],
+    )
+    handler = Handler(downsampler)
+    handler.aggregations = []
+
+    for now[0], speed in ((0.0, 100), (0.1, 300), (0.15, 200), (0.2, 50)):
+        handler.dispatch(downsampler.process(make_packet(3)))
+        packet = downsampler.process(telemetry(int(now[0] * 100), speed))
+        if packet is not None:
+            handler.dispatch(packet)
+
+    *events, aggregation = handler.aggregations
+    assert all(isinstance(_, PacketEventData) for _ in events)
+    assert len(events) == 4
+    assert isinstance(aggregation, Aggregation)
+    assert (aggregation.count, aggregation.frame_identifier) == (3, 15)
+    speed = aggregation.fields["speed"]
+    assert (speed["min"][0], speed["max"][0], speed["mean"][0]) == (100, 300, 200)
+    assert aggregation.fields["tyres_pressure"]["max"][0][1] == 300
+    assert downsampler.flush()[0].count == 1
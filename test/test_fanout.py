@@ -0,0 +1,107 @@
+import threading
+import time
+
+import pytest
+
+from f1.aio import AsyncPacketHandler
+from f1.fanout import ASYNCIO
+from f1.fanout import PROCESS
+from f1.fanout import FanoutHandler
+from f1.handler import PacketHandler
+from f1.listener import PacketListener
+from f1.packets import resolve
+from f1.pipeline import DROP_NEWEST
+from f1.structs import struct_type
+from test.test_workers import RecordingHandler
+from test.utils import make_packet
+
+
+class LapHandler(PacketHandler):
+    def __init__(self, listener, blocked=None):
+        super().__init__(listener)
+        self.blocked = blocked
+        self.frames = []
+
+    def handle_LapData(self, packet):
+        if self.blocked is not None:
+            self.blocked.wait()
+        self.frames.append(packet.header.frame_identifier)
+
+
+class AsyncHandler(AsyncPacketHandler):
+    def __init__(self, listener):
+        super().__init__(listener)
+        self.received = []
+
+    async def handle_generic(self, packet):
+        self.received.append(packet.header.packet_id)
+
+
+def test_fanout():
+    now = [0.0]
+    listener = PacketListener("127.0.0.1", 0)
+    fanout = FanoutHandler(listener, clock=lambda: now[0])
+    blocked = threading.Event()
+    slow, fast = LapHandler(fanout, blocked), LapHandler(fanout)
+    other = AsyncHandler(fanout)
+    fanout.register(slow, maxsize=2, name="slow")
+    fanout.register(fast, drop=DROP_NEWEST, name="fast")
+    fanout.register(other, executor=ASYNCIO)
+
+    fanout.subscribe()
+    assert listener.only is None
+
+    with fanout:
+        for frame in range(5):
+            now[0] = frame
+            fanout.dispatch(resolve(make_packet(2, frame_identifier=frame)))
+            fanout.dispatch(resolve(make_packet(6, frame_identifier=frame)))
+            # Wait for the slow handler to block on the first packet
+            while fanout.metrics()["slow"]["depth"] and not frame:
+                time.sleep(0.001)
+
+        # The slow handler holds one packet, and only the 2 newest are queued
+        metrics = fanout.metrics()
+        assert metrics["slow"]["depth"] == 2
+        assert metrics["slow"]["lag"] == 1.0
+        assert metrics["slow"]["dropped"] == 2
+        blocked.set()
+
+    assert fast.frames == [0, 1, 2, 3, 4]
+    assert slow.frames == [0, 3, 4]
+    assert other.received == [2, 6] * 5
+    assert fanout.metrics()["fast"] == {
+        "depth": 0,
+        "lag": 0.0,
+        "dropped": 0,
+        "handled": 5,
+    }
+
+
+def test_fanout_process(tmp_path, monkeypatch):
+    path = tmp_path / "handled"
+    monkeypatch.setenv("F1_TEST_WORKERS", str(path))
+    listener = PacketListener("127.0.0.1", 0, only={2, 6})
+    fanout = FanoutHandler(listener)
+    fanout.register(LapHandler(fanout))
+    fanout.register(RecordingHandler, executor=PROCESS)
+
+    with pytest.raises(ValueError):
+        fanout.register(RecordingHandler(fanout), executor=PROCESS, name="other")
+
+    with fanout:
+        for frame in range(3):
+            fanout.dispatch(resolve(make_packet(6, frame_identifier=frame)))
+
+    handled = [_.split()[1:] for _ in path.read_text().splitlines()]
+    assert handled == [["6", str(_)] for _ in range(3)]
+    assert fanout.metrics()["RecordingHandler"]["handled"] == 3
+
+
+def test_fanout_process_struct_backend():
+    listener = PacketListener("127.0.0.1", 0, backend=struct_type)
+    fanout = FanoutHandler(listener)
+
+    with pytest.raises(ValueError):
+        fanout.register(RecordingHandler, executor=PROCESS)
+    assert not fanout.sinks
@@ -0,0 +1,81 @@
+import pytest
+
+from f1.frames import FrameAssembler
+from f1.frames import FrameHandler
+from f1.packets import resolve
+from test.utils import make_packet
+
+
+def packet(packet_id, frame, overall_frame=None):
+    packet = resolve(make_packet(packet_id, frame_identifier=frame))
+    if overall_frame is not None:
+        packet.header.overall_frame_identifier = overall_frame
+    return packet
+
+
+def test_frame_assembler():
+    now = [0.0]
+    assembler = FrameAssembler({0, 2}, timeout=1, max_frames=2, clock=lambda: now[0])
+
+    assert assembler.add(packet(0, 1)) == []
+    assert assembler.add(packet(6, 1)) == []
+    (frame,) = assembler.add(packet(2, 1))
+    assert (frame.frame_identifier, sorted(frame.packets)) == (1, [0, 2])
+
+    # Late for frame 1, then frame 2 is pushed out by frames 3 and 4
+    assert assembler.add(packet(2, 1)) == []
+    assert assembler.add(packet(2, 2)) == []
+    now[0] = 0.5
+    assert assembler.add(packet(0, 3)) == []
+    now[0] = 0.8
+    (frame,) = assembler.add(packet(0, 4))
+    assert (frame.frame_identifier, list(frame.packets)) == (2, [2])
+
+    now[0] = 1.6
+    assert [_.frame_identifier for _ in assembler.expire()] == [3]
+    assert [_.frame_identifier for _ in assembler.flush()] == [4]
+    assert (assembler.incomplete, assembler.late, len(assembler)) == (3, 1, 0)
+
+
+def test_frame_assembler_flashback():
+    assembler = FrameAssembler({0, 2})
+
+    emitted = []
+    for frame in range(100, 103):
+        for packet_id in (0, 2):
+            emitted += assembler.add(packet(packet_id, frame))
+    # The frame identifier goes back, the overall frame identifier does not
+    for frame in range(50, 53):
+        for packet_id in (0, 2):
+            emitted += assembler.add(packet(packet_id, frame, frame + 53))
+
+    assert [(_.frame_identifier, _.overall_frame_identifier) for _ in emitted] == [
+        (100, 100),
+        (101, 101),
+        (102, 102),
+        (50, 103),
+        (51, 104),
+        (52, 105),
+    ]
+    assert assembler.late == 0
+
+
+def test_frame_handler():
+    class Handler(FrameHandler):
+        subscriptions = {"MotionData", "LapData"}
+
+        def handle_frame(self, frame):
+            self.frames.append((frame.frame_identifier, sorted(frame.packets)))
+
+    class Undeclared(FrameHandler):
+        pass
+
+    handler = Handler(None)
+    handler.frames = []
+    for frame in range(2):
+        for packet_id in (0, 2):
+            handler.dispatch(packet(packet_id, frame))
+
+    assert handler.frames == [(0, [0, 2]), (1, [0, 2])]
+    with pytest.raises(ValueError):
+        Undeclared(None)
@@ -0,0 +1,91 @@
+import pytest
+
+from f1.handler import PacketHandler
+from f1.listener import PacketListener
+from f1.packets import resolve
+from f1.pipeline import PacketPipeline
+from f1.structs import struct_type
+from test.test_listener import send
+from test.utils import make_packet
+
+
+class LapHandler(PacketHandler):
+    def __init__(self, listener):
+        super().__init__(listener)
+        self.handled = []
+
+    def handle_LapData(self, packet):
+        self.handled.append(packet.header.packet_id)
+
+
+def test_handler_dispatch():
+    handler = LapHandler(None)
+
+    for packet_id in (2, 6, 2):
+        handler.dispatch(resolve(make_packet(packet_id)))
+    handler.dispatch(resolve(make_packet(2), backend=struct_type))
+
+    assert handler.handled == [2, 2, 2]
+    assert LapHandler.packet_ids() == {2}
+    assert PacketHandler.packet_ids() == frozenset()
+
+
+def test_handler_generic():
+    class Handler(LapHandler):
+        def handle_generic(self, packet):
+            self.handled.append(None)
+
+    handler = Handler(None)
+    handler.dispatch(resolve(make_packet(6)))
+    handler.dispatch(resolve(make_packet(2)))
+
+    assert handler.handled == [None, None, 2]
+    assert Handler.packet_ids() is None
+
+
+def test_handler_narrows_listener():
+    class Stop(Exception):
+        pass
+
+    class Handler(LapHandler):
+        def handle_LapData(self, packet):
+            super().handle_LapData(packet)
+            raise Stop
+
+    listener = PacketListener("127.0.0.1", 0, only={2, 6})
+    handler = Handler(listener)
+    send(listener, make_packet(6), make_packet(2))
+
+    with pytest.raises(Stop):
+        handler.handle()
+
+    assert listener.only == {2}
+    assert handler.handled == [2]
+
+
+def test_handler_subscriptions():
+    class Handler(LapHandler):
+        subscriptions = {"LapData", "CarTelemetryData"}
+
+        def handle_generic(self, packet):
+            self.handled.append(packet.header.packet_id)
+
+    class Unknown(PacketHandler):
+        subscriptions = {"Lap"}
+
+    listener = PacketListener("127.0.0.1", 0)
+    Handler(listener).subscribe()
+
+    assert listener.only == {2, 6}
+    with pytest.raises(ValueError):
+        Unknown.packet_ids()
+
+
+def test_handler_subscribes_pipeline():
+    listener = PacketListener("127.0.0.1", 0)
+    with PacketPipeline(listener) as pipeline:
+        LapHandler(pipeline).subscribe()
+        send(listener, make_packet(6), make_packet(2))
+
+        assert pipeline.get().header.packet_id == 2
+        assert listener.only == {2}
@@ -0,0 +1,51 @@
+from f1.handler import PacketHandler
+from f1.lazy import LazyPacket
+from f1.lazy import lazy_type
+from f1.packets import HEADER_FIELD_TO_PACKET_TYPE
+from f1.packets import PacketSessionHistoryData
+from f1.packets import resolve
+from test.utils import make_packet
+
+
+def test_lazy_packets_match_packets():
+    for (_, _, packet_id), packet_type in HEADER_FIELD_TO_PACKET_TYPE.items():
+        datagram = make_packet(packet_id)
+        packet = resolve(datagram, backend=lazy_type)
+
+        assert isinstance(packet, LazyPacket)
+        assert type(packet).__name__ == packet_type.__name__
+        assert packet.to_dict() == resolve(datagram).to_dict()
+        assert packet.pack() == datagram
+
+
+def test_lazy_packet_decodes_on_access():
+    datagram = make_packet(11)
+    packet = resolve(datagram, backend=lazy_type)
+    expected = PacketSessionHistoryData.unpack(datagram)
+
+    assert not packet.__dict__.keys() - {"_buffer", "_offset"}
+
+    lap = packet.lap_history_data[-1]
+    assert lap.lap_time_in_ms == expected.lap_history_data[99].lap_time_in_ms
+    assert set(packet.__dict__) == {"_buffer", "_offset", "lap_history_data"}
+    assert packet.lap_history_data._items.count(None) == 99
+
+
+def test_lazy_packet_handler():
+    class Handler(PacketHandler):
+        def handle_SessionHistoryData(self, packet):
+            self.car_idx = packet.car_idx
+
+    handler = Handler([resolve(make_packet(11), backend=lazy_type)])
+    handler.handle()
+
+    assert handler.car_idx == PacketSessionHistoryData.unpack(make_packet(11)).car_idx
+
+
+def test_lazy_packet_columns():
+    datagram = make_packet(6)
+
+    assert (
+        resolve(datagram, backend=lazy_type).columns("speed").tolist()
+        == resolve(datagram).columns("speed").tolist()
+    )
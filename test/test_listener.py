@@ -0,0 +1,113 @@
+import socket
+
+import pytest
+
+from f1.buffers import BufferPool
+from f1.lazy import lazy_type
+from f1.listener import PacketListener
+from f1.packets import PacketCarTelemetryData
+from f1.packets import PacketLapData
+from f1.structs import struct_type
+from test.utils import make_packet
+
+
+def send(listener, *datagrams):
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        for datagram in datagrams:
+            s.sendto(datagram, listener.socket.getsockname())
+
+
+def test_listener_zero_copy():
+    pool = BufferPool(size=1)
+    listener = PacketListener("127.0.0.1", 0, pool=pool)
+    datagram = make_packet(2)
+
+    send(listener, datagram)
+    packet = listener.get()
+
+    assert isinstance(packet, PacketLapData)
+    assert packet.pack() == datagram
+    assert len(pool) == 0
+
+    listener.release(packet)
+    listener.release(packet)
+
+    assert len(pool) == 1
+
+
+def test_listener_reuse():
+    listener = PacketListener("127.0.0.1", 0, reuse=True)
+
+    send(
+        listener, make_packet(2, frame_identifier=1), make_packet(2, frame_identifier=2)
+    )
+    first = listener.get()
+    kept = first.copy()
+    second = listener.get()
+
+    assert second is first
+    assert second.header.frame_identifier == 2
+    assert kept.header.frame_identifier == 1
+    assert kept.pack() == make_packet(2, frame_identifier=1)
+
+
+def test_listener_only():
+    listener = PacketListener("127.0.0.1", 0, only={6})
+
+    send(listener, make_packet(2), make_packet(6))
+
+    assert isinstance(listener.get(), PacketCarTelemetryData)
+
+
+def test_listener_zero_copy_lazy():
+    pool = BufferPool(size=1)
+    listener = PacketListener("127.0.0.1", 0, pool=pool, backend=lazy_type)
+    datagram = make_packet(2)
+
+    send(listener, datagram)
+    packet = listener.get()
+
+    assert packet.pack() == datagram
+    assert len(pool) == 0
+
+    kept = packet.copy()
+    listener.release(packet)
+
+    assert len(pool) == 1
+    assert kept.pack() == datagram
+    assert kept.to_dict() == packet.to_dict()
+
+
+def test_listener_zero_copy_struct():
+    pool = BufferPool(size=1)
+    listener = PacketListener("127.0.0.1", 0, pool=pool, backend=struct_type)
+
+    send(listener, make_packet(2))
+    packet = listener.get()
+
+    assert packet.copy() is packet
+    assert len(pool) == 1
+
+    listener.release(packet)
+
+    assert len(pool) == 1
+
+
+@pytest.mark.parametrize("pool", [None, BufferPool(size=4)])
+def test_listener_batch(pool):
+    listener = PacketListener("127.0.0.1", 0, pool=pool, only={2, 6})
+    datagrams = [make_packet(2), make_packet(3), make_packet(6), make_packet(2)]
+
+    send(listener, *datagrams)
+    packets = listener.get_batch(8)
+
+    assert [_.pack() for _ in packets] == [datagrams[0], datagrams[2], datagrams[3]]
+    for packet in packets:
+        listener.release(packet)
+
+
+def test_listener_batch_reuse():
+    listener = PacketListener("127.0.0.1", 0, reuse=True)
+
+    with pytest.raises(ValueError):
+        listener.get_batch()
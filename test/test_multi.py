@@ -0,0 +1,55 @@
+import socket
+
+from f1.handler import PacketHandler
+from f1.multi import MultiPacketListener
+from f1.packets import PacketCarTelemetryData
+from f1.packets import PacketLapData
+from test.utils import make_packet
+
+
+def sendto(port, *datagrams):
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        for datagram in datagrams:
+            s.sendto(datagram, ("127.0.0.1", port))
+        return s.getsockname()
+
+
+class RecordingHandler(PacketHandler):
+    def __init__(self, listener):
+        super().__init__(listener)
+        self.sources = []
+
+    def handle_LapData(self, packet):
+        self.sources.append((self.listener.source.port, packet.header.packet_id))
+
+
+def test_multi_listener():
+    with MultiPacketListener([("127.0.0.1", 0), ("127.0.0.1", 0)]) as listener:
+        first, second = listener.sockets
+
+        _, port = sendto(first, make_packet(2))
+        sendto(second, make_packet(6), make_packet(2)[:10])
+        packets = [listener.get(timeout=1) for _ in range(2)]
+
+        assert listener.get(timeout=0.01) is None
+        assert {_.port: type(_.packet) for _ in packets} == {
+            first: PacketLapData,
+            second: PacketCarTelemetryData,
+        }
+        (lap,) = (_ for _ in packets if _.port == first)
+        assert lap.address == ("127.0.0.1", port)
+        assert lap.session_uid == 0xF1
+
+
+def test_multi_listener_serve():
+    with MultiPacketListener([("127.0.0.1", 0)] * 3, only={2}) as listener:
+        first, second, third = listener.sockets
+        own, shared = RecordingHandler(listener), RecordingHandler(listener)
+
+        for port in (first, second, third, first):
+            sendto(port, make_packet(6), make_packet(2))
+        listener.serve({first: own}, default=shared, count=4)
+
+        assert own.sources == [(first, 2)] * 2
+        assert sorted(shared.sources) == sorted([(second, 2), (third, 2)])
+        assert listener.source is None
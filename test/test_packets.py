@@ -1,5 +1,79 @@
+import weakref
+
+import pytest
+
+from f1.packets import PacketCarTelemetryData
+from f1.packets import PacketParticipantsData
+from f1.packets import PacketSessionData
+from f1.packets import peek
+from f1.packets import resolve
 from test.utils import PickleListener
+from test.utils import make_packet
 
 
 def test_packet_unpacking():
     list(PickleListener())
+
+
+def test_packet_peek():
+    assert peek(make_packet(6, frame_identifier=42)) == (2025, 1, 6, 0xF1, 42)
+
+
+def test_packet_resolve_only():
+    assert isinstance(resolve(make_packet(6), only={6}), PacketCarTelemetryData)
+    assert resolve(make_packet(2), only={6}) is None
+
+
+def test_packet_resolve_unknown():
+    packet = bytearray(make_packet(6))
+    packet[0:2] = (1999).to_bytes(2, "little")
+
+    assert resolve(packet) is None
+
+
+def test_packet_resolve_truncated():
+    packet = make_packet(6)
+
+    assert resolve(packet[:4]) is None
+    assert resolve(packet[:-1]) is None
+
+
+def test_packet_columns():
+    packet = PacketCarTelemetryData.unpack(make_packet(6))
+    cars = packet.car_telemetry_data
+
+    assert packet.columns("speed").tolist() == [_.speed for _ in cars]
+    assert packet.columns("tyres_pressure").tolist() == [
+        list(_.tyres_pressure) for _ in cars
+    ]
+
+
+def test_packet_columns_qualified():
+    packet = PacketSessionData.unpack(make_packet(1))
+
+    assert packet.columns("weather_forecast_samples.weather").tolist() == [
+        _.weather for _ in packet.weather_forecast_samples
+    ]
+    with pytest.raises(AttributeError):
+        packet.columns("marshal_zones.weather")
+
+
+def test_packet_columns_structures():
+    packet = PacketParticipantsData.unpack(make_packet(4))
+
+    with pytest.raises(TypeError):
+        packet.columns("participants.livery_colours")
+
+
+def test_packet_unpack_into():
+    packet = PacketCarTelemetryData()
+    packet.unpack_into(make_packet(6))
+
+    assert packet.pack() == make_packet(6)
+    with pytest.raises(ValueError):
+        packet.unpack_into(make_packet(6)[:-1])
+
+    # Freed without the cycle collector
+    ref = weakref.ref(packet)
+    del packet
+    assert ref() is None
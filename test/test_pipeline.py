@@ -0,0 +1,56 @@
+import time
+
+import pytest
+
+from f1.listener import PacketListener
+from f1.packets import PacketCarTelemetryData
+from f1.pipeline import DROP_NEWEST
+from f1.pipeline import DROP_OLDEST
+from f1.pipeline import DROP_PRIORITY
+from f1.pipeline import PacketPipeline
+from test.test_listener import send
+from test.utils import make_packet
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_pipeline():
+    listener = PacketListener("127.0.0.1", 0, only={6})
+
+    with PacketPipeline(listener) as pipeline:
+        send(listener, make_packet(2), make_packet(6))
+
+        assert isinstance(pipeline.get(), PacketCarTelemetryData)
+
+
+@pytest.mark.parametrize(
+    "drop, priorities, kept, dropped",
+    [
+        (DROP_OLDEST, None, [(6, 2), (3, 3)], {6: 2}),
+        (DROP_NEWEST, None, [(6, 0), (6, 1)], {6: 1, 3: 1}),
+        (DROP_PRIORITY, {6: 1}, [(6, 1), (6, 2)], {6: 1, 3: 1}),
+        (DROP_PRIORITY, {3: 1}, [(6, 2), (3, 3)], {6: 2}),
+    ],
+)
+def test_pipeline_drop(drop, priorities, kept, dropped):
+    listener = PacketListener("127.0.0.1", 0)
+    datagrams = [
+        make_packet(6, frame_identifier=0),
+        make_packet(6, frame_identifier=1),
+        make_packet(6, frame_identifier=2),
+        make_packet(3, frame_identifier=3),
+    ]
+
+    with PacketPipeline(listener, 2, drop, priorities) as pipeline:
+        send(listener, *datagrams)
+        wait_for(lambda: len(pipeline) + sum(pipeline.dropped.values()) == 4)
+
+        packets = [pipeline.get(), pipeline.get()]
+
+    assert [(_.header.packet_id, _.header.frame_identifier) for _ in packets] == kept
+    assert pipeline.dropped == dropped
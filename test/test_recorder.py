@@ -0,0 +1,76 @@
+import threading
+import time
+
+from f1.listener import PacketListener
+from f1.packets import PacketLapData
+from f1.recorder import MAGIC
+from f1.recorder import RECORD
+from f1.recorder import PacketRecorder
+from f1.recorder import files
+from f1.recorder import read
+from test.test_listener import send
+from test.utils import CaptureListener
+from test.utils import make_packet
+
+
+def test_recorder(tmp_path):
+    now = [100.0]
+    datagrams = [make_packet(_ % 4, frame_identifier=_) for _ in range(6)]
+    with PacketRecorder(tmp_path, max_bytes=3000, clock=lambda: now[0]) as recorder:
+        for datagram in datagrams:
+            recorder.write(datagram, ("127.0.0.1", 20777))
+            now[0] += 1
+
+    records = list(read(tmp_path))
+
+    assert len(files(tmp_path)) > 1
+    assert [_.datagram for _ in records] == datagrams
+    assert [_.timestamp for _ in records] == [100.0 + _ for _ in range(6)]
+    assert {_.address for _ in records} == {("127.0.0.1", 20777)}
+
+
+def test_recorder_truncated(tmp_path):
+    with PacketRecorder(tmp_path) as recorder:
+        recorder.write(make_packet(2))
+        recorder.write(make_packet(6))
+    (path,) = files(tmp_path)
+    path.write_bytes(path.read_bytes()[:-10])
+
+    assert [type(_) for _ in CaptureListener(tmp_path)] == [PacketLapData]
+
+
+def test_recorder_listener(tmp_path):
+    listener = PacketListener("127.0.0.1", 0)
+    send(listener, make_packet(2), b"garbage")
+
+    with PacketRecorder(tmp_path) as recorder:
+        recorder.record(listener, count=2)
+
+    records = list(read(tmp_path))
+    assert [_.datagram for _ in records] == [make_packet(2), b"garbage"]
+    assert records[0].address[0] == "127.0.0.1"
+
+
+def test_recorder_idle_sync(tmp_path):
+    listener = PacketListener("127.0.0.1", 0)
+    datagrams = [make_packet(6, frame_identifier=_) for _ in range(50)]
+
+    with PacketRecorder(tmp_path, fsync_interval=0.1) as recorder:
+        thread = threading.Thread(
+            target=recorder.record, args=(listener, 51), daemon=True
+        )
+        thread.start()
+        send(listener, *datagrams)
+        time.sleep(0.5)
+
+        # Synced while idle, without waiting for the next datagram
+        (path,) = files(tmp_path)
+        assert path.stat().st_size == len(MAGIC) + 50 * (
+            RECORD.size + len(datagrams[0])
+        )
+
+        send(listener, make_packet(2))
+        thread.join()
+
+    assert listener.socket.gettimeout() is None
+    assert len(list(read(tmp_path))) == 51
@@ -0,0 +1,48 @@
+import socket
+
+from f1.listener import PacketListener
+from f1.relay import Destination
+from f1.relay import PacketRelay
+from test.test_listener import send
+from test.utils import make_packet
+
+
+def receiver():
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    s.bind(("127.0.0.1", 0))
+    s.settimeout(1)
+    return s
+
+
+def test_relay():
+    now = [0.0]
+    all_packets, telemetry = receiver(), receiver()
+    listener = PacketListener("127.0.0.1", 0)
+    relay = PacketRelay(
+        listener,
+        [
+            Destination(all_packets.getsockname()),
+            Destination(telemetry.getsockname(), only={6}, rate=10),
+        ],
+        clock=lambda: now[0],
+    )
+    datagrams = [make_packet(6, frame_identifier=_) for _ in range(3)]
+
+    for now[0], datagram in zip((0.0, 0.05, 0.1), datagrams):
+        relay.forward(datagram)
+    relay.forward(make_packet(2))
+
+    assert [all_packets.recv(2048) for _ in range(4)] == datagrams + [make_packet(2)]
+    assert [telemetry.recv(2048) for _ in range(2)] == [datagrams[0], datagrams[2]]
+    assert relay.destinations[1].skipped == 1
+
+
+def test_relay_run():
+    destination = receiver()
+    listener = PacketListener("127.0.0.1", 0)
+    relay = PacketRelay(listener, [Destination(destination.getsockname())])
+
+    send(listener, make_packet(6))
+    relay.run(count=1)
+
+    assert destination.recv(2048) == make_packet(6)
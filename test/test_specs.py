@@ -0,0 +1,45 @@
+import pickle
+import subprocess
+import sys
+
+from f1 import specs
+from f1.packets import resolve
+from test.utils import make_packet
+
+
+def test_specs_loaded_on_first_packet():
+    # The datagram is made here, as making it loads the spec
+    code = (
+        "import sys\n"
+        "from f1.listener import PacketListener\n"
+        "from f1.packets import resolve\n"
+        "assert 'f1.specs.f1_2025' not in sys.modules\n"
+        f"assert resolve(bytes.fromhex('{make_packet(2).hex()}')) is not None\n"
+        "spec = sys.modules['f1.specs.f1_2025']\n"
+        "assert 'PacketLapData' in vars(spec)\n"
+        "assert 'PacketMotionData' not in vars(spec)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_specs_unsupported_format():
+    packet = bytearray(make_packet(6))
+    packet[0:2] = (1998).to_bytes(2, "little")
+
+    assert resolve(packet) is None
+    assert specs.SPECS[1998] is None
+    assert resolve(packet) is None
+
+
+def test_specs_reexports():
+    from f1.packets import PacketLapData
+    from f1.specs.f1_2025 import PacketLapData as SpecPacketLapData
+
+    assert PacketLapData is SpecPacketLapData
+
+
+def test_specs_lazy_types_pickle():
+    packet = resolve(make_packet(2))
+
+    assert type(packet).__qualname__ == "PacketLapData"
+    assert pickle.loads(pickle.dumps(packet)).pack() == packet.pack()
@@ -0,0 +1,65 @@
+import pytest
+
+from f1.lazy import lazy_type
+from f1.packets import resolve
+from f1.state import SessionStateHandler
+from f1.structs import struct_type
+from test.utils import make_packet
+
+
+@pytest.mark.parametrize("backend", [None, lazy_type, struct_type])
+def test_session_state(backend):
+    handler = SessionStateHandler(None)
+    packets = {_: resolve(make_packet(_), backend=backend) for _ in (1, 2, 4, 7, 10)}
+
+    for packet_id in (2, 7, 10, 4, 1, 2):
+        handler.dispatch(packets[packet_id])
+    snapshot = handler.state.snapshot()
+
+    lap = packets[2].lap_data[3]
+    participant = packets[4].participants[3]
+    car = snapshot["cars"][3]
+    assert snapshot["versions"] == {
+        "lap": 2,
+        "status": 1,
+        "damage": 1,
+        "participants": 1,
+        "session": 1,
+    }
+    assert snapshot["session_uid"] == 0xF1
+    assert snapshot["num_active_cars"] == packets[4].num_active_cars
+    assert snapshot["session"]["track_id"] == packets[1].track_id
+    assert car["car_position"] == lap.car_position
+    assert car["tyres_wear"] == tuple(packets[10].car_damage_data[3].tyres_wear)
+    assert car["fuel_in_tank"] == packets[7].car_status_data[3].fuel_in_tank
+    assert car["name"] == participant.name.decode()
+
+    # Snapshots are copies
+    car["car_position"] = None
+    assert handler.state.cars[3].car_position == lap.car_position
+    assert SessionStateHandler.packet_ids() == {1, 2, 4, 7, 10}
+
+
+def test_session_state_new_session():
+    handler = SessionStateHandler(None)
+    for packet_id in (1, 2, 4):
+        handler.dispatch(resolve(make_packet(packet_id)))
+
+    packet = resolve(make_packet(7))
+    packet.header.session_uid = 0xF2
+    handler.dispatch(packet)
+    snapshot = handler.state.snapshot()
+
+    assert snapshot["session_uid"] == 0xF2
+    assert snapshot["versions"] == {
+        "lap": 2,
+        "status": 2,
+        "damage": 1,
+        "participants": 2,
+        "session": 2,
+    }
+    assert snapshot["num_active_cars"] == 0
+    assert set(snapshot["session"].values()) == {None}
+    assert snapshot["cars"][3]["car_position"] is None
+    assert snapshot["cars"][3]["name"] is None
+    assert snapshot["cars"][3]["fuel_in_tank"] == packet.car_status_data[3].fuel_in_tank
@@ -0,0 +1,69 @@
+import struct
+
+from f1.listener import PacketListener
+from f1.recorder import PacketRecorder
+from f1.relay import PacketRelay
+from f1.stats import PacketStats
+from test.test_listener import send
+from test.utils import make_packet
+
+
+def packet(packet_id, frame, session_time=0.0):
+    datagram = bytearray(make_packet(packet_id))
+    struct.pack_into("<f4xI", datagram, 15, session_time, frame)
+    return datagram
+
+
+def test_stats_sequence():
+    stats = PacketStats()
+
+    for frame in (1, 2, 5, 3, 5, 6):
+        stats.update(packet(6, frame))
+    stats.update(packet(2, 1))
+
+    assert stats.streams[0xF1, 6].to_dict() == {
+        "received": 6,
+        "lost": 1,
+        "duplicates": 1,
+        "out_of_order": 1,
+        "last_frame": 6,
+    }
+    assert stats.streams[0xF1, 2].received == 1
+
+
+def test_stats_lateness():
+    now = [10.0]
+    stats = PacketStats(clock=lambda: now[0])
+
+    for now[0], session_time in ((10.0, 1.0), (10.5, 1.5), (11.25, 2.0)):
+        stats.update(packet(6, 0, session_time))
+
+    assert stats.sessions[0xF1].lateness == 0.25
+    assert stats.sessions[0xF1].max_lateness == 0.25
+
+
+def test_listener_stats():
+    listener = PacketListener("127.0.0.1", 0, only={6}, stats=PacketStats())
+    listener_rcvbuf = PacketListener("127.0.0.1", 0, rcvbuf=1 << 16)
+
+    send(listener, make_packet(2), make_packet(6))
+    listener.get()
+
+    assert listener.stats.streams[0xF1, 2].received == 1
+    assert listener.stats.streams[0xF1, 6].received == 1
+    assert listener_rcvbuf.rcvbuf >= 1 << 16
+    assert listener.kernel_drops() in (0, None)
+
+
+def test_stats_raw_loops(tmp_path):
+    listener = PacketListener("127.0.0.1", 0, only={6}, stats=PacketStats())
+    relay = PacketRelay(listener, [])
+
+    send(listener, make_packet(2), make_packet(6))
+    relay.run(count=2)
+    with PacketRecorder(tmp_path) as recorder:
+        send(listener, make_packet(6))
+        recorder.record(listener, count=1)
+
+    assert listener.stats.streams[0xF1, 2].received == 1
+    assert listener.stats.streams[0xF1, 6].received == 2
@@ -0,0 +1,42 @@
+from f1.handler import PacketHandler
+from f1.packets import HEADER_FIELD_TO_PACKET_TYPE
+from f1.packets import PacketEventData
+from f1.packets import resolve
+from f1.structs import Record
+from f1.structs import struct_type
+from test.utils import make_packet
+
+
+def test_struct_records_match_packets():
+    for (_, _, packet_id), packet_type in HEADER_FIELD_TO_PACKET_TYPE.items():
+        datagram = make_packet(packet_id)
+        record = resolve(datagram, backend=struct_type)
+
+        assert isinstance(record, Record)
+        assert type(record).__name__ == packet_type.__name__
+        assert record.size() == packet_type.size()
+        assert record.to_dict() == resolve(datagram).to_dict()
+
+
+def test_struct_record_union():
+    datagram = make_packet(3)
+    record = resolve(datagram, backend=struct_type)
+    packet = PacketEventData.unpack(datagram)
+
+    assert (
+        record.event_details.speed_trap.speed == packet.event_details.speed_trap.speed
+    )
+    assert (
+        record.event_details.penalty.to_dict() == packet.event_details.penalty.to_dict()
+    )
+
+
+def test_struct_record_handler():
+    class Handler(PacketHandler):
+        def handle_CarTelemetryData(self, packet):
+            self.speed = packet.car_telemetry_data[3].speed
+
+    handler = Handler([resolve(make_packet(6), backend=struct_type)])
+    handler.handle()
+
+    assert handler.speed == resolve(make_packet(6)).car_telemetry_data[3].speed
@@ -0,0 +1,84 @@
+import os
+import threading
+
+from f1.handler import PacketHandler
+from f1.listener import PacketListener
+from f1.workers import PacketWorkers
+from f1.workers import by_session
+from f1.workers import by_packet_id
+from test.test_listener import send
+from test.utils import make_packet
+
+
+class RecordingHandler(PacketHandler):
+    """Records the packets handled by every worker process to a file"""
+
+    def handle_generic(self, packet):
+        with open(os.environ["F1_TEST_WORKERS"], "a") as f:
+            f.write(
+                f"{os.getpid()} {packet.header.packet_id} "
+                f"{packet.header.frame_identifier}\n"
+            )
+
+
+def run(tmp_path, monkeypatch, shard, datagrams):
+    path = tmp_path / "handled"
+    monkeypatch.setenv("F1_TEST_WORKERS", str(path))
+
+    with PacketWorkers(None, RecordingHandler, workers=2, shard=shard) as workers:
+        for datagram in datagrams:
+            workers.dispatch(datagram)
+
+    return [tuple(map(int, _.split())) for _ in path.read_text().splitlines()]
+
+
+def test_workers_by_packet_id(tmp_path, monkeypatch):
+    datagrams = [make_packet(_ % 4, frame_identifier=_) for _ in range(40)]
+
+    handled = run(tmp_path, monkeypatch, by_packet_id, datagrams)
+
+    assert len(handled) == 40
+    for packet_id in range(4):
+        pids = {pid for pid, _id, _ in handled if _id == packet_id}
+        frames = [frame for _, _id, frame in handled if _id == packet_id]
+
+        assert len(pids) == 1
+        assert frames == list(range(packet_id, 40, 4))
+    assert len({pid for pid, _, _ in handled}) == 2
+
+
+def test_workers_by_session(tmp_path, monkeypatch):
+    datagrams = [make_packet(_ % 4, frame_identifier=_) for _ in range(10)]
+
+    handled = run(tmp_path, monkeypatch, by_session, datagrams)
+
+    # All the packets come from the same car of the same session
+    assert len({pid for pid, _, _ in handled}) == 1
+    assert [frame for _, _, frame in handled] == list(range(10))
+
+
+def test_workers_subscriptions():
+    class Handler(PacketHandler):
+        subscriptions = {"LapData"}
+
+    workers = PacketWorkers(None, Handler, workers=1)
+    workers.dispatch(make_packet(6))
+    workers.dispatch(make_packet(2))
+
+    assert workers.only == {2}
+    assert workers.rings[0].get() == make_packet(2)
+    workers.rings[0].close(unlink=True)
+
+
+def test_workers_run_timeout():
+    listener = PacketListener("127.0.0.1", 0)
+    listener.socket.settimeout(0.01)
+    workers = PacketWorkers(listener, RecordingHandler, workers=1)
+    timer = threading.Timer(0.1, send, (listener, make_packet(2)))
+    timer.start()
+
+    workers.run(count=1)
+    timer.join()
+
+    assert workers.rings[0].get() == make_packet(2)
+    workers.rings[0].close(unlink=True)
@@ -1,6 +1,8 @@
 import pickle
 from pathlib import Path
 
+from f1 import recorder
+from f1.packets import HEADER_FIELD_TO_PACKET_TYPE
 from f1.packets import resolve
 
 
@@ -11,3 +13,36 @@ class PickleListener:
 
     def __iter__(self):
         yield from (resolve(_) for packets in self.packets.values() for _ in packets)
+
+
+class CaptureListener:
+    """Streams the packets of a capture, as recorded by ``PacketRecorder``"""
+
+    def __init__(self, path=Path(__file__).parent / "packets"):
+        self.path = path
+
+    def __iter__(self):
+        for record in recorder.read(self.path):
+            packet = resolve(record.datagram)
+            if packet is not None:
+                yield packet
+
+
+def make_packet(packet_id: int, frame_identifier: int = 0) -> bytes:
+    """Make a synthetic datagram for the given packet id.
+
+    The payload is filled with a repeating pattern of printable bytes so that
+    every field, strings included, decodes to something meaningful.
+    """
+    (key, packet_type), *_ = (
+        (k, v) for k, v in HEADER_FIELD_TO_PACKET_TYPE.items() if k[2] == packet_id
+    )
+    packet = packet_type.unpack(bytes(48 + i % 64 for i in range(packet_type.size())))
+
+    header = packet.header
+    header.packet_format, header.packet_version, header.packet_id = key
+    header.session_uid = 0xF1
+    header.frame_identifier = frame_identifier
+    header.overall_frame_identifier = frame_identifier
+
+    return packet.pack()